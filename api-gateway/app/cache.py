@@ -0,0 +1,143 @@
+"""
+게이트웨이 응답 캐시
+멱등 GET 응답을 prefix별 TTL 동안 프로세스 메모리에 보관 (메모리 상한 LRU)
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode
+from starlette.requests import Request
+from starlette.responses import Response
+from .config import CACHE_MAX_BYTES, CACHE_MAX_ENTRY_BYTES
+
+CacheKey = Tuple[str, str, str, str]
+
+# 캐시에 저장하지 않는 응답 헤더 (응답마다 다시 계산되거나 사용자별 값)
+_SKIPPED_HEADERS = {"content-length", "date", "server", "etag"}
+
+
+def auth_scope(request: Request) -> str:
+    """
+    캐시 키의 인증 범위
+    Authorization 헤더별로 분리하여 사용자별 응답이 섞이지 않도록 함 (없으면 public)
+    """
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return "public"
+    return hashlib.sha256(authorization.encode()).hexdigest()[:32]
+
+
+def cache_key(request: Request) -> CacheKey:
+    """메서드, 경로, 정렬된 쿼리, 인증 범위로 캐시 키 생성"""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return (request.method, request.url.path, query, auth_scope(request))
+
+
+class CachedResponse:
+    """캐시된 응답 스냅샷 (여러 요청에 재사용 가능)"""
+
+    __slots__ = ("status_code", "headers", "body", "etag", "upstream_etag", "expires_at", "size")
+
+    def __init__(self, status_code: int, headers: Dict[str, str], body: bytes, upstream_etag: Optional[str], ttl: float):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.upstream_etag = upstream_etag
+        # 업스트림 ETag가 없으면 본문 해시로 약한 ETag 생성 (클라이언트 If-None-Match 용)
+        self.etag = upstream_etag or 'W/"%s"' % hashlib.sha1(body).hexdigest()
+        self.expires_at = time.monotonic() + ttl
+        self.size = len(body) + sum(len(k) + len(v) for k, v in headers.items())
+
+    @classmethod
+    def from_response(cls, response: Response, ttl: float) -> "CachedResponse":
+        headers = {}
+        upstream_etag = None
+        for key, value in response.headers.items():
+            if key == "etag":
+                upstream_etag = value
+            elif key not in _SKIPPED_HEADERS:
+                headers[key] = value
+        return cls(response.status_code, headers, response.body, upstream_etag, ttl)
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def refresh(self, ttl: float) -> None:
+        self.expires_at = time.monotonic() + ttl
+
+    def to_response(self, request: Request, cache_status: str) -> Response:
+        """요청별 응답 생성 (If-None-Match가 일치하면 304)"""
+        headers = {"ETag": self.etag, "X-Cache": cache_status}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self.etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, status_code=self.status_code, headers={**self.headers, **headers})
+
+
+def is_cacheable(response: Response) -> bool:
+    """200 응답 중 사용자 상태를 바꾸거나 캐시 금지된 응답 제외"""
+    if response.status_code != 200:
+        return False
+    if "set-cookie" in response.headers:
+        return False
+    cache_control = response.headers.get("cache-control", "").lower()
+    if "no-store" in cache_control or "private" in cache_control:
+        return False
+    return len(response.body) <= CACHE_MAX_ENTRY_BYTES
+
+
+class ResponseCache:
+    """메모리 상한 LRU 응답 캐시"""
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """만료 여부와 관계없이 항목 조회 (만료 항목은 재검증에 사용)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: CacheKey, entry: CachedResponse) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """경로 prefix 아래 항목 삭제 (쓰기 요청 후 호출)"""
+        keys = [key for key in self._entries if key[1] == prefix or key[1].startswith(prefix + "/")]
+        for key in keys:
+            self._bytes -= self._entries.pop(key).size
+        return len(keys)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evictions": self.evictions,
+            "hitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,149 @@
+"""
+업스트림 서비스별 서킷 브레이커
+서비스 장애 시 연결 오류/타임아웃을 매번 기다리지 않고 즉시 실패(fast-fail) 처리
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, List
+from .config import (
+    SERVICE_URLS,
+    CIRCUIT_FAILURE_RATE,
+    CIRCUIT_MIN_REQUESTS,
+    CIRCUIT_WINDOW_SECONDS,
+    CIRCUIT_COOLDOWN_SECONDS,
+    CIRCUIT_HALF_OPEN_MAX_CALLS,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    실패율 기반 서킷 브레이커
+
+    - closed: 모든 요청 허용, 초 단위 버킷으로 최근 성공/실패 집계
+    - open: 모든 요청 즉시 거부, cooldown 경과 후 half-open으로 전환
+    - half_open: 제한된 수의 시험 요청만 허용, 성공 시 closed / 실패 시 다시 open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = CIRCUIT_FAILURE_RATE,
+        minimum_requests: int = CIRCUIT_MIN_REQUESTS,
+        window_seconds: int = CIRCUIT_WINDOW_SECONDS,
+        cooldown_seconds: float = CIRCUIT_COOLDOWN_SECONDS,
+        half_open_max_calls: int = CIRCUIT_HALF_OPEN_MAX_CALLS,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_requests = minimum_requests
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.rejected = 0
+        # [초, 성공 수, 실패 수] 버킷
+        self._buckets: Deque[List[int]] = deque()
+        self._half_open_calls = 0
+        self._probe_started_at = 0.0
+
+    def allow_request(self) -> bool:
+        """요청을 업스트림으로 보내도 되는지 확인"""
+        if self.state == CLOSED:
+            return True
+
+        now = time.monotonic()
+        if self.state == OPEN:
+            if now - self.opened_at < self.cooldown_seconds:
+                self.rejected += 1
+                return False
+            self.state = HALF_OPEN
+            self._half_open_calls = 0
+
+        # half-open: 시험 요청 수 제한 (응답 없이 끊긴 시험 요청은 cooldown 후 재시도 허용)
+        if self._half_open_calls < self.half_open_max_calls or now - self._probe_started_at >= self.cooldown_seconds:
+            self._half_open_calls += 1
+            self._probe_started_at = now
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        if self.state == HALF_OPEN:
+            self._close()
+            return
+        self._record(success=True)
+
+    def record_failure(self) -> None:
+        if self.state == HALF_OPEN:
+            self._open()
+            return
+        self._record(success=False)
+        if self.state == CLOSED:
+            requests, failures = self._totals()
+            if requests >= self.minimum_requests and failures / requests >= self.failure_rate_threshold:
+                self._open()
+
+    def _record(self, success: bool) -> None:
+        second = int(time.monotonic())
+        self._prune(second)
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        self._buckets[-1][1 if success else 2] += 1
+
+    def _prune(self, second: int) -> None:
+        while self._buckets and self._buckets[0][0] <= second - self.window_seconds:
+            self._buckets.popleft()
+
+    def _totals(self):
+        self._prune(int(time.monotonic()))
+        successes = sum(bucket[1] for bucket in self._buckets)
+        failures = sum(bucket[2] for bucket in self._buckets)
+        return successes + failures, failures
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self._half_open_calls = 0
+
+    def _close(self) -> None:
+        self.state = CLOSED
+        self._buckets.clear()
+        self._half_open_calls = 0
+
+    def snapshot(self) -> dict:
+        """헬스 체크용 상태 정보"""
+        requests, failures = self._totals()
+        data = {
+            "state": self.state,
+            "requests": requests,
+            "failures": failures,
+            "failureRate": round(failures / requests, 3) if requests else 0.0,
+            "rejected": self.rejected,
+        }
+        if self.state == OPEN:
+            remaining = self.cooldown_seconds - (time.monotonic() - self.opened_at)
+            data["retryIn"] = round(max(0.0, remaining), 1)
+        return data
+
+
+_breakers: Dict[str, CircuitBreaker] = {name: CircuitBreaker(name) for name in SERVICE_URLS}
+
+
+def get_breaker(service_name: str) -> CircuitBreaker:
+    """서비스 서킷 브레이커 조회"""
+    breaker = _breakers.get(service_name)
+    if breaker is None:
+        breaker = _breakers[service_name] = CircuitBreaker(service_name)
+    return breaker
+
+
+def circuit_states() -> Dict[str, dict]:
+    """모든 서비스의 서킷 상태"""
+    return {name: breaker.snapshot() for name, breaker in _breakers.items()}
@@ -0,0 +1,61 @@
+"""
+업스트림 서비스 HTTP 클라이언트
+서비스별로 하나의 httpx.AsyncClient를 앱 수명 동안 유지하여 커넥션을 재사용
+"""
+
+import httpx
+from typing import Dict
+from .config import (
+    SERVICE_URLS,
+    SERVICE_TIMEOUTS,
+    DEFAULT_SERVICE_TIMEOUT,
+    UPSTREAM_MAX_CONNECTIONS,
+    UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+    UPSTREAM_KEEPALIVE_EXPIRY,
+    UPSTREAM_HTTP2,
+    UPSTREAM_CONNECT_TIMEOUT,
+)
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _create_client(service_name: str) -> httpx.AsyncClient:
+    """서비스 전용 클라이언트 생성 (keep-alive 풀, 서비스별 타임아웃)"""
+    timeout = SERVICE_TIMEOUTS.get(service_name, DEFAULT_SERVICE_TIMEOUT)
+    return httpx.AsyncClient(
+        base_url=SERVICE_URLS[service_name],
+        timeout=httpx.Timeout(timeout, connect=min(UPSTREAM_CONNECT_TIMEOUT, timeout)),
+        limits=httpx.Limits(
+            max_connections=UPSTREAM_MAX_CONNECTIONS,
+            max_keepalive_connections=UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=UPSTREAM_KEEPALIVE_EXPIRY,
+        ),
+        http2=UPSTREAM_HTTP2,
+    )
+
+
+def init_clients() -> None:
+    """앱 시작 시 모든 서비스 클라이언트 생성"""
+    for service_name in SERVICE_URLS:
+        if service_name not in _clients:
+            _clients[service_name] = _create_client(service_name)
+
+
+async def close_clients() -> None:
+    """앱 종료 시 모든 클라이언트의 커넥션 정리"""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+def get_client(service_name: str) -> httpx.AsyncClient:
+    """
+    서비스 클라이언트 조회
+
+    lifespan 밖에서 호출되는 경우(스크립트 등)를 위해 없으면 생성
+    """
+    client = _clients.get(service_name)
+    if client is None:
+        client = _clients[service_name] = _create_client(service_name)
+    return client
@@ -3,7 +3,7 @@ API Gateway 설정
 """
 
 import os
-from typing import Dict
+from typing import Dict, List
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -24,6 +24,69 @@ SERVICE_URLS: Dict[str, str] = {
     "nextjs": os.getenv("NEXTJS_API_URL", "http://localhost:3000"),
 }
 
+# 프록시 라우팅 테이블 (경로 prefix → 서비스 이름)
+# prefix 자체와 그 하위 경로가 모두 같은 경로로 해당 서비스에 전달됨
+SERVICE_ROUTES: Dict[str, str] = {
+    "/api/auth": "auth",
+    "/api/jobs": "job",
+    "/api/applications": "job",
+    "/api/schedules": "schedule",
+    "/api/work-check": "schedule",
+    "/api/chats": "chat",
+    "/api/messages": "chat",
+    "/api/energy": "energy",
+    "/api/store/products": "store",
+    "/api/store/categories": "store",
+    "/api/store/cart": "cart",
+    "/api/store/orders": "order",
+    "/api/payments": "payment",
+}
+
+# 라우팅 테이블을 거치지 않고 개별 핸들러가 처리하는 경로와 메서드 (mock 등)
+# 나열하지 않은 메서드는 그대로 라우팅 테이블로 서비스에 전달
+ROUTE_PASSTHROUGH_PATHS: Dict[str, List[str]] = {"/api/auth/login": ["POST"]}
+
+# 게이트웨이 응답 캐시 - 멱등 GET 응답을 prefix별 TTL(초) 동안 보관 (0이면 캐시 안 함)
+CACHE_TTLS: Dict[str, float] = {
+    "/api/jobs": float(os.getenv("CACHE_TTL_JOBS", "10")),
+    "/api/store/products": float(os.getenv("CACHE_TTL_STORE_PRODUCTS", "60")),
+    "/api/store/categories": float(os.getenv("CACHE_TTL_STORE_CATEGORIES", "300")),
+}
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+CACHE_MAX_ENTRY_BYTES = int(os.getenv("CACHE_MAX_ENTRY_BYTES", str(1024 * 1024)))
+
+# 업스트림 HTTP 클라이언트 설정 (서비스별 장기 유지 커넥션 풀)
+UPSTREAM_MAX_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_CONNECTIONS", "100"))
+UPSTREAM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+UPSTREAM_KEEPALIVE_EXPIRY = float(os.getenv("UPSTREAM_KEEPALIVE_EXPIRY", "30.0"))
+UPSTREAM_HTTP2 = os.getenv("UPSTREAM_HTTP2", "false").lower() == "true"
+UPSTREAM_CONNECT_TIMEOUT = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT", "3.0"))
+
+# 서비스별 응답 타임아웃 (초) - <SERVICE>_SERVICE_TIMEOUT 환경변수로 개별 조정
+DEFAULT_SERVICE_TIMEOUT = float(os.getenv("DEFAULT_SERVICE_TIMEOUT", "30.0"))
+SERVICE_TIMEOUTS: Dict[str, float] = {
+    name: float(os.getenv(f"{name.upper()}_SERVICE_TIMEOUT", str(DEFAULT_SERVICE_TIMEOUT)))
+    for name in SERVICE_URLS
+}
+
+# 서킷 브레이커 설정 (서비스별)
+# 최근 CIRCUIT_WINDOW_SECONDS 동안 요청이 CIRCUIT_MIN_REQUESTS 이상이고 실패율이 임계값 이상이면 차단(open)
+# 차단 후 CIRCUIT_COOLDOWN_SECONDS가 지나면 시험 요청(half-open)으로 복구 여부 확인
+CIRCUIT_FAILURE_RATE = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_MIN_REQUESTS = int(os.getenv("CIRCUIT_MIN_REQUESTS", "5"))
+CIRCUIT_WINDOW_SECONDS = int(os.getenv("CIRCUIT_WINDOW_SECONDS", "30"))
+CIRCUIT_COOLDOWN_SECONDS = float(os.getenv("CIRCUIT_COOLDOWN_SECONDS", "15.0"))
+CIRCUIT_HALF_OPEN_MAX_CALLS = int(os.getenv("CIRCUIT_HALF_OPEN_MAX_CALLS", "1"))
+
+# 프록시 스트리밍 모드 (요청/응답 본문을 메모리에 버퍼링하지 않고 전달)
+PROXY_STREAMING = os.getenv("PROXY_STREAMING", "false").lower() == "true"
+
+# 같은 경로/쿼리/인증 범위의 동시 GET을 업스트림 요청 하나로 합침 (합쳐진 요청은 버퍼링 모드로 전달)
+PROXY_COALESCE_GETS = os.getenv("PROXY_COALESCE_GETS", "true").lower() == "true"
+
+# 배치 요청(/api/batch) 하나에 담을 수 있는 최대 하위 요청 수
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "10"))
+
 # API Gateway 포트
 GATEWAY_PORT = int(os.getenv("GATEWAY_PORT", "8000"))
 
@@ -36,5 +99,21 @@ CORS_ORIGINS = os.getenv(
 # localhost 모든 포트 허용용 정규식 (Flutter web 등)
 CORS_ORIGIN_REGEX = r"http://(localhost|127\.0\.0\.1)(:\d+)?"
 
+# preflight 응답 캐시 시간(초) - 브라우저가 이 시간 동안 같은 요청의 preflight를 다시 보내지 않음
+CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "86400"))
+
 # JWT 시크릿 키 (토큰 검증용)
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
+
+# 처리 시간이 이 값(ms) 이상인 요청은 로그 출력 (0이면 출력 안 함)
+SLOW_REQUEST_LOG_MS = float(os.getenv("SLOW_REQUEST_LOG_MS", "1000"))
+
+# 게이트웨이 인증 모드
+# - off: 토큰 검증 안 함 (서비스가 각자 검증)
+# - verify: 토큰이 있으면 검증 후 클레임을 내부 헤더로 전달, 없거나 유효하지 않으면 그대로 전달
+# - enforce: 공개 경로 외에는 유효한 토큰이 없으면 게이트웨이에서 401 반환
+GATEWAY_AUTH_MODE = os.getenv("GATEWAY_AUTH_MODE", "verify").lower()
+
+# 검증된 토큰 캐시 (토큰 해시 → 페이로드, exp 또는 TTL 중 빠른 시점까지 유지)
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+AUTH_TOKEN_CACHE_TTL = float(os.getenv("AUTH_TOKEN_CACHE_TTL", "300"))
@@ -2,10 +2,12 @@
 API Gateway 메인 애플리케이션
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
-from .middleware import setup_cors, AuthenticationMiddleware
-from .routes import proxy
+from .middleware import setup_cors, AuthenticationMiddleware, RequestContextMiddleware
+from .routes import proxy, batch
+from .clients import init_clients, close_clients
 from .config import GATEWAY_PORT
 import sys
 import os
@@ -20,26 +22,51 @@ from shared.exceptions.handlers import (
 )
 from shared.exceptions.app_exceptions import AppException
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명 주기
+    업스트림 클라이언트를 시작 시 생성하고 종료 시 커넥션 정리
+    """
+    init_clients()
+    try:
+        yield
+    finally:
+        await close_clients()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="HairSpare API Gateway",
     description="HairSpare 마이크로서비스 API Gateway",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-# CORS 설정
-setup_cors(app)
+# 미들웨어는 모두 순수 ASGI로 구현 (BaseHTTPMiddleware는 요청마다 task/메모리 스트림을 추가하고 스트리밍 응답을 버퍼링)
+# 나중에 추가한 미들웨어가 바깥에서 실행됨: CORS → 요청 ID/처리 시간 → 인증 → 라우터
+# 인증 미들웨어 (GATEWAY_AUTH_MODE로 동작 방식 설정)
+app.add_middleware(AuthenticationMiddleware)
+
+# 요청 ID / 처리 시간
+app.add_middleware(RequestContextMiddleware)
 
-# 인증 미들웨어 (선택적 - 필요시 활성화)
-# app.add_middleware(AuthenticationMiddleware)
+# CORS 설정 (가장 바깥에서 실행 - preflight는 바로 응답하고, 401 응답에도 CORS 헤더 포함)
+setup_cors(app)
 
 # 예외 핸들러 등록
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
 # 라우터 등록
+app.include_router(batch.router)
 app.include_router(proxy.router)
 
+# 프록시 라우팅 테이블은 하나의 라우트로 맨 앞에 등록
+# (테이블에 없는 경로만 아래 개별 라우트로 넘어감)
+app.router.routes.insert(0, proxy.dispatch_route)
+
 
 @app.get("/")
 async def root():
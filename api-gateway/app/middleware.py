@@ -3,19 +3,141 @@ API Gateway 미들웨어
 CORS 및 인증 처리
 """
 
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-from typing import Callable
+from fastapi import status
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+import hashlib
+import re
+import time
+import uuid
 import sys
 import os
 
 # shared 라이브러리 경로 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
 from shared.auth.jwt import verify_token
-from shared.exceptions.app_exceptions import AuthenticationException
-from .config import CORS_ORIGINS, CORS_ORIGIN_REGEX
+from shared.auth.internal import INTERNAL_CLAIMS_HEADER, sign_internal_claims
+from .config import (
+    CORS_ORIGINS,
+    CORS_ORIGIN_REGEX,
+    CORS_MAX_AGE,
+    GATEWAY_AUTH_MODE,
+    AUTH_TOKEN_CACHE_SIZE,
+    AUTH_TOKEN_CACHE_TTL,
+    SLOW_REQUEST_LOG_MS,
+)
+
+_INTERNAL_CLAIMS_KEY = INTERNAL_CLAIMS_HEADER.lower().encode()
+
+
+# CORS 허용 메서드 (게이트웨이에서 받는 메서드 전체)
+CORS_ALLOW_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS")
+
+# 브라우저에서 읽을 수 있도록 노출하는 응답 헤더
+CORS_EXPOSE_HEADERS = ("X-Request-ID", "X-Response-Time", "X-Cache", "ETag")
+
+
+class OriginMatcher:
+    """
+    CORS origin 허용 여부 판별
+    고정 origin은 집합 조회, 나머지는 미리 컴파일한 정규식으로 판별하고 결과를 기억
+    """
+
+    def __init__(self, origins: Iterable[str], origin_regex: Optional[str] = None, memo_size: int = 1024):
+        origins = [origin.strip().rstrip("/") for origin in origins if origin.strip()]
+        self.allow_all = "*" in origins
+        self.origins = frozenset(origins)
+        self.regex = re.compile(origin_regex) if origin_regex else None
+        self.memo_size = memo_size
+        self._memo: Dict[str, bool] = {}
+
+    def __call__(self, origin: str) -> bool:
+        allowed = self._memo.get(origin)
+        if allowed is None:
+            allowed = (
+                self.allow_all
+                or origin in self.origins
+                or (self.regex is not None and self.regex.fullmatch(origin) is not None)
+            )
+            # 임의 origin으로 메모리가 늘어나지 않도록 상한까지만 기억
+            if len(self._memo) < self.memo_size:
+                self._memo[origin] = allowed
+        return allowed
+
+
+class EdgeCORSMiddleware:
+    """
+    CORS 미들웨어 (ASGI)
+    모든 OPTIONS 요청은 라우트/업스트림으로 보내지 않고 여기서 바로 응답
+    (허용 origin이면 긴 Access-Control-Max-Age로 브라우저가 preflight를 캐시)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        matcher: OriginMatcher,
+        max_age: int = CORS_MAX_AGE,
+        allow_methods: Iterable[str] = CORS_ALLOW_METHODS,
+        expose_headers: Iterable[str] = CORS_EXPOSE_HEADERS,
+    ):
+        self.app = app
+        self.matcher = matcher
+        self.allow_methods = ", ".join(allow_methods)
+        self.preflight_headers = {
+            "Access-Control-Allow-Methods": self.allow_methods,
+            "Access-Control-Allow-Credentials": "true",
+            "Access-Control-Max-Age": str(max_age),
+        }
+        self.expose_headers = ", ".join(expose_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value.decode("latin-1")
+            elif key == b"access-control-request-headers":
+                request_headers = value.decode("latin-1")
+
+        if scope["method"] == "OPTIONS":
+            await self._preflight(origin, request_headers)(scope, receive, send)
+            return
+
+        if origin is None or not self.matcher(origin):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # 서비스가 붙인 CORS 헤더가 있어도 게이트웨이 값으로 덮어씀
+                headers = MutableHeaders(scope=message)
+                headers["Access-Control-Allow-Origin"] = origin
+                headers["Access-Control-Allow-Credentials"] = "true"
+                headers["Access-Control-Expose-Headers"] = self.expose_headers
+                if "origin" not in headers.get("vary", "").lower():
+                    headers.add_vary_header("Origin")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _preflight(self, origin: Optional[str], request_headers: Optional[str]) -> Response:
+        if origin is None:
+            # CORS가 아닌 OPTIONS 요청
+            return Response(status_code=204, headers={"Allow": self.allow_methods})
+        if not self.matcher(origin):
+            return PlainTextResponse("Disallowed CORS origin", status_code=400, headers={"Vary": "Origin"})
+
+        headers = {**self.preflight_headers, "Access-Control-Allow-Origin": origin, "Vary": "Origin"}
+        if request_headers:
+            headers["Access-Control-Allow-Headers"] = request_headers
+        return Response(status_code=204, headers=headers)
 
 
 def setup_cors(app):
@@ -24,23 +146,137 @@ def setup_cors(app):
     Flutter 웹은 랜덤 포트에서 실행될 수 있으므로 localhost 정규식 허용
     """
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=CORS_ORIGINS,
-        allow_origin_regex=CORS_ORIGIN_REGEX,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        EdgeCORSMiddleware,
+        matcher=OriginMatcher(CORS_ORIGINS, CORS_ORIGIN_REGEX),
+        max_age=CORS_MAX_AGE,
+    )
+
+
+class RequestContextMiddleware:
+    """
+    요청 ID / 처리 시간 미들웨어 (ASGI)
+    X-Request-ID가 없으면 생성하여 서비스로 전달하고, 응답에 X-Request-ID와 X-Response-Time(ms) 추가
+    """
+    
+    def __init__(self, app: ASGIApp, slow_request_ms: float = SLOW_REQUEST_LOG_MS):
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                request_id = value
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex.encode()
+            scope = dict(scope)
+            scope["headers"] = [*scope["headers"], (b"x-request-id", request_id)]
+        status_code = 0
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id.decode("latin-1")
+                headers["X-Response-Time"] = f"{elapsed_ms:.1f}ms"
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if self.slow_request_ms and elapsed_ms >= self.slow_request_ms:
+                print(
+                    f"[SLOW] {scope['method']} {scope['path']} {status_code} "
+                    f"{elapsed_ms:.0f}ms request_id={request_id.decode('latin-1')}"
+                )
+
+
+class VerifiedToken:
+    """검증된 토큰 정보 (페이로드와 서비스로 전달할 서명된 내부 헤더)"""
+
+    __slots__ = ("payload", "claims_header", "expires_at")
+
+    def __init__(self, payload: Dict[str, Any], ttl: float):
+        self.payload = payload
+        self.claims_header = sign_internal_claims(payload).encode()
+        exp = payload.get("exp")
+        expires_at = time.time() + ttl
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        self.expires_at = expires_at
+
+
+class VerifiedTokenCache:
+    """
+    검증된 토큰 LRU 캐시
+    토큰 원문 대신 SHA-256 해시를 키로 저장하고, 만료(exp)된 항목은 조회 시 제거
+    """
+
+    def __init__(self, max_size: int = AUTH_TOKEN_CACHE_SIZE, ttl: float = AUTH_TOKEN_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, VerifiedToken]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def verify(self, token: str) -> Optional[VerifiedToken]:
+        """토큰 검증 (캐시에 없거나 만료된 경우에만 JWT 디코딩)"""
+        key = hashlib.sha256(token.encode()).digest()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if time.time() < entry.expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            del self._entries[key]
+
+        self.misses += 1
+        payload = verify_token(token)
+        if payload is None:
+            return None
+        entry = VerifiedToken(payload, self.ttl)
+        self._entries[key] = entry
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache = VerifiedTokenCache()
+
+
+def _unauthorized(detail: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content={"detail": detail},
+        headers={"WWW-Authenticate": "Bearer"},
     )
 
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
+class AuthenticationMiddleware:
     """
-    인증 미들웨어
-    특정 경로는 인증을 건너뛰고, 나머지는 토큰 검증
+    인증 미들웨어 (ASGI)
+    토큰을 게이트웨이에서 한 번 검증하고 클레임을 서명된 내부 헤더(X-Internal-Claims)로 서비스에 전달
+    클라이언트가 보낸 내부 헤더는 항상 제거
     """
     
     # 인증이 필요 없는 경로
-    PUBLIC_PATHS = [
+    PUBLIC_PATHS = (
         "/api/auth/login",
         "/api/auth/register",
         "/api/auth/find-id",
@@ -51,48 +287,57 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         "/docs",
         "/openapi.json",
         "/redoc",
-    ]
+    )
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # OPTIONS 요청은 통과
-        if request.method == "OPTIONS":
-            return await call_next(request)
-        
-        # 공개 경로는 인증 건너뛰기
-        if any(request.url.path.startswith(path) for path in self.PUBLIC_PATHS):
-            return await call_next(request)
-        
-        # Authorization 헤더 확인
-        authorization = request.headers.get("Authorization")
+    def __init__(self, app: ASGIApp, mode: str = GATEWAY_AUTH_MODE, cache: VerifiedTokenCache = token_cache):
+        self.app = app
+        self.mode = mode
+        self.cache = cache
+    
+    def _authenticate(self, authorization: Optional[str]) -> Tuple[Optional[VerifiedToken], str]:
+        """Authorization 헤더 검증 (실패 시 오류 메시지 반환)"""
         if not authorization:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="인증 토큰이 필요합니다",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            return None, "인증 토큰이 필요합니다"
         
         # Bearer 토큰 추출
-        try:
-            scheme, token = authorization.split()
-            if scheme.lower() != "bearer":
-                raise ValueError()
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="잘못된 인증 형식입니다",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        scheme, _, token = authorization.partition(" ")
+        token = token.strip()
+        if scheme.lower() != "bearer" or not token:
+            return None, "잘못된 인증 형식입니다"
         
         # 토큰 검증
-        payload = verify_token(token)
-        if payload is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="인증 토큰이 유효하지 않습니다",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        verified = self.cache.verify(token)
+        if verified is None:
+            return None, "인증 토큰이 유효하지 않습니다"
+        return verified, ""
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.mode == "off":
+            await self.app(scope, receive, send)
+            return
+        
+        # 클라이언트가 보낸 내부 헤더는 신뢰하지 않음
+        headers = []
+        authorization = None
+        for key, value in scope["headers"]:
+            if key == _INTERNAL_CLAIMS_KEY:
+                continue
+            if key == b"authorization":
+                authorization = value.decode("latin-1")
+            headers.append((key, value))
+        
+        verified, error = self._authenticate(authorization)
+        if verified is None and self.mode == "enforce":
+            # OPTIONS 요청과 공개 경로는 통과
+            if scope["method"] != "OPTIONS" and not scope["path"].startswith(self.PUBLIC_PATHS):
+                await _unauthorized(error)(scope, receive, send)
+                return
         
-        # 사용자 정보를 요청 상태에 저장
-        request.state.user = payload
+        scope = dict(scope)
+        if verified is not None:
+            headers.append((_INTERNAL_CLAIMS_KEY, verified.claims_header))
+            # 사용자 정보를 요청 상태에 저장 (request.state.user)
+            scope["state"] = {**scope.get("state", {}), "user": verified.payload}
+        scope["headers"] = headers
         
-        return await call_next(request)
+        await self.app(scope, receive, send)
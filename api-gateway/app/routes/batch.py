@@ -0,0 +1,98 @@
+"""
+배치 요청 라우트
+앱 홈 화면처럼 여러 조회 API를 한 번에 호출하는 경우 하나의 요청으로 묶어 처리
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+import httpx
+from fastapi import APIRouter, Request, HTTPException, status
+from pydantic import BaseModel, Field
+from ..config import BATCH_MAX_REQUESTS
+
+router = APIRouter()
+
+# 하위 요청에 그대로 전달하는 원 요청 헤더
+FORWARDED_HEADERS = ("authorization", "accept-language", "user-agent", "x-request-id")
+
+
+class BatchSubRequest(BaseModel):
+    """배치 하위 요청 (조회만 허용)"""
+    id: str
+    path: str
+    method: str = "GET"
+    query: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    """배치 요청"""
+    requests: List[BatchSubRequest]
+
+
+def _validate(sub: BatchSubRequest) -> Optional[str]:
+    """하위 요청 검증 (문제가 있으면 오류 메시지 반환)"""
+    if sub.method.upper() != "GET":
+        return "배치 요청은 GET만 지원합니다"
+    if not sub.path.startswith("/api/") or "?" in sub.path:
+        return "path는 쿼리 없이 /api/로 시작해야 합니다"
+    if sub.path.rstrip("/") == "/api/batch":
+        return "배치 요청은 중첩할 수 없습니다"
+    return None
+
+
+def _parse_body(response: httpx.Response) -> Any:
+    if not response.content:
+        return None
+    if "application/json" in response.headers.get("content-type", ""):
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            pass
+    return response.text
+
+
+async def _execute(client: httpx.AsyncClient, sub: BatchSubRequest, headers: Dict[str, str]) -> Dict[str, Any]:
+    """하위 요청 하나 실행 (실패해도 다른 하위 요청에 영향 없이 상태만 기록)"""
+    error = _validate(sub)
+    if error:
+        return {"id": sub.id, "status": status.HTTP_400_BAD_REQUEST, "body": {"detail": error}}
+    try:
+        response = await client.get(sub.path, params=sub.query, headers=headers)
+    except Exception as e:
+        return {"id": sub.id, "status": status.HTTP_502_BAD_GATEWAY, "body": {"detail": f"게이트웨이 오류: {str(e)}"}}
+    return {"id": sub.id, "status": response.status_code, "body": _parse_body(response)}
+
+
+@router.post("/api/batch")
+async def batch(request: Request, payload: BatchRequest):
+    """
+    여러 GET 요청을 동시에 실행하고 결과를 하나의 응답으로 반환
+
+    하위 요청은 게이트웨이 앱 내부에서 바로 처리되므로 개별 요청과 동일하게
+    라우팅 테이블, 공유 업스트림 클라이언트, 응답 캐시, 대체 응답이 적용됨
+
+    요청 예시:
+        {"requests": [{"id": "jobs", "path": "/api/jobs"},
+                      {"id": "schedules", "path": "/api/schedules", "query": {"owner_id": "me"}}]}
+
+    Returns:
+        {"responses": [{"id", "status", "body"}, ...]} (요청 순서 유지)
+    """
+    if not payload.requests:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="requests가 비어 있습니다")
+    if len(payload.requests) > BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"배치 요청은 최대 {BATCH_MAX_REQUESTS}개까지 가능합니다"
+        )
+    ids = [sub.id for sub in payload.requests]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="하위 요청 id가 중복되었습니다")
+
+    headers = {key: request.headers[key] for key in FORWARDED_HEADERS if key in request.headers}
+    transport = httpx.ASGITransport(app=request.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://api-gateway") as client:
+        responses = await asyncio.gather(*[_execute(client, sub, headers) for sub in payload.requests])
+
+    return {"responses": list(responses)}
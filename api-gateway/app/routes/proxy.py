@@ -4,20 +4,76 @@
 """
 
 from fastapi import APIRouter, Request, HTTPException, status
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 import httpx
-from typing import Dict
-from ..config import SERVICE_URLS
+from typing import Dict, Optional, Tuple
+from ..config import SERVICE_URLS, SERVICE_ROUTES, SERVICE_TIMEOUTS, ROUTE_PASSTHROUGH_PATHS, PROXY_STREAMING, PROXY_COALESCE_GETS, CACHE_TTLS
+from ..clients import get_client
+from ..circuit_breaker import get_breaker, circuit_states
+from ..routing import RouteTable, ProxyRoute, ProxyDispatchRoute
+from ..cache import response_cache, cache_key, CachedResponse, is_cacheable
+from ..singleflight import SingleFlight
+from ..middleware import token_cache
 import json
 
 router = APIRouter()
 
 
+def _upstream_error(service_name: str, exc: Exception) -> HTTPException:
+    """업스트림 호출 예외를 게이트웨이 HTTP 오류로 변환"""
+    if isinstance(exc, httpx.TimeoutException):
+        return HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="서비스 응답 시간이 초과되었습니다"
+        )
+    if isinstance(exc, httpx.ConnectError):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"서비스에 연결할 수 없습니다: {service_name}"
+        )
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail=f"게이트웨이 오류: {str(exc)}"
+    )
+
+
+# 업스트림 장애로 간주하는 응답 상태 코드 (서킷 브레이커 실패로 집계)
+UPSTREAM_FAILURE_STATUSES = (502, 503, 504)
+
+
+def _record_upstream_status(breaker, status_code: int) -> None:
+    if status_code in UPSTREAM_FAILURE_STATUSES:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+# 서비스가 다른 서비스를 호출할 때 이어서 쓰는 요청 남은 시간(ms) 헤더 (shared.clients)
+DEADLINE_HEADER = "x-request-timeout-ms"
+
+
+def _set_deadline_header(service_name: str, headers: Dict[str, str]) -> None:
+    """클라이언트가 보내지 않았으면 게이트웨이의 서비스 타임아웃을 요청 데드라인으로 전달"""
+    if DEADLINE_HEADER not in headers:
+        headers[DEADLINE_HEADER] = str(int(SERVICE_TIMEOUTS[service_name] * 1000))
+
+
+def _circuit_open_error(service_name: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"서비스가 일시적으로 차단되었습니다: {service_name}"
+    )
+
+
 async def proxy_request(
     service_name: str,
     path: str,
     request: Request,
-    method: str = None
+    method: str = None,
+    stream: Optional[bool] = None,
+    extra_headers: Optional[Dict[str, str]] = None,
+    drop_headers: Tuple[str, ...] = ()
 ) -> Response:
     """
     서비스로 요청 프록시
@@ -27,6 +83,9 @@ async def proxy_request(
         path: 요청 경로
         request: FastAPI Request 객체
         method: HTTP 메서드 (None이면 request.method 사용)
+        stream: True면 요청/응답 본문을 버퍼링 없이 스트리밍 (None이면 PROXY_STREAMING 설정 사용)
+        extra_headers: 업스트림 요청에 추가할 헤더 (예: 재검증용 If-None-Match)
+        drop_headers: 전달하지 않을 클라이언트 요청 헤더 (소문자, 예: 캐시 채우기 시 조건부 헤더)
     """
     # 서비스 URL 확인
     if service_name not in SERVICE_URLS:
@@ -35,11 +94,17 @@ async def proxy_request(
             detail=f"서비스를 찾을 수 없습니다: {service_name}"
         )
     
-    service_url = SERVICE_URLS[service_name]
     method = method or request.method
+    if stream is None:
+        stream = PROXY_STREAMING
+    
+    # 서킷이 열려 있으면 업스트림 호출 없이 즉시 503 (라우트 대체 응답으로 처리됨)
+    breaker = get_breaker(service_name)
+    if not breaker.allow_request():
+        raise _circuit_open_error(service_name)
     
-    # 전체 URL 구성
-    full_url = f"{service_url}{path}"
+    if stream:
+        return await _proxy_streaming(service_name, path, request, method, breaker)
     
     # 요청 본문 읽기
     body = None
@@ -52,58 +117,99 @@ async def proxy_request(
     # 헤더 준비 (Authorization 헤더는 그대로 전달)
     headers = {}
     for key, value in request.headers.items():
-        if key.lower() not in ["host", "content-length"]:
+        if key.lower() not in ["host", "content-length"] and key.lower() not in drop_headers:
             headers[key] = value
+    if extra_headers:
+        headers.update(extra_headers)
+    _set_deadline_header(service_name, headers)
     
     # 쿼리 파라미터
     query_params = dict(request.query_params)
     
     try:
-        # httpx를 사용하여 서비스로 요청 전달
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        # 서비스별 공유 클라이언트로 요청 전달 (커넥션 재사용)
+        client = get_client(service_name)
+        try:
             response = await client.request(
                 method=method,
-                url=full_url,
+                url=path,
                 headers=headers,
                 params=query_params,
                 content=body,
             )
-            
-            # 응답 본문 읽기
-            response_body = response.content
-            
-            # 응답 헤더 준비 (CORS 관련 헤더 제외)
-            response_headers = {}
-            for key, value in response.headers.items():
-                if key.lower() not in ["content-encoding", "content-length", "transfer-encoding"]:
-                    response_headers[key] = value
-            
-            return Response(
-                content=response_body,
-                status_code=response.status_code,
-                headers=response_headers,
-                media_type=response.headers.get("content-type", "application/json")
-            )
-    except httpx.TimeoutException:
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="서비스 응답 시간이 초과되었습니다"
-        )
-    except httpx.ConnectError:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"서비스에 연결할 수 없습니다: {service_name}"
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        _record_upstream_status(breaker, response.status_code)
+        
+        # 응답 본문 읽기
+        response_body = response.content
+        
+        # 응답 헤더 준비 (CORS 관련 헤더 제외)
+        response_headers = {}
+        for key, value in response.headers.items():
+            if key.lower() not in ["content-encoding", "content-length", "transfer-encoding"]:
+                response_headers[key] = value
+        
+        return Response(
+            content=response_body,
+            status_code=response.status_code,
+            headers=response_headers,
+            media_type=response.headers.get("content-type", "application/json")
         )
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"게이트웨이 오류: {str(e)}"
-        )
+        raise _upstream_error(service_name, e)
+
+
+async def _proxy_streaming(service_name: str, path: str, request: Request, method: str, breaker) -> Response:
+    """
+    스트리밍 프록시
+    요청 본문은 request.stream()으로, 응답 본문은 aiter_raw()로 그대로 전달하여
+    대용량 업로드/다운로드도 일정한 메모리로 처리
+    """
+    content = request.stream() if request.method in ["POST", "PUT", "PATCH"] else None
+    
+    # 본문을 그대로 전달하므로 content-length는 유지 (없으면 chunked 전송)
+    headers = {}
+    for key, value in request.headers.items():
+        if key.lower() != "host":
+            headers[key] = value
+    _set_deadline_header(service_name, headers)
+    
+    client = get_client(service_name)
+    upstream_request = client.build_request(
+        method=method,
+        url=path,
+        headers=headers,
+        params=dict(request.query_params),
+        content=content,
+    )
+    
+    try:
+        response = await client.send(upstream_request, stream=True)
+    except Exception as e:
+        if isinstance(e, httpx.TransportError):
+            breaker.record_failure()
+        raise _upstream_error(service_name, e)
+    _record_upstream_status(breaker, response.status_code)
+    
+    # 원본 바이트를 그대로 내보내므로 content-encoding/content-length는 유지
+    response_headers = {}
+    for key, value in response.headers.items():
+        if key.lower() not in ["transfer-encoding", "connection"]:
+            response_headers[key] = value
+    
+    return StreamingResponse(
+        response.aiter_raw(),
+        status_code=response.status_code,
+        headers=response_headers,
+        background=BackgroundTask(response.aclose),
+    )
 
 
 # Auth Service 라우트
 # 로그인 엔드포인트는 mock 응답 제공 (임시)
-@router.api_route("/api/auth/login", methods=["POST", "OPTIONS"])
+@router.api_route("/api/auth/login", methods=["POST"])
 async def proxy_auth_login(request: Request):
     """
     로그인 (임시 - mock 응답)
@@ -142,121 +248,167 @@ async def proxy_auth_login(request: Request):
     )
 
 
-@router.api_route("/api/auth/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"])
-async def proxy_auth(path: str, request: Request):
-    # login은 위에서 처리되므로 다른 경로만 프록시
-    if path == "login":
-        return await proxy_auth_login(request)
-    return await proxy_request("auth", f"/api/auth/{path}", request)
+# 서비스 프록시 라우트 (auth, job, schedule, chat, energy, store, cart, order, payment)
+# 경로 → 서비스 매핑은 config.SERVICE_ROUTES에서 관리
 
+# 서비스 연결 불가(503) 시 대체 응답 정책 (prefix별)
+def _jobs_fallback(method: str, subpath: str):
+    if subpath == "":
+        return {"jobs": []}
+    return None
 
-# Job Service 라우트
-@router.api_route("/api/jobs/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"])
-async def proxy_jobs(path: str, request: Request):
-    return await proxy_request("job", f"/api/jobs/{path}", request)
 
+def _schedules_fallback(method: str, subpath: str):
+    if subpath == "" and method == "GET":
+        return {"schedules": []}
+    return None
 
-@router.api_route("/api/jobs", methods=["GET", "POST", "OPTIONS"])
-async def proxy_jobs_list(request: Request):
-    try:
-        return await proxy_request("job", "/api/jobs", request)
-    except HTTPException as e:
-        if e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
-            return JSONResponse(content={"jobs": []}, status_code=200)
-        raise
 
+def _work_check_fallback(method: str, subpath: str):
+    if subpath == "":
+        return {"consecutiveDays": 0, "energyFromWork": 0}
+    if subpath.strip("/") == "shop-stats":
+        return {
+            "data": {
+                "totalCompleted": 0,
+                "vipLevel": "bronze",
+                "tier": "bronze",
+                "thumbsUpReceived": 0,
+                "nextCount": 10,
+                "progress": 0,
+            }
+        }
+    return {"data": {"consecutiveDays": 0, "energyFromWork": 0}}
 
-@router.api_route("/api/applications/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_applications(path: str, request: Request):
-    return await proxy_request("job", f"/api/applications/{path}", request)
 
+def _chats_fallback(method: str, subpath: str):
+    if subpath == "":
+        return {"chats": []}
+    return None
 
-@router.api_route("/api/applications", methods=["GET", "POST", "OPTIONS"])
-async def proxy_applications_list(request: Request):
-    return await proxy_request("job", "/api/applications", request)
 
+ROUTE_FALLBACKS = {
+    "/api/jobs": _jobs_fallback,
+    "/api/schedules": _schedules_fallback,
+    "/api/work-check": _work_check_fallback,
+    "/api/chats": _chats_fallback,
+}
 
-# Schedule Service 라우트
-@router.api_route("/api/schedules/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_schedules(path: str, request: Request):
-    return await proxy_request("schedule", f"/api/schedules/{path}", request)
+# SERVICE_ROUTES 설정으로 컴파일한 라우팅 테이블
+ROUTE_TABLE = RouteTable.from_config(
+    SERVICE_ROUTES,
+    SERVICE_URLS,
+    fallbacks=ROUTE_FALLBACKS,
+    cache_ttls=CACHE_TTLS,
+    passthrough=ROUTE_PASSTHROUGH_PATHS,
+)
 
+# 같은 키(경로, 쿼리, 인증 범위)로 동시에 들어온 GET을 업스트림 요청 하나로 합침
+# 캐시 대상 라우트는 캐시 채우기, 그 외 라우트는 응답 공유에 사용 (stampede 방지)
+_inflight_gets = SingleFlight()
 
-@router.api_route("/api/schedules", methods=["GET", "POST", "OPTIONS"])
-async def proxy_schedules_list(request: Request):
-    try:
-        return await proxy_request("schedule", "/api/schedules", request)
-    except HTTPException as e:
-        if e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE and request.method == "GET":
-            return JSONResponse(content={"schedules": []}, status_code=200)
-        raise
 
+def _clone_response(response: Response) -> Response:
+    """
+    합쳐진 응답을 대기자별 Response로 복사
+    미들웨어가 응답 헤더 목록을 직접 수정하므로 같은 객체를 여러 요청에 보내지 않음
+    """
+    clone = Response(content=response.body, status_code=response.status_code)
+    clone.raw_headers = list(response.raw_headers)
+    return clone
 
-@router.api_route("/api/work-check/{path:path}", methods=["GET", "POST", "OPTIONS"])
-async def proxy_work_check(path: str, request: Request):
-    try:
-        return await proxy_request("schedule", f"/api/work-check/{path}", request)
-    except HTTPException as e:
-        if e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
-            if path.strip("/") == "shop-stats":
-                return JSONResponse(
-                    content={
-                        "data": {
-                            "totalCompleted": 0,
-                            "vipLevel": "bronze",
-                            "tier": "bronze",
-                            "thumbsUpReceived": 0,
-                            "nextCount": 10,
-                            "progress": 0,
-                        }
-                    },
-                    status_code=200,
-                )
-            return JSONResponse(content={"data": {"consecutiveDays": 0, "energyFromWork": 0}}, status_code=200)
-        raise
 
+# 클라이언트 조건부 요청 헤더 (업스트림 304는 그 헤더를 보낸 클라이언트에게만 유효, 캐시 채우기에서는 제외)
+_CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
 
-@router.api_route("/api/work-check", methods=["GET", "POST", "OPTIONS"])
-async def proxy_work_check_list(request: Request):
-    try:
-        return await proxy_request("schedule", "/api/work-check", request)
-    except HTTPException as e:
-        if e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
-            return JSONResponse(content={"consecutiveDays": 0, "energyFromWork": 0}, status_code=200)
-        raise
+
+def _coalesce_key(request: Request):
+    """응답을 공유할 요청 키 (조건부 헤더가 다르면 304 여부가 달라지므로 함께 구분)"""
+    return cache_key(request) + tuple(request.headers.get(name, "") for name in _CONDITIONAL_HEADERS)
 
 
-# Chat Service 라우트
-@router.api_route("/api/chats/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_chats(path: str, request: Request):
-    return await proxy_request("chat", f"/api/chats/{path}", request)
+async def coalesced_proxy(request: Request, route: ProxyRoute) -> Response:
+    """진행 중인 동일 GET이 있으면 그 응답을 공유하고, 없으면 업스트림 호출"""
+    response = await _inflight_gets.do(
+        _coalesce_key(request),
+        lambda: proxy_request(route.service, request.url.path, request, stream=False),
+    )
+    return _clone_response(response)
+
+
+async def _fill_cache(request: Request, route: ProxyRoute, key, stale: Optional[CachedResponse]) -> CachedResponse:
+    """
+    업스트림에서 응답을 받아 캐시 (만료 항목에 업스트림 ETag가 있으면 조건부 요청으로 재검증)
+    채운 응답은 대기 중인 모든 요청이 공유하므로 클라이언트 조건부 헤더는 보내지 않고
+    클라이언트별 304는 캐시 항목의 ETag로 게이트웨이에서 판단 (CachedResponse.to_response)
+    """
+    extra_headers = None
+    revalidating = stale is not None and stale.upstream_etag is not None
+    if revalidating:
+        extra_headers = {"If-None-Match": stale.upstream_etag}
+    
+    response = await proxy_request(
+        route.service, request.url.path, request,
+        stream=False, extra_headers=extra_headers, drop_headers=_CONDITIONAL_HEADERS,
+    )
+    if response.status_code == 304 and revalidating:
+        stale.refresh(route.cache_ttl)
+        response_cache.revalidated += 1
+        return stale
+    
+    entry = CachedResponse.from_response(response, route.cache_ttl)
+    if is_cacheable(response):
+        response_cache.set(key, entry)
+    return entry
+
+
+async def cached_proxy(request: Request, route: ProxyRoute) -> Response:
+    """GET 응답 캐시 조회 후 없거나 만료되면 업스트림 호출"""
+    key = cache_key(request)
+    entry = response_cache.get(key)
+    if entry is not None and entry.fresh:
+        response_cache.hits += 1
+        return entry.to_response(request, "HIT")
+    
+    response_cache.misses += 1
+    entry = await _inflight_gets.do(key, lambda: _fill_cache(request, route, key, entry))
+    return entry.to_response(request, "MISS")
 
 
-@router.api_route("/api/chats", methods=["GET", "POST", "OPTIONS"])
-async def proxy_chats_list(request: Request):
+async def dispatch_proxy(request: Request, route: ProxyRoute, subpath: str) -> Response:
+    """
+    라우팅 테이블 매칭 요청 처리
+    요청 경로 그대로 서비스에 전달하고, 503이면 라우트의 대체 응답 정책 적용
+    캐시 대상 라우트의 GET은 응답 캐시를 거치고, 쓰기 요청은 해당 prefix 캐시를 비움
+    그 외 GET은 동일 요청끼리 합쳐서 전달 (PROXY_COALESCE_GETS)
+    """
     try:
-        return await proxy_request("chat", "/api/chats", request)
+        if request.method == "GET":
+            if route.cache_ttl > 0:
+                return await cached_proxy(request, route)
+            if PROXY_COALESCE_GETS:
+                return await coalesced_proxy(request, route)
+            return await proxy_request(route.service, request.url.path, request)
+        
+        response = await proxy_request(route.service, request.url.path, request)
+        if route.cache_ttl > 0 and response.status_code < 400:
+            response_cache.invalidate_prefix(route.prefix)
+        return response
     except HTTPException as e:
-        if e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
-            return JSONResponse(content={"chats": []}, status_code=200)
+        if e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE and route.fallback is not None:
+            content = route.fallback(request.method, subpath)
+            if content is not None:
+                return JSONResponse(content=content, status_code=200)
         raise
 
 
-@router.api_route("/api/messages/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_messages(path: str, request: Request):
-    return await proxy_request("chat", f"/api/messages/{path}", request)
-
-
-@router.api_route("/api/messages", methods=["GET", "POST", "OPTIONS"])
-async def proxy_messages_list(request: Request):
-    return await proxy_request("chat", "/api/messages", request)
+# 라우팅 테이블 전체를 처리하는 단일 라우트 (main.py에서 라우트 목록 맨 앞에 등록)
+dispatch_route = ProxyDispatchRoute(ROUTE_TABLE, dispatch_proxy)
 
 
 # Favorites API (아직 전용 서비스 없음 - 빈 목록 반환)
-@router.api_route("/api/favorites/check", methods=["POST", "OPTIONS"])
+@router.api_route("/api/favorites/check", methods=["POST"])
 async def proxy_favorites_check(request: Request):
-    if request.method == "OPTIONS":
-        return Response(status_code=204)
     try:
         body = await request.json()
         job_ids = body.get("jobIds", [])
@@ -265,10 +417,8 @@ async def proxy_favorites_check(request: Request):
         return JSONResponse(content={"favorites": {}})
 
 
-@router.api_route("/api/favorites", methods=["GET", "POST", "DELETE", "OPTIONS"])
+@router.api_route("/api/favorites", methods=["GET", "POST", "DELETE"])
 async def proxy_favorites(request: Request):
-    if request.method == "OPTIONS":
-        return Response(status_code=204)
     if request.method == "GET":
         return JSONResponse(content={"favorites": []})
     if request.method == "POST":
@@ -278,69 +428,9 @@ async def proxy_favorites(request: Request):
     return Response(status_code=405)
 
 
-# Energy Service 라우트
-@router.api_route("/api/energy/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_energy(path: str, request: Request):
-    return await proxy_request("energy", f"/api/energy/{path}", request)
-
-
-# Store Service 라우트
-@router.api_route("/api/store/products/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_store_products(path: str, request: Request):
-    return await proxy_request("store", f"/api/store/products/{path}", request)
-
-
-@router.api_route("/api/store/products", methods=["GET", "POST", "OPTIONS"])
-async def proxy_store_products_list(request: Request):
-    return await proxy_request("store", "/api/store/products", request)
-
-
-@router.api_route("/api/store/categories/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_store_categories(path: str, request: Request):
-    return await proxy_request("store", f"/api/store/categories/{path}", request)
-
-
-@router.api_route("/api/store/categories", methods=["GET", "POST", "OPTIONS"])
-async def proxy_store_categories_list(request: Request):
-    return await proxy_request("store", "/api/store/categories", request)
-
-
-# Cart Service 라우트
-@router.api_route("/api/store/cart/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_cart(path: str, request: Request):
-    return await proxy_request("cart", f"/api/store/cart/{path}", request)
-
-
-@router.api_route("/api/store/cart", methods=["GET", "DELETE", "OPTIONS"])
-async def proxy_cart_list(request: Request):
-    return await proxy_request("cart", "/api/store/cart", request)
-
-
-# Order Service 라우트
-@router.api_route("/api/store/orders/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_orders(path: str, request: Request):
-    return await proxy_request("order", f"/api/store/orders/{path}", request)
-
-
-@router.api_route("/api/store/orders", methods=["GET", "POST", "OPTIONS"])
-async def proxy_orders_list(request: Request):
-    return await proxy_request("order", "/api/store/orders", request)
-
-
-# Payment Service 라우트
-@router.api_route("/api/payments/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-async def proxy_payments(path: str, request: Request):
-    return await proxy_request("payment", f"/api/payments/{path}", request)
-
-
-@router.api_route("/api/payments", methods=["GET", "POST", "OPTIONS"])
-async def proxy_payments_list(request: Request):
-    return await proxy_request("payment", "/api/payments", request)
-
-
 # Notification Service 라우트 (임시 - mock 데이터 반환)
 # 주의: 더 구체적인 경로가 와일드카드 경로보다 먼저 와야 함
-@router.api_route("/api/notifications", methods=["GET", "POST", "OPTIONS"])
+@router.api_route("/api/notifications", methods=["GET", "POST"])
 async def proxy_notifications_list(request: Request):
     """
     알림 목록 조회 (임시 - mock 데이터)
@@ -416,7 +506,7 @@ async def proxy_notifications_list(request: Request):
     )
 
 
-@router.api_route("/api/notifications/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
+@router.api_route("/api/notifications/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
 async def proxy_notifications(path: str, request: Request):
     """
     알림 상세/수정/삭제 (임시 - mock 응답)
@@ -448,7 +538,7 @@ async def proxy_notifications(path: str, request: Request):
 
 # Spares Service 라우트 (임시 - mock 데이터 반환)
 # 주의: 더 구체적인 경로가 와일드카드 경로보다 먼저 와야 함
-@router.api_route("/api/spares", methods=["GET", "OPTIONS"])
+@router.api_route("/api/spares", methods=["GET"])
 async def proxy_spares_list(request: Request):
     """
     스페어 목록 조회 (임시 - mock 데이터)
@@ -681,7 +771,7 @@ async def proxy_my_spaces(request: Request):
 
 
 # 공간 목록 조회
-@router.api_route("/api/space-rentals", methods=["GET", "POST", "OPTIONS"])
+@router.api_route("/api/space-rentals", methods=["GET", "POST"])
 async def proxy_space_rentals_list(request: Request):
     """
     공간 목록 조회 (임시)
@@ -700,7 +790,7 @@ async def proxy_space_rentals_list(request: Request):
 
 
 # 공간대여 와일드카드 라우트 - 가장 마지막에 등록
-@router.api_route("/api/space-rentals/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
+@router.api_route("/api/space-rentals/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
 async def proxy_space_rentals(path: str, request: Request):
     """
     공간대여 관련 엔드포인트 (임시)
@@ -723,7 +813,7 @@ async def proxy_space_rentals(path: str, request: Request):
 
 
 # Spares 상세 조회 (더 구체적인 경로는 나중에)
-@router.api_route("/api/spares/{path:path}", methods=["GET", "OPTIONS"])
+@router.api_route("/api/spares/{path:path}", methods=["GET"])
 async def proxy_spares_detail(path: str, request: Request):
     """
     스페어 상세 조회 (임시 - mock 데이터)
@@ -760,7 +850,7 @@ async def proxy_spares_detail(path: str, request: Request):
 # Python FastAPI에서 직접 데이터베이스에 연결하여 통계 조회
 
 # 관리자 대시보드 통계
-@router.api_route("/api/admin/stats", methods=["GET", "OPTIONS"])
+@router.api_route("/api/admin/stats", methods=["GET"])
 async def proxy_admin_stats(request: Request):
     """
     관리자 대시보드 통계 조회
@@ -779,71 +869,79 @@ async def proxy_admin_stats(request: Request):
         sys.path.insert(0, backend_dir)
 
     try:
-        from shared.database.session import SessionLocal
+        from shared.database.replica import ReadSessionLocal
+        from shared.database.offload import run_sync
 
-        db = SessionLocal()
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-
-        def _scalar(stmt, params=None, default=0):
+        def _query_stats():
+            # 동기 DB 조회는 오프로드 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
+            db = ReadSessionLocal()
             try:
-                r = db.execute(text(stmt), params or {})
-                val = r.scalar()
-                return val if val is not None else default
-            except Exception as e:
-                print(f"[Admin Stats] Query error: {e}")
-                return default
-
-        def _scalar_try(*queries):
-            """여러 쿼리를 시도하여 첫 성공 결과 반환"""
-            for stmt, params in queries:
+                today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+                def _scalar(stmt, params=None, default=0):
+                    try:
+                        r = db.execute(text(stmt), params or {})
+                        val = r.scalar()
+                        return val if val is not None else default
+                    except Exception as e:
+                        print(f"[Admin Stats] Query error: {e}")
+                        return default
+
+                def _scalar_try(*queries):
+                    """여러 쿼리를 시도하여 첫 성공 결과 반환"""
+                    for stmt, params in queries:
+                        try:
+                            r = db.execute(text(stmt), params or {})
+                            val = r.scalar()
+                            if val is not None:
+                                return val
+                        except Exception:
+                            continue
+                    return 0
+
+                # User 통계 (createdAt 또는 created_at 컬럼 지원)
+                total_users = _scalar('SELECT COUNT(*) FROM "User"')
+                today_users = _scalar_try(
+                    ('SELECT COUNT(*) FROM "User" WHERE "createdAt" >= :today', {"today": today_start}),
+                    ('SELECT COUNT(*) FROM "User" WHERE "created_at" >= :today', {"today": today_start}),
+                )
                 try:
-                    r = db.execute(text(stmt), params or {})
-                    val = r.scalar()
-                    if val is not None:
-                        return val
+                    r = db.execute(text('SELECT role, COUNT(*) FROM "User" GROUP BY role'))
+                    by_role = {row[0]: row[1] for row in r.fetchall()}
                 except Exception:
-                    continue
-            return 0
-
-        # User 통계 (createdAt 또는 created_at 컬럼 지원)
-        total_users = _scalar('SELECT COUNT(*) FROM "User"')
-        today_users = _scalar_try(
-            ('SELECT COUNT(*) FROM "User" WHERE "createdAt" >= :today', {"today": today_start}),
-            ('SELECT COUNT(*) FROM "User" WHERE "created_at" >= :today', {"today": today_start}),
-        )
-        try:
-            r = db.execute(text('SELECT role, COUNT(*) FROM "User" GROUP BY role'))
-            by_role = {row[0]: row[1] for row in r.fetchall()}
-        except Exception:
-            by_role = {}
+                    by_role = {}
 
-        # Job, Schedule, Energy 통계
-        total_jobs = _scalar('SELECT COUNT(*) FROM "Job"')
-        active_jobs = _scalar('SELECT COUNT(*) FROM "Job" WHERE status = \'published\'')
+                # Job, Schedule, Energy 통계
+                total_jobs = _scalar('SELECT COUNT(*) FROM "Job"')
+                active_jobs = _scalar('SELECT COUNT(*) FROM "Job" WHERE status = \'published\'')
 
-        today_payments = 0
-        total_payments = 0
+                today_payments = 0
+                total_payments = 0
 
-        today_schedules = _scalar_try(
-            ('SELECT COUNT(*) FROM "Schedule" WHERE "checkInTime" >= :today', {"today": today_start}),
-            ('SELECT COUNT(*) FROM "Schedule" WHERE "check_in_time" >= :today', {"today": today_start}),
-        )
-        total_schedules = _scalar('SELECT COUNT(*) FROM "Schedule"')
-
-        energy_wallets = _scalar('SELECT COUNT(*) FROM "EnergyWallet"')
-        total_energy_transactions = _scalar('SELECT COUNT(*) FROM "EnergyTransaction"')
-        no_show_count = _scalar('SELECT COUNT(*) FROM "NoShowHistory"')
-
-        stats = {
-            "users": {"total": total_users, "today": today_users, "byRole": by_role},
-            "jobs": {"total": total_jobs, "active": active_jobs},
-            "payments": {"today": today_payments, "total": total_payments},
-            "schedules": {"today": today_schedules, "total": total_schedules},
-            "energy": {"wallets": energy_wallets, "transactions": total_energy_transactions},
-            "noShow": {"total": no_show_count},
-        }
+                today_schedules = _scalar_try(
+                    ('SELECT COUNT(*) FROM "Schedule" WHERE "checkInTime" >= :today', {"today": today_start}),
+                    ('SELECT COUNT(*) FROM "Schedule" WHERE "check_in_time" >= :today', {"today": today_start}),
+                )
+                total_schedules = _scalar('SELECT COUNT(*) FROM "Schedule"')
+
+                energy_wallets = _scalar('SELECT COUNT(*) FROM "EnergyWallet"')
+                total_energy_transactions = _scalar('SELECT COUNT(*) FROM "EnergyTransaction"')
+                no_show_count = _scalar('SELECT COUNT(*) FROM "NoShowHistory"')
+
+                stats = {
+                    "users": {"total": total_users, "today": today_users, "byRole": by_role},
+                    "jobs": {"total": total_jobs, "active": active_jobs},
+                    "payments": {"today": today_payments, "total": total_payments},
+                    "schedules": {"today": today_schedules, "total": total_schedules},
+                    "energy": {"wallets": energy_wallets, "transactions": total_energy_transactions},
+                    "noShow": {"total": no_show_count},
+                }
+
+                return stats
+            finally:
+                db.close()
 
-        db.close()
+        stats = await run_sync(_query_stats)
         return JSONResponse(content={"stats": stats})
 
     except ImportError as e:
@@ -865,7 +963,7 @@ async def proxy_admin_stats(request: Request):
 
 
 # 관리자 최근 활동
-@router.api_route("/api/admin/activities", methods=["GET", "OPTIONS"])
+@router.api_route("/api/admin/activities", methods=["GET"])
 async def proxy_admin_activities(request: Request):
     """
     관리자 최근 활동 목록 (회원가입, 공고등록, 결제완료, 노쇼신고, 에너지충전 등)
@@ -885,7 +983,7 @@ async def proxy_admin_activities(request: Request):
 
 
 # 관리자 회원 목록
-@router.api_route("/api/admin/users", methods=["GET", "OPTIONS"])
+@router.api_route("/api/admin/users", methods=["GET"])
 async def proxy_admin_users(request: Request):
     """
     관리자 회원 목록 조회
@@ -910,64 +1008,69 @@ async def proxy_admin_users(request: Request):
         backend_dir = os.path.abspath(os.path.join(current_file, "../../../"))
         if backend_dir not in sys.path:
             sys.path.insert(0, backend_dir)
-        from shared.database.session import SessionLocal
+        from shared.database.replica import ReadSessionLocal
+        from shared.database.offload import run_sync
 
-        db = SessionLocal()
-        try:
-            # User 테이블 조회 - created_at/createdAt 둘 다 시도
-            for created_col in ['created_at', '"createdAt"']:
-                try:
-                    base_sql = f'SELECT id, username, email, name, phone, role, {created_col} FROM "User" WHERE 1=1'
-                    count_sql = 'SELECT COUNT(*) FROM "User" WHERE 1=1'
-                    params = {}
-                    conditions = []
-
-                    if role:
-                        conditions.append('role = :role')
-                        params['role'] = role
-                    if search:
-                        conditions.append('(name ILIKE :search OR email ILIKE :search OR phone::text LIKE :search)')
-                        params['search'] = f'%{search.lower()}%'
-
-                    where_clause = ' AND '.join(conditions) if conditions else '1=1'
-                    full_count_sql = count_sql.replace('WHERE 1=1', f'WHERE {where_clause}')
-                    full_list_sql = base_sql.replace('WHERE 1=1', f'WHERE {where_clause}')
-                    full_list_sql += f' ORDER BY {created_col} DESC LIMIT :limit OFFSET :offset'
-                    params['limit'] = limit
-                    params['offset'] = (page - 1) * limit
-
-                    total = db.execute(text(full_count_sql), params).scalar() or 0
-                    rows = db.execute(text(full_list_sql), params).fetchall()
-
-                    users = []
-                    for row in rows:
-                        created_at = row[6] if len(row) > 6 else None
-                        created_str = (created_at.isoformat() + 'Z') if hasattr(created_at, 'isoformat') else str(created_at or '')
-                        users.append({
-                            "id": str(row[0]),
-                            "email": row[2] or "",
-                            "name": (row[3] or row[1] or "이름 없음") if len(row) > 3 else "이름 없음",
-                            "role": row[5] or "spare" if len(row) > 5 else "spare",
-                            "phone": (row[4] or "") if len(row) > 4 else "",
-                            "createdAt": created_str,
-                            "accounts": [{"provider": "email"}],
-                            "energyWallet": {"balance": 0},
-                            "_count": {"jobs": 0, "applications": 0, "schedules": 0},
-                        })
-
-                    total_pages = (total + limit - 1) // limit if total > 0 else 1
-                    db.close()
-                    return JSONResponse(content={
-                        "users": users,
-                        "pagination": {"page": page, "limit": limit, "total": total, "totalPages": total_pages},
-                    })
-                except Exception as col_err:
-                    continue
-            db.close()
-            raise Exception("User table column not found")
-        except Exception as e:
-            db.close()
-            raise
+        def _query_users():
+            # 동기 DB 조회는 오프로드 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
+            db = ReadSessionLocal()
+            try:
+                # User 테이블 조회 - created_at/createdAt 둘 다 시도
+                for created_col in ['created_at', '"createdAt"']:
+                    try:
+                        base_sql = f'SELECT id, username, email, name, phone, role, {created_col} FROM "User" WHERE 1=1'
+                        count_sql = 'SELECT COUNT(*) FROM "User" WHERE 1=1'
+                        params = {}
+                        conditions = []
+
+                        if role:
+                            conditions.append('role = :role')
+                            params['role'] = role
+                        if search:
+                            conditions.append('(name ILIKE :search OR email ILIKE :search OR phone::text LIKE :search)')
+                            params['search'] = f'%{search.lower()}%'
+
+                        where_clause = ' AND '.join(conditions) if conditions else '1=1'
+                        full_count_sql = count_sql.replace('WHERE 1=1', f'WHERE {where_clause}')
+                        full_list_sql = base_sql.replace('WHERE 1=1', f'WHERE {where_clause}')
+                        full_list_sql += f' ORDER BY {created_col} DESC LIMIT :limit OFFSET :offset'
+                        params['limit'] = limit
+                        params['offset'] = (page - 1) * limit
+
+                        total = db.execute(text(full_count_sql), params).scalar() or 0
+                        rows = db.execute(text(full_list_sql), params).fetchall()
+
+                        users = []
+                        for row in rows:
+                            created_at = row[6] if len(row) > 6 else None
+                            created_str = (created_at.isoformat() + 'Z') if hasattr(created_at, 'isoformat') else str(created_at or '')
+                            users.append({
+                                "id": str(row[0]),
+                                "email": row[2] or "",
+                                "name": (row[3] or row[1] or "이름 없음") if len(row) > 3 else "이름 없음",
+                                "role": row[5] or "spare" if len(row) > 5 else "spare",
+                                "phone": (row[4] or "") if len(row) > 4 else "",
+                                "createdAt": created_str,
+                                "accounts": [{"provider": "email"}],
+                                "energyWallet": {"balance": 0},
+                                "_count": {"jobs": 0, "applications": 0, "schedules": 0},
+                            })
+
+                        total_pages = (total + limit - 1) // limit if total > 0 else 1
+                        db.close()
+                        return {
+                            "users": users,
+                            "pagination": {"page": page, "limit": limit, "total": total, "totalPages": total_pages},
+                        }
+                    except Exception as col_err:
+                        continue
+                db.close()
+                raise Exception("User table column not found")
+            except Exception as e:
+                db.close()
+                raise
+
+        return JSONResponse(content=await run_sync(_query_users))
     except Exception as db_err:
         # DB 실패 시 mock 데이터 반환
         # Mock 회원 데이터 (각 역할별로 생성)
@@ -1075,7 +1178,7 @@ async def proxy_admin_users(request: Request):
 
 
 # 관리자 회원 상세
-@router.api_route("/api/admin/users/{user_id}", methods=["GET", "OPTIONS"])
+@router.api_route("/api/admin/users/{user_id}", methods=["GET"])
 async def proxy_admin_user_detail(user_id: str, request: Request):
     """
     관리자 회원 상세 조회 (mock 데이터)
@@ -1107,7 +1210,7 @@ async def proxy_admin_user_detail(user_id: str, request: Request):
 
 
 # 관리자 공고 목록
-@router.api_route("/api/admin/jobs", methods=["GET", "OPTIONS"])
+@router.api_route("/api/admin/jobs", methods=["GET"])
 async def proxy_admin_jobs(request: Request):
     """
     관리자 공고 목록 조회
@@ -1200,7 +1303,7 @@ async def proxy_admin_jobs(request: Request):
 
 
 # 관리자 결제 목록
-@router.api_route("/api/admin/payments", methods=["GET", "OPTIONS"])
+@router.api_route("/api/admin/payments", methods=["GET"])
 async def proxy_admin_payments(request: Request):
     """
     관리자 결제 목록 조회
@@ -1273,7 +1376,7 @@ async def proxy_admin_payments(request: Request):
 
 
 # 관리자 에너지 거래 내역
-@router.api_route("/api/admin/energy", methods=["GET", "OPTIONS"])
+@router.api_route("/api/admin/energy", methods=["GET"])
 async def proxy_admin_energy(request: Request):
     """
     관리자 에너지 거래 내역 조회
@@ -1351,7 +1454,7 @@ async def proxy_admin_energy(request: Request):
 
 
 # 관리자 노쇼 이력
-@router.api_route("/api/admin/noshow", methods=["GET", "OPTIONS"])
+@router.api_route("/api/admin/noshow", methods=["GET"])
 async def proxy_admin_noshow(request: Request):
     """
     관리자 노쇼 이력 조회
@@ -1418,6 +1521,13 @@ async def proxy_admin_noshow(request: Request):
 @router.get("/health")
 async def health_check():
     """
-    API Gateway 헬스 체크
+    API Gateway 헬스 체크 (서비스별 서킷 브레이커 상태, 응답 캐시/요청 합치기/토큰 캐시 통계 포함)
     """
-    return {"status": "ok", "service": "api-gateway"}
+    return {
+        "status": "ok",
+        "service": "api-gateway",
+        "circuits": circuit_states(),
+        "cache": response_cache.stats(),
+        "coalescing": _inflight_gets.stats(),
+        "auth": token_cache.stats(),
+    }
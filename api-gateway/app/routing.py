@@ -0,0 +1,180 @@
+"""
+프록시 라우팅 테이블
+경로 prefix → 서비스 매핑을 세그먼트 트라이로 컴파일하여
+요청마다 라우트를 하나씩 정규식 매칭하지 않고 한 번의 조회로 대상 서비스를 결정
+"""
+
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple, Any
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+# 프록시 라우트 기본 허용 메서드 (OPTIONS는 CORS 미들웨어가 응답하므로 업스트림으로 보내지 않음)
+PROXY_METHODS: FrozenSet[str] = frozenset(["GET", "POST", "PUT", "DELETE", "PATCH"])
+
+# 503 시 대체 응답을 만드는 함수: (method, subpath) -> JSON 본문 또는 None(대체 응답 없음)
+FallbackPolicy = Callable[[str, str], Optional[Any]]
+
+
+class ProxyRoute:
+    """
+    프록시 라우트 정의
+
+    Args:
+        prefix: 경로 prefix (예: "/api/jobs")
+        service: 대상 서비스 이름 (SERVICE_URLS 키)
+        methods: 허용 메서드
+        fallback: 서비스 연결 불가(503) 시 대체 응답 정책
+        cache_ttl: GET 응답 캐시 TTL(초), 0이면 캐시 안 함
+    """
+
+    __slots__ = ("prefix", "service", "methods", "fallback", "cache_ttl")
+
+    def __init__(
+        self,
+        prefix: str,
+        service: str,
+        methods: FrozenSet[str] = PROXY_METHODS,
+        fallback: Optional[FallbackPolicy] = None,
+        cache_ttl: float = 0,
+    ):
+        self.prefix = prefix.rstrip("/")
+        self.service = service
+        self.methods = methods
+        self.fallback = fallback
+        self.cache_ttl = cache_ttl
+
+    def __repr__(self):
+        return f"<ProxyRoute(prefix={self.prefix}, service={self.service})>"
+
+
+class _Node:
+    __slots__ = ("children", "route")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.route: Optional[ProxyRoute] = None
+
+
+class RouteTable:
+    """
+    경로 세그먼트 트라이 기반 라우팅 테이블
+    가장 긴 prefix가 일치하는 라우트를 선택
+    """
+
+    def __init__(self, routes: Iterable[ProxyRoute] = (), passthrough: Optional[Dict[str, Iterable[str]]] = None):
+        self._root = _Node()
+        # 경로 → 개별 핸들러가 처리하는 메서드
+        self._passthrough = {path: frozenset(methods) for path, methods in (passthrough or {}).items()}
+        self.routes: Dict[str, ProxyRoute] = {}
+        for route in routes:
+            self.add(route)
+
+    @classmethod
+    def from_config(
+        cls,
+        service_routes: Dict[str, str],
+        service_urls: Dict[str, str],
+        fallbacks: Optional[Dict[str, FallbackPolicy]] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        passthrough: Optional[Dict[str, Iterable[str]]] = None,
+    ) -> "RouteTable":
+        """
+        설정(prefix → 서비스 이름)으로 라우팅 테이블 생성
+
+        Raises:
+            ValueError: SERVICE_URLS에 없는 서비스를 가리키는 경우
+        """
+        fallbacks = fallbacks or {}
+        cache_ttls = cache_ttls or {}
+        routes = []
+        for prefix, service in service_routes.items():
+            if service not in service_urls:
+                raise ValueError(f"알 수 없는 서비스입니다: {prefix} → {service}")
+            routes.append(ProxyRoute(
+                prefix,
+                service,
+                fallback=fallbacks.get(prefix),
+                cache_ttl=cache_ttls.get(prefix, 0),
+            ))
+        return cls(routes, passthrough=passthrough)
+
+    def add(self, route: ProxyRoute) -> None:
+        node = self._root
+        for segment in route.prefix.split("/")[1:]:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node()
+            node = child
+        node.route = route
+        self.routes[route.prefix] = route
+
+    def resolve(self, path: str, method: Optional[str] = None) -> Optional[Tuple[ProxyRoute, str]]:
+        """
+        경로에 해당하는 라우트 조회
+        개별 핸들러가 처리하는 경로/메서드(passthrough)는 None, 그 외 메서드는 테이블대로 서비스에 전달
+
+        Returns:
+            (라우트, prefix 이후 나머지 경로) 또는 None
+            나머지 경로는 prefix와 정확히 일치하면 "", 하위 경로면 "/..." 형태
+        """
+        passthrough = self._passthrough.get(path)
+        if passthrough is not None and (method is None or method in passthrough):
+            return None
+        node = self._root
+        best = None
+        for segment in path.split("/")[1:]:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.route is not None:
+                best = node.route
+        if best is None:
+            return None
+        return best, path[len(best.prefix):]
+
+
+ProxyEndpoint = Callable[[Request, ProxyRoute, str], Awaitable[Response]]
+
+
+class ProxyDispatchRoute(BaseRoute):
+    """
+    라우팅 테이블 전체를 하나의 ASGI 라우트로 마운트
+    테이블에 없는 경로는 매칭하지 않으므로 뒤에 등록된 개별 라우트가 처리
+    """
+
+    def __init__(self, table: RouteTable, endpoint: ProxyEndpoint):
+        self.table = table
+        self.endpoint = endpoint
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if scope["type"] != "http":
+            return Match.NONE, {}
+        resolved = self.table.resolve(scope["path"], scope["method"])
+        if resolved is None:
+            return Match.NONE, {}
+        route, subpath = resolved
+        child_scope = {"proxy_route": route, "proxy_subpath": subpath}
+        if scope["method"] in route.methods:
+            return Match.FULL, child_scope
+        return Match.PARTIAL, child_scope
+
+    def url_path_for(self, name: str, /, **path_params: Any):
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        route = scope["proxy_route"]
+        if scope["method"] not in route.methods:
+            response = PlainTextResponse(
+                "Method Not Allowed",
+                status_code=405,
+                headers={"Allow": ", ".join(sorted(route.methods))},
+            )
+        else:
+            request = Request(scope, receive)
+            response = await self.endpoint(request, route, scope["proxy_subpath"])
+        await response(scope, receive, send)
+
+    def __repr__(self):
+        return f"<ProxyDispatchRoute(routes={len(self.table.routes)})>"
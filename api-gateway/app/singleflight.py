@@ -0,0 +1,50 @@
+"""
+Single-flight 요청 합치기
+같은 키로 동시에 들어온 작업을 하나만 실행하고 결과를 모든 대기자에게 공유
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    키별 진행 중 작업 관리
+
+    첫 호출자(leader)가 작업을 별도 task로 시작하고, 같은 키의 후속 호출자는
+    그 task 결과를 기다림. 호출자가 취소되어도 작업 자체는 취소되지 않음
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.collapsed = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.collapsed += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 모든 대기자가 취소된 경우에도 예외가 처리되지 않은 채 남지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> dict:
+        return {
+            "leaders": self.leaders,
+            "collapsed": self.collapsed,
+            "inFlight": self.in_flight,
+        }
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+미들웨어 스택 오버헤드 마이크로 벤치마크
+기존 방식(BaseHTTPMiddleware 인증 + 요청 ID/처리 시간)과
+순수 ASGI 미들웨어 스택의 요청당 처리 비용 비교
+
+업스트림 호출 없이 빈 엔드포인트만 두고 미들웨어 비용만 측정
+(두 스택 모두 CORS는 동일하게 가장 바깥에 둠)
+
+실행:
+    cd api-gateway
+    python bench_middleware.py [요청 수]
+"""
+
+import asyncio
+import sys
+import os
+import time
+import uuid
+
+# 앱/shared 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+sys.path.insert(0, os.path.abspath(os.path.join(current_dir, "..")))
+
+import httpx
+from fastapi import FastAPI, HTTPException, Request, status
+from starlette.middleware.base import BaseHTTPMiddleware
+from shared.auth.jwt import create_access_token, verify_token
+from app.middleware import (
+    setup_cors,
+    AuthenticationMiddleware,
+    RequestContextMiddleware,
+    VerifiedTokenCache,
+)
+
+
+class LegacyAuthenticationMiddleware(BaseHTTPMiddleware):
+    """기존 middleware.py의 인증 미들웨어 (요청마다 JWT 디코딩)"""
+
+    async def dispatch(self, request: Request, call_next):
+        authorization = request.headers.get("Authorization")
+        if not authorization:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="인증 토큰이 필요합니다")
+        scheme, token = authorization.split()
+        payload = verify_token(token)
+        if payload is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="인증 토큰이 유효하지 않습니다")
+        request.state.user = payload
+        return await call_next(request)
+
+
+class LegacyRequestContextMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware로 작성한 요청 ID / 처리 시간 미들웨어"""
+
+    async def dispatch(self, request: Request, call_next):
+        started = time.perf_counter()
+        request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        response.headers["X-Response-Time"] = f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        return response
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    if legacy:
+        app.add_middleware(LegacyAuthenticationMiddleware)
+        app.add_middleware(LegacyRequestContextMiddleware)
+    else:
+        app.add_middleware(AuthenticationMiddleware, mode="enforce", cache=VerifiedTokenCache())
+        app.add_middleware(RequestContextMiddleware, slow_request_ms=0)
+    setup_cors(app)
+    return app
+
+
+async def bench(name: str, app: FastAPI, requests: int, headers: dict) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 워밍업
+        for _ in range(50):
+            response = await client.get("/api/ping", headers=headers)
+            assert response.status_code == 200, response.text
+
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/api/ping", headers=headers)
+        elapsed = time.perf_counter() - start
+
+    per_request_us = elapsed / requests * 1_000_000
+    print(f"{name:<20} 요청당 {per_request_us:8.1f} µs")
+    return per_request_us
+
+
+async def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    token = create_access_token({"sub": "bench-user", "role": "spare"})
+    headers = {"Authorization": f"Bearer {token}", "Origin": "http://localhost:3000"}
+
+    print("=" * 50)
+    print(f"미들웨어 스택 비교 (인증 요청 {requests}회)")
+    print("=" * 50)
+
+    legacy = await bench("BaseHTTPMiddleware", build_app(legacy=True), requests, headers)
+    current = await bench("순수 ASGI", build_app(legacy=False), requests, headers)
+    print(f"\n요청당 절감: {legacy - current:.1f} µs ({legacy / current:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
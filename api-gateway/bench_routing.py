@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+라우팅 비용 마이크로 벤치마크
+기존 방식(prefix마다 데코레이터 catch-all 라우트 2개)과
+라우팅 테이블(트라이 단일 라우트)의 요청당 라우트 매칭 비용 비교
+측정 전에 두 방식이 같은 요청을 같은 곳(서비스 전달/개별 핸들러)으로 보내는지 확인
+
+실행:
+    cd api-gateway
+    python bench_routing.py [반복 횟수]
+"""
+
+import sys
+import os
+import time
+
+# 앱/shared 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+sys.path.insert(0, os.path.abspath(os.path.join(current_dir, "..")))
+
+from fastapi import APIRouter, Request
+from starlette.routing import Match
+from app.config import SERVICE_ROUTES
+from app.routes import proxy
+
+# 실제 트래픽과 비슷한 경로 구성 (프록시 경로 위주 + mock 경로 일부)
+SAMPLE_REQUESTS = [
+    ("GET", "/api/jobs"),
+    ("GET", "/api/jobs/3f2b1c9e-0c1d-4b8e-9f7a-2d4c6e8a0b1c"),
+    ("POST", "/api/jobs/3f2b1c9e-0c1d-4b8e-9f7a-2d4c6e8a0b1c/apply"),
+    ("GET", "/api/schedules"),
+    ("GET", "/api/work-check/stats"),
+    ("GET", "/api/chats/abc/messages"),
+    ("GET", "/api/energy/wallet"),
+    ("GET", "/api/store/products"),
+    ("GET", "/api/store/orders/ORDER-000001"),
+    ("GET", "/api/payments"),
+    ("GET", "/api/notifications"),
+    ("GET", "/api/admin/stats"),
+]
+
+# 라우팅 결과만 확인하는 요청 (개별 핸들러가 일부 메서드만 처리하는 경로 등)
+CHECK_REQUESTS = SAMPLE_REQUESTS + [
+    ("POST", "/api/auth/login"),
+    ("GET", "/api/auth/login"),
+    ("PUT", "/api/auth/login"),
+    ("GET", "/api/auth/me"),
+    ("PATCH", "/api/jobs/abc"),
+    ("DELETE", "/api/energy/wallet"),
+]
+
+
+def build_legacy_routes():
+    """기존 proxy.py의 데코레이터 라우트 구성 재현"""
+    legacy = APIRouter()
+
+    async def endpoint(request: Request):
+        return None
+
+    methods = ["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"]
+    legacy.add_api_route("/api/auth/login", endpoint, methods=["POST", "OPTIONS"])
+    for prefix in SERVICE_ROUTES:
+        legacy.add_api_route(prefix + "/{path:path}", endpoint, methods=methods)
+        legacy.add_api_route(prefix, endpoint, methods=methods)
+
+    # 나머지 개별 라우트(mock 등)는 동일
+    return legacy.routes + list(proxy.router.routes)
+
+
+def build_table_routes():
+    """라우팅 테이블 방식 구성 (main.py와 동일한 순서)"""
+    return [proxy.dispatch_route] + list(proxy.router.routes)
+
+
+def match(routes, scope):
+    """Starlette Router와 같은 방식으로 첫 FULL 매치를 찾음"""
+    for route in routes:
+        result, child_scope = route.matches(scope)
+        if result == Match.FULL:
+            return route
+    return None
+
+
+def destination(route):
+    """매칭된 라우트가 요청을 보내는 곳 (서비스 전달이면 "proxy", 개별 핸들러면 그 경로)"""
+    if route is None:
+        return None
+    if route is proxy.dispatch_route or getattr(route, "path", "").endswith("{path:path}"):
+        return "proxy"
+    if getattr(route, "path", None) in SERVICE_ROUTES:
+        return "proxy"
+    return route.path
+
+
+def check_destinations(legacy_routes, table_routes) -> bool:
+    """기존 라우터와 라우팅 테이블의 요청별 목적지 비교"""
+    passed = True
+    for method, path in CHECK_REQUESTS:
+        scope = {"type": "http", "method": method, "path": path, "root_path": ""}
+        expected = destination(match(legacy_routes, dict(scope)))
+        actual = destination(match(table_routes, dict(scope)))
+        if expected != actual:
+            print(f"✗ {method} {path}: 기존 {expected} / 테이블 {actual}")
+            passed = False
+    return passed
+
+
+def bench(name, routes, iterations):
+    scopes = [
+        {"type": "http", "method": method, "path": path, "root_path": ""}
+        for method, path in SAMPLE_REQUESTS
+    ]
+    # 워밍업
+    for scope in scopes:
+        match(routes, dict(scope))
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for scope in scopes:
+            match(routes, dict(scope))
+    elapsed = time.perf_counter() - start
+
+    per_request_us = elapsed / (iterations * len(scopes)) * 1_000_000
+    print(f"{name:<12} 라우트 {len(routes):>3}개  요청당 {per_request_us:8.2f} µs")
+    return per_request_us
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    print("=" * 50)
+    print(f"라우팅 비용 비교 (경로 {len(SAMPLE_REQUESTS)}종 x {iterations}회)")
+    print("=" * 50)
+
+    legacy_routes = build_legacy_routes()
+    table_routes = build_table_routes()
+    if not check_destinations(legacy_routes, table_routes):
+        sys.exit(1)
+    print(f"✓ 요청 {len(CHECK_REQUESTS)}종의 목적지가 기존 라우터와 같습니다\n")
+
+    legacy = bench("기존 라우터", legacy_routes, iterations)
+    table = bench("라우팅 테이블", table_routes, iterations)
+    print(f"\n개선 배율: {legacy / table:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
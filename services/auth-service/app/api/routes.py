@@ -14,6 +14,7 @@ backend_dir = os.path.abspath(os.path.join(current_file, "../../../../"))
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 from shared.database.session import get_db
+from shared.database.offload import run_sync, offload_pool
 from shared.responses.formats import success_response, error_response
 from shared.auth.dependencies import get_current_user_dependency
 from shared.exceptions.app_exceptions import (
@@ -53,7 +54,7 @@ async def register(
     회원가입
     """
     try:
-        user = create_user(db, request)
+        user = await run_sync(create_user, db, request)
         
         # TODO: 에너지 지갑 생성 (spare만) - Energy Service 호출
         # TODO: 구독 생성 (shop만) - Payment Service 호출
@@ -90,7 +91,7 @@ async def login(
     """
     로그인
     """
-    user = authenticate_user(db, request.username, request.password)
+    user = await run_sync(authenticate_user, db, request.username, request.password)
     
     if not user:
         return error_response(
@@ -138,7 +139,7 @@ async def get_current_user_info(
     if not user_id:
         return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
     
-    user = get_user_by_id(db, user_id)
+    user = await run_sync(get_user_by_id, db, user_id)
     if not user:
         return error_response("사용자를 찾을 수 없습니다", "NOT_FOUND", status_code=404)
     
@@ -174,18 +175,18 @@ async def change_password(
     비밀번호 변경
     """
     user_id = current_user.get("user_id") or current_user.get("sub")
-    user = get_user_by_id(db, user_id)
+    user = await run_sync(get_user_by_id, db, user_id)
     
     if not user:
         return error_response("사용자를 찾을 수 없습니다", "NOT_FOUND", status_code=404)
     
     # 현재 비밀번호 확인
     from ..services.auth_service import verify_password
-    if not verify_password(request.current_password, user.password):
+    if not await run_sync(verify_password, request.current_password, user.password):
         return error_response("현재 비밀번호가 올바르지 않습니다", "INVALID_PASSWORD", status_code=400)
     
     # 비밀번호 변경
-    update_user_password(db, user_id, request.new_password)
+    await run_sync(update_user_password, db, user_id, request.new_password)
     
     return success_response({"message": "비밀번호가 변경되었습니다"})
 
@@ -243,4 +244,4 @@ async def health_check():
     """
     헬스 체크
     """
-    return {"status": "ok", "service": "auth-service"}
+    return {"status": "ok", "service": "auth-service", "offload": offload_pool.stats()}
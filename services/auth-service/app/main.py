@@ -25,6 +25,8 @@ from shared.exceptions.handlers import (
     general_exception_handler,
 )
 from shared.exceptions.app_exceptions import AppException
+from shared.database.metrics import db_metrics
+from shared.database.offload import offload_pool
 from .api import routes
 from .config import SERVICE_PORT
 
@@ -64,6 +66,14 @@ async def root():
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """
+    DB 커넥션 풀 / 쿼리 지연 시간 지표
+    """
+    return {**db_metrics.snapshot(), "offload": offload_pool.stats()}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=SERVICE_PORT)
@@ -0,0 +1,12 @@
+-- 커서 페이지네이션용 복합 인덱스 (GET /api/chats?cursor=, GET /api/chats/{id}/messages?cursor=)
+-- 운영 DB에서 테이블 잠금 없이 생성 (트랜잭션 밖에서 실행)
+-- psql "$DATABASE_URL" -f add_keyset_indexes.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chat_shop_created_at_id
+    ON "Chat" ("shopId", "createdAt", id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chat_spare_created_at_id
+    ON "Chat" ("spareId", "createdAt", id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_message_chat_created_at_id
+    ON "Message" ("chatId", "createdAt", id);
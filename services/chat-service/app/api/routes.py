@@ -3,7 +3,7 @@ Chat Service API 라우트
 """
 
 from fastapi import APIRouter, Depends, Query, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 import sys
 import os
@@ -14,7 +14,9 @@ backend_dir = os.path.abspath(os.path.join(current_file, "../../../../"))
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
-from shared.database.session import get_db
+from shared.database.async_session import get_async_db, get_async_read_db
+from shared.database.pagination import split_page
+from shared.schemas.base import PaginationParams
 from shared.responses.formats import success_response, error_response
 from shared.auth.dependencies import get_current_user_dependency
 from shared.exceptions.app_exceptions import NotFoundException, ConflictException, AuthorizationException
@@ -36,17 +38,25 @@ router = APIRouter()
 async def get_chats(
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (빈 값이면 첫 페이지, 이후 next_cursor)"),
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """채팅방 목록 조회"""
+    page = PaginationParams(limit=limit, cursor=cursor)
+    after = page.after()
     try:
         user_id = current_user.get("user_id") or current_user.get("sub")
         role = current_user.get("role")
         if not user_id or not role:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        chats = get_chats_service(db, user_id, role, limit=limit, offset=offset)
+        chats = await get_chats_service(
+            db, user_id, role, limit=limit, offset=offset, keyset=page.is_cursor, after=after
+        )
+        next_cursor = None
+        if page.is_cursor:
+            chats, next_cursor = split_page(chats, limit)
         
         chats_data = []
         for chat in chats:
@@ -60,6 +70,8 @@ async def get_chats(
                 "updated_at": chat.updated_at.isoformat(),
             })
         
+        if page.is_cursor:
+            return success_response({"chats": chats_data, "next_cursor": next_cursor})
         return success_response({"chats": chats_data})
     except Exception as e:
         import traceback
@@ -78,10 +90,10 @@ async def get_chats(
 
 
 @router.get("/api/chats/{chat_id}")
-async def get_chat(chat_id: str, db: Session = Depends(get_db)):
+async def get_chat(chat_id: str, db: AsyncSession = Depends(get_async_read_db)):
     """채팅방 상세 조회"""
     try:
-        chat = get_chat_by_id(db, chat_id)
+        chat = await get_chat_by_id(db, chat_id)
         if not chat:
             return error_response("채팅방을 찾을 수 없습니다", "NOT_FOUND", status_code=404)
         
@@ -105,24 +117,32 @@ async def get_messages(
     chat_id: str,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (빈 값이면 첫 페이지, 이후 next_cursor)"),
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """메시지 목록 조회"""
+    page = PaginationParams(limit=limit, cursor=cursor)
+    after = page.after()
     try:
         user_id = current_user.get("user_id") or current_user.get("sub")
         if not user_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
         # 채팅방 권한 확인
-        chat = get_chat_by_id(db, chat_id)
+        chat = await get_chat_by_id(db, chat_id)
         if not chat:
             return error_response("채팅방을 찾을 수 없습니다", "NOT_FOUND", status_code=404)
         
         if chat.shop_id != user_id and chat.spare_id != user_id:
             return error_response("채팅방에 접근할 권한이 없습니다", "FORBIDDEN", status_code=403)
         
-        messages = get_messages_service(db, chat_id, limit=limit, offset=offset)
+        messages = await get_messages_service(
+            db, chat_id, limit=limit, offset=offset, keyset=page.is_cursor, after=after
+        )
+        next_cursor = None
+        if page.is_cursor:
+            messages, next_cursor = split_page(messages, limit)
         
         messages_data = []
         for message in messages:
@@ -136,6 +156,8 @@ async def get_messages(
                 "created_at": message.created_at.isoformat(),
             })
         
+        if page.is_cursor:
+            return success_response({"messages": messages_data, "next_cursor": next_cursor})
         return success_response({"messages": messages_data})
     except Exception as e:
         return error_response("메시지 조회 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
@@ -146,7 +168,7 @@ async def send_message(
     chat_id: str,
     message_data: MessageCreate,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """메시지 전송"""
     try:
@@ -154,7 +176,7 @@ async def send_message(
         if not sender_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        message = send_message_service(db, chat_id, sender_id, message_data)
+        message = await send_message_service(db, chat_id, sender_id, message_data)
         
         message_response = {
             "id": message.id,
@@ -179,7 +201,7 @@ async def send_message(
 async def mark_read(
     chat_id: str,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """메시지 읽음 처리"""
     try:
@@ -187,7 +209,7 @@ async def mark_read(
         if not user_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        count = mark_messages_as_read(db, chat_id, user_id)
+        count = await mark_messages_as_read(db, chat_id, user_id)
         
         return success_response({"read_count": count})
     except NotFoundException as e:
@@ -202,7 +224,7 @@ async def mark_read(
 async def delete_chat_endpoint(
     chat_id: str,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """채팅방 삭제"""
     try:
@@ -210,7 +232,7 @@ async def delete_chat_endpoint(
         if not user_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        delete_chat_service(db, chat_id, user_id)
+        await delete_chat_service(db, chat_id, user_id)
         
         return success_response({"message": "채팅방이 삭제되었습니다"})
     except NotFoundException as e:
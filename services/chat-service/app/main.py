@@ -15,6 +15,7 @@ if backend_dir not in sys.path:
 
 from shared.exceptions.handlers import app_exception_handler, general_exception_handler
 from shared.exceptions.app_exceptions import AppException
+from shared.database.metrics import db_metrics
 from .api import routes
 from .config import SERVICE_PORT
 
@@ -58,6 +59,14 @@ async def health():
     return {"status": "ok", "service": "chat-service"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """
+    DB 커넥션 풀 / 쿼리 지연 시간 지표
+    """
+    return db_metrics.snapshot()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=SERVICE_PORT)
@@ -34,6 +34,8 @@ class Chat(Base):
         Index("idx_chat_shop_id", "shopId"),
         Index("idx_chat_spare_id", "spareId"),
         Index("idx_chat_last_message_at", "lastMessageAt"),
+        Index("idx_chat_shop_created_at_id", "shopId", "createdAt", "id"),  # 커서 페이지네이션
+        Index("idx_chat_spare_created_at_id", "spareId", "createdAt", "id"),
     )
 
 
@@ -54,4 +56,5 @@ class Message(Base):
         Index("idx_message_sender_id", "senderId"),
         Index("idx_message_is_read", "isRead"),
         Index("idx_message_created_at", "createdAt"),
+        Index("idx_message_chat_created_at_id", "chatId", "createdAt", "id"),  # 커서 페이지네이션
     )
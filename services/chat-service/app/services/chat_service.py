@@ -2,8 +2,9 @@
 Chat Service 비즈니스 로직
 """
 
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from typing import Optional, List, Tuple
 from datetime import datetime
 import sys
 import os
@@ -15,43 +16,58 @@ if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
 from shared.exceptions.app_exceptions import NotFoundException, ConflictException, AuthorizationException
+from shared.database.pagination import keyset_query
 from ..models.chat import Chat, Message
 from ..schemas.chat import MessageCreate
 
 
-def get_chats(
-    db: Session,
+async def get_chats(
+    db: AsyncSession,
     user_id: str,
     role: str,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    keyset: bool = False,
+    after: Optional[Tuple[datetime, str]] = None
 ) -> List[Chat]:
-    """채팅방 목록 조회"""
-    query = db.query(Chat)
+    """
+    채팅방 목록 조회
+    
+    keyset=True면 최근 메시지 순서 대신 (createdAt, id) 커서 조건으로 after 다음부터 limit + 1개 조회
+    """
+    query = select(Chat)
     
     if role == "spare":
-        query = query.filter(Chat.spare_id == user_id)
+        query = query.where(Chat.spare_id == user_id)
     elif role == "shop":
-        query = query.filter(Chat.shop_id == user_id)
+        query = query.where(Chat.shop_id == user_id)
     else:
         return []
     
-    return query.order_by(Chat.last_message_at.desc().nulls_last(), Chat.created_at.desc()).limit(limit).offset(offset).all()
+    if keyset:
+        query = keyset_query(query, Chat.created_at, Chat.id, after, limit)
+    else:
+        query = query.order_by(Chat.last_message_at.desc().nulls_last(), Chat.created_at.desc()).limit(limit).offset(offset)
+    result = await db.execute(query)
+    return list(result.scalars().all())
 
 
-def get_chat_by_id(db: Session, chat_id: str) -> Optional[Chat]:
+async def get_chat_by_id(db: AsyncSession, chat_id: str) -> Optional[Chat]:
     """ID로 채팅방 조회"""
-    return db.query(Chat).filter(Chat.id == chat_id).first()
+    return await db.get(Chat, chat_id)
 
 
-def get_or_create_chat(db: Session, job_id: str, shop_id: str, spare_id: str) -> Chat:
+async def get_or_create_chat(db: AsyncSession, job_id: str, shop_id: str, spare_id: str) -> Chat:
     """채팅방 조회 또는 생성"""
     # 기존 채팅방 확인
-    chat = db.query(Chat).filter(
-        Chat.job_id == job_id,
-        Chat.shop_id == shop_id,
-        Chat.spare_id == spare_id
-    ).first()
+    result = await db.execute(
+        select(Chat).where(
+            Chat.job_id == job_id,
+            Chat.shop_id == shop_id,
+            Chat.spare_id == spare_id
+        )
+    )
+    chat = result.scalars().first()
     
     if chat:
         return chat
@@ -64,28 +80,38 @@ def get_or_create_chat(db: Session, job_id: str, shop_id: str, spare_id: str) ->
     )
     
     db.add(chat)
-    db.commit()
-    db.refresh(chat)
+    await db.commit()
+    await db.refresh(chat)
     
     return chat
 
 
-def get_messages(
-    db: Session,
+async def get_messages(
+    db: AsyncSession,
     chat_id: str,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    keyset: bool = False,
+    after: Optional[Tuple[datetime, str]] = None
 ) -> List[Message]:
-    """메시지 목록 조회"""
-    return db.query(Message).filter(
-        Message.chat_id == chat_id
-    ).order_by(Message.created_at.desc()).limit(limit).offset(offset).all()
+    """
+    메시지 목록 조회
+    
+    keyset=True면 OFFSET 대신 (createdAt, id) 커서 조건으로 after 다음부터 limit + 1개 조회
+    """
+    query = select(Message).where(Message.chat_id == chat_id)
+    if keyset:
+        query = keyset_query(query, Message.created_at, Message.id, after, limit)
+    else:
+        query = query.order_by(Message.created_at.desc()).limit(limit).offset(offset)
+    result = await db.execute(query)
+    return list(result.scalars().all())
 
 
-def send_message(db: Session, chat_id: str, sender_id: str, message_data: MessageCreate) -> Message:
+async def send_message(db: AsyncSession, chat_id: str, sender_id: str, message_data: MessageCreate) -> Message:
     """메시지 전송"""
     # 채팅방 확인
-    chat = get_chat_by_id(db, chat_id)
+    chat = await get_chat_by_id(db, chat_id)
     if not chat:
         raise NotFoundException("채팅방을 찾을 수 없습니다")
     
@@ -107,16 +133,16 @@ def send_message(db: Session, chat_id: str, sender_id: str, message_data: Messag
     # 채팅방의 마지막 메시지 시간 업데이트
     chat.last_message_at = datetime.now()
     
-    db.commit()
-    db.refresh(message)
+    await db.commit()
+    await db.refresh(message)
     
     return message
 
 
-def mark_messages_as_read(db: Session, chat_id: str, user_id: str) -> int:
+async def mark_messages_as_read(db: AsyncSession, chat_id: str, user_id: str) -> int:
     """메시지를 읽음으로 표시"""
     # 채팅방 확인
-    chat = get_chat_by_id(db, chat_id)
+    chat = await get_chat_by_id(db, chat_id)
     if not chat:
         raise NotFoundException("채팅방을 찾을 수 없습니다")
     
@@ -125,20 +151,22 @@ def mark_messages_as_read(db: Session, chat_id: str, user_id: str) -> int:
         raise AuthorizationException("메시지를 읽을 권한이 없습니다")
     
     # 자신이 보낸 메시지가 아닌 메시지만 읽음 처리
-    updated = db.query(Message).filter(
-        Message.chat_id == chat_id,
-        Message.sender_id != user_id,
-        Message.is_read == False
-    ).update({"is_read": True})
+    result = await db.execute(
+        update(Message).where(
+            Message.chat_id == chat_id,
+            Message.sender_id != user_id,
+            Message.is_read == False
+        ).values(is_read=True)
+    )
     
-    db.commit()
+    await db.commit()
     
-    return updated
+    return result.rowcount
 
 
-def delete_chat(db: Session, chat_id: str, user_id: str) -> None:
+async def delete_chat(db: AsyncSession, chat_id: str, user_id: str) -> None:
     """채팅방 삭제"""
-    chat = get_chat_by_id(db, chat_id)
+    chat = await get_chat_by_id(db, chat_id)
     if not chat:
         raise NotFoundException("채팅방을 찾을 수 없습니다")
     
@@ -146,5 +174,5 @@ def delete_chat(db: Session, chat_id: str, user_id: str) -> None:
     if chat.shop_id != user_id and chat.spare_id != user_id:
         raise AuthorizationException("채팅방을 삭제할 권한이 없습니다")
     
-    db.delete(chat)
-    db.commit()
+    await db.delete(chat)
+    await db.commit()
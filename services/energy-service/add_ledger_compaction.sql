@@ -0,0 +1,20 @@
+-- 장부 정리/대사 (app/services/ledger_maintenance.py)
+-- psql "$DATABASE_URL" -f add_ledger_compaction.sql
+
+-- 지갑별 월 거래 요약 (오래된 정산 완료 거래를 합친 결과)
+CREATE TABLE IF NOT EXISTS "EnergyLedgerSummary" (
+    "walletId"         TEXT NOT NULL REFERENCES "EnergyWallet"("id") ON DELETE CASCADE,
+    "month"            TEXT NOT NULL,
+    "availableAmount"  INTEGER NOT NULL DEFAULT 0,
+    "returnedAmount"   INTEGER NOT NULL DEFAULT 0,
+    "forfeitedAmount"  INTEGER NOT NULL DEFAULT 0,
+    "transactionCount" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt"        TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY ("walletId", "month")
+);
+
+-- 반환/몰수 시 잠금 거래 조회 (walletId, jobId, state = 'locked')
+-- 잠금 중인 거래만 담는 부분 인덱스, 운영 중 테이블 잠금 없이 생성
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_energy_transaction_locked
+    ON "EnergyTransaction" ("walletId", "jobId")
+    WHERE "state" = 'locked';
@@ -2,8 +2,8 @@
 Energy Service API 라우트
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, Query, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 import sys
 import os
@@ -14,13 +14,16 @@ backend_dir = os.path.abspath(os.path.join(current_file, "../../../../"))
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
-from shared.database.session import get_db
+from shared.database.async_session import get_async_db, get_async_read_db
+from shared.database.pagination import split_page
+from shared.schemas.base import PaginationParams
 from shared.responses.formats import success_response, error_response
 from shared.auth.dependencies import get_current_user_dependency
 from shared.exceptions.app_exceptions import NotFoundException, ConflictException, AuthorizationException
 from ..schemas.energy import EnergyPurchaseRequest
 from ..services.energy_service import (
     get_energy_wallet as get_energy_wallet_service,
+    get_wallet_balance,
     get_energy_transactions as get_energy_transactions_service,
     purchase_energy,
     lock_energy_for_job,
@@ -28,6 +31,7 @@ from ..services.energy_service import (
     forfeit_energy_for_job,
     get_no_show_history,
 )
+from ..services.idempotency import IDEMPOTENCY_HEADER, idempotency_store
 
 router = APIRouter()
 
@@ -35,7 +39,7 @@ router = APIRouter()
 @router.get("/api/energy/wallet")
 async def get_wallet(
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """에너지 지갑 조회"""
     try:
@@ -43,13 +47,13 @@ async def get_wallet(
         if not user_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        wallet = get_energy_wallet_service(db, user_id)
+        wallet = await get_energy_wallet_service(db, user_id)
         
         # 거래 내역 조회
-        transactions = get_energy_transactions_service(db, wallet.id, limit=50)
+        transactions = await get_energy_transactions_service(db, wallet.id, limit=50)
         
         # 노쇼 이력 조회
-        no_show_history = get_no_show_history(db, wallet.id, limit=10)
+        no_show_history = await get_no_show_history(db, wallet.id, limit=10)
         
         wallet_data = {
             "id": wallet.id,
@@ -96,88 +100,86 @@ async def get_wallet(
         )
 
 
-@router.post("/api/energy/purchase")
-async def purchase(
-    request: EnergyPurchaseRequest,
+@router.get("/api/energy/balance")
+async def get_balance(
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """에너지 구매"""
+    """
+    에너지 잔액 조회 (폴링용)
+    지갑 조회와 달리 거래/노쇼 이력 없이 잔액만, 사용자별 캐시에서 응답
+    """
     try:
         user_id = current_user.get("user_id") or current_user.get("sub")
         if not user_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        wallet = get_energy_wallet_service(db, user_id)
-        transaction = purchase_energy(db, wallet.id, request.amount)
+        balance = await get_wallet_balance(db, user_id)
         
-        transaction_data = {
-            "id": transaction.id,
-            "wallet_id": transaction.wallet_id,
-            "job_id": transaction.job_id,
-            "amount": transaction.amount,
-            "state": transaction.state,
-            "timestamp": transaction.timestamp.isoformat(),
-        }
-        
-        return success_response(transaction_data, status_code=201)
-    except NotFoundException as e:
-        return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
+        return success_response({
+            "wallet_id": balance["wallet_id"],
+            "balance": balance["balance"],
+            "updated_at": balance["updated_at"].isoformat(),
+        })
     except Exception as e:
-        return error_response("에너지 구매 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+        return error_response("에너지 잔액 조회 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
 
 
-@router.post("/api/energy/lock")
-async def lock(
-    job_id: str,
-    amount: int,
+@router.get("/api/energy/transactions")
+async def get_transactions(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="커서 (생략/빈 값이면 첫 페이지, 이후 next_cursor)"),
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """에너지 잠금 (공고 지원 시)"""
+    """에너지 거래 내역 조회 (최신순, 커서 페이지네이션)"""
+    page = PaginationParams(limit=limit, cursor=cursor or "")
+    after = page.after()
     try:
         user_id = current_user.get("user_id") or current_user.get("sub")
         if not user_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        wallet = get_energy_wallet_service(db, user_id)
-        transaction = lock_energy_for_job(db, wallet.id, job_id, amount)
+        wallet = await get_energy_wallet_service(db, user_id)
+        transactions = await get_energy_transactions_service(
+            db, wallet.id, limit=limit, keyset=True, after=after
+        )
+        transactions, next_cursor = split_page(transactions, limit, created_attr="timestamp")
         
-        transaction_data = {
-            "id": transaction.id,
-            "wallet_id": transaction.wallet_id,
-            "job_id": transaction.job_id,
-            "amount": transaction.amount,
-            "state": transaction.state,
-            "timestamp": transaction.timestamp.isoformat(),
-        }
+        transactions_data = [
+            {
+                "id": tx.id,
+                "wallet_id": tx.wallet_id,
+                "job_id": tx.job_id,
+                "amount": tx.amount,
+                "state": tx.state,
+                "timestamp": tx.timestamp.isoformat(),
+            }
+            for tx in transactions
+        ]
         
-        return success_response(transaction_data, status_code=201)
-    except NotFoundException as e:
-        return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
-    except ConflictException as e:
-        return error_response(e.message, e.code or "CONFLICT", status_code=409)
+        return success_response({"transactions": transactions_data, "next_cursor": next_cursor})
     except Exception as e:
-        return error_response("에너지 잠금 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+        return error_response("에너지 거래 내역 조회 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
 
 
-@router.post("/api/energy/return")
-async def return_energy(
-    job_id: str,
-    amount: int,
+@router.post("/api/energy/purchase")
+async def purchase(
+    request: EnergyPurchaseRequest,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
 ):
-    """에너지 반환 (근무 완료 시)"""
-    try:
-        user_id = current_user.get("user_id") or current_user.get("sub")
-        if not user_id:
-            return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
-        
-        wallet = get_energy_wallet_service(db, user_id)
-        transaction = return_energy_for_job(db, wallet.id, job_id, amount)
-        
-        if transaction:
+    """에너지 구매 (Idempotency-Key 헤더가 있으면 같은 키의 재요청에 처음 응답을 그대로 반환)"""
+    user_id = current_user.get("user_id") or current_user.get("sub")
+    if not user_id:
+        return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
+    
+    async def handle():
+        try:
+            wallet = await get_energy_wallet_service(db, user_id)
+            transaction = await purchase_energy(db, wallet.id, request.amount)
+            
             transaction_data = {
                 "id": transaction.id,
                 "wallet_id": transaction.wallet_id,
@@ -186,32 +188,36 @@ async def return_energy(
                 "state": transaction.state,
                 "timestamp": transaction.timestamp.isoformat(),
             }
-            return success_response(transaction_data)
-        else:
-            return success_response({"message": "에너지가 반환되었습니다"})
-    except NotFoundException as e:
-        return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
-    except Exception as e:
-        return error_response("에너지 반환 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+            
+            return success_response(transaction_data, status_code=201)
+        except NotFoundException as e:
+            return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
+        except Exception as e:
+            return error_response("에너지 구매 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+    
+    return await idempotency_store.run(
+        db, user_id, idempotency_key, {"path": "/api/energy/purchase", "amount": request.amount}, handle
+    )
 
 
-@router.post("/api/energy/forfeit")
-async def forfeit(
+@router.post("/api/energy/lock")
+async def lock(
     job_id: str,
     amount: int,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
 ):
-    """에너지 몰수 (노쇼 시)"""
-    try:
-        user_id = current_user.get("user_id") or current_user.get("sub")
-        if not user_id:
-            return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
-        
-        wallet = get_energy_wallet_service(db, user_id)
-        transaction = forfeit_energy_for_job(db, wallet.id, job_id, amount)
-        
-        if transaction:
+    """에너지 잠금 (공고 지원 시, Idempotency-Key 지원)"""
+    user_id = current_user.get("user_id") or current_user.get("sub")
+    if not user_id:
+        return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
+    
+    async def handle():
+        try:
+            wallet = await get_energy_wallet_service(db, user_id)
+            transaction = await lock_energy_for_job(db, wallet.id, job_id, amount)
+            
             transaction_data = {
                 "id": transaction.id,
                 "wallet_id": transaction.wallet_id,
@@ -220,10 +226,95 @@ async def forfeit(
                 "state": transaction.state,
                 "timestamp": transaction.timestamp.isoformat(),
             }
-            return success_response(transaction_data)
-        else:
-            return success_response({"message": "에너지가 몰수되었습니다"})
-    except NotFoundException as e:
-        return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
-    except Exception as e:
-        return error_response("에너지 몰수 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+            
+            return success_response(transaction_data, status_code=201)
+        except NotFoundException as e:
+            return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
+        except ConflictException as e:
+            return error_response(e.message, e.code or "CONFLICT", status_code=409)
+        except Exception as e:
+            return error_response("에너지 잠금 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+    
+    return await idempotency_store.run(
+        db, user_id, idempotency_key, {"path": "/api/energy/lock", "job_id": job_id, "amount": amount}, handle
+    )
+
+
+@router.post("/api/energy/return")
+async def return_energy(
+    job_id: str,
+    amount: int,
+    current_user: dict = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_async_db),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
+):
+    """에너지 반환 (근무 완료 시, Idempotency-Key 지원)"""
+    user_id = current_user.get("user_id") or current_user.get("sub")
+    if not user_id:
+        return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
+    
+    async def handle():
+        try:
+            wallet = await get_energy_wallet_service(db, user_id)
+            transaction = await return_energy_for_job(db, wallet.id, job_id, amount)
+            
+            if transaction:
+                transaction_data = {
+                    "id": transaction.id,
+                    "wallet_id": transaction.wallet_id,
+                    "job_id": transaction.job_id,
+                    "amount": transaction.amount,
+                    "state": transaction.state,
+                    "timestamp": transaction.timestamp.isoformat(),
+                }
+                return success_response(transaction_data)
+            else:
+                return success_response({"message": "에너지가 반환되었습니다"})
+        except NotFoundException as e:
+            return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
+        except Exception as e:
+            return error_response("에너지 반환 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+    
+    return await idempotency_store.run(
+        db, user_id, idempotency_key, {"path": "/api/energy/return", "job_id": job_id, "amount": amount}, handle
+    )
+
+
+@router.post("/api/energy/forfeit")
+async def forfeit(
+    job_id: str,
+    amount: int,
+    current_user: dict = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_async_db),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
+):
+    """에너지 몰수 (노쇼 시, Idempotency-Key 지원)"""
+    user_id = current_user.get("user_id") or current_user.get("sub")
+    if not user_id:
+        return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
+    
+    async def handle():
+        try:
+            wallet = await get_energy_wallet_service(db, user_id)
+            transaction = await forfeit_energy_for_job(db, wallet.id, job_id, amount)
+            
+            if transaction:
+                transaction_data = {
+                    "id": transaction.id,
+                    "wallet_id": transaction.wallet_id,
+                    "job_id": transaction.job_id,
+                    "amount": transaction.amount,
+                    "state": transaction.state,
+                    "timestamp": transaction.timestamp.isoformat(),
+                }
+                return success_response(transaction_data)
+            else:
+                return success_response({"message": "에너지가 몰수되었습니다"})
+        except NotFoundException as e:
+            return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
+        except Exception as e:
+            return error_response("에너지 몰수 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+    
+    return await idempotency_store.run(
+        db, user_id, idempotency_key, {"path": "/api/energy/forfeit", "job_id": job_id, "amount": amount}, handle
+    )
@@ -22,3 +22,25 @@ SERVICE_PORT = int(os.getenv("SERVICE_PORT", "8106"))
 # 다른 서비스 URL (로컬 개발용)
 AUTH_SERVICE_URL = os.getenv("AUTH_SERVICE_URL", "http://localhost:8101")
 JOB_SERVICE_URL = os.getenv("JOB_SERVICE_URL", "http://localhost:8103")
+
+# 멱등성 키 (Idempotency-Key 헤더)
+# 성공 응답 보관 시간(초) - 같은 키로 다시 오면 처리 없이 보관한 응답을 반환
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+# 프로세스 메모리에 둘 최근 응답 수 (LRU)
+IDEMPOTENCY_CACHE_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000"))
+# 만료된 키 삭제 주기(초)
+IDEMPOTENCY_PURGE_SECONDS = int(os.getenv("IDEMPOTENCY_PURGE_SECONDS", "3600"))
+
+# 잔액 캐시 (GET /api/energy/balance)
+# 이 워커의 잠금/반환/구매는 즉시 무효화, 다른 워커에서 바뀐 잔액은 이 시간(초) 안에 반영
+BALANCE_CACHE_TTL_SECONDS = float(os.getenv("BALANCE_CACHE_TTL_SECONDS", "10"))
+BALANCE_CACHE_SIZE = int(os.getenv("BALANCE_CACHE_SIZE", "10000"))
+
+# 장부 정리/대사 작업 (ledger_maintenance)
+LEDGER_MAINTENANCE_ENABLED = os.getenv("LEDGER_MAINTENANCE_ENABLED", "true").lower() == "true"
+# 실행 주기(초)
+LEDGER_MAINTENANCE_SECONDS = int(os.getenv("LEDGER_MAINTENANCE_SECONDS", "21600"))
+# 이 일수보다 오래된 정산 완료 거래(잠금 중 제외)를 지갑별 월 요약으로 합침
+LEDGER_COMPACT_AFTER_DAYS = int(os.getenv("LEDGER_COMPACT_AFTER_DAYS", "90"))
+# 한 번에 처리할 지갑 수
+LEDGER_MAINTENANCE_BATCH_SIZE = int(os.getenv("LEDGER_MAINTENANCE_BATCH_SIZE", "500"))
@@ -2,6 +2,8 @@
 Energy Service 메인 애플리케이션
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import sys
@@ -15,13 +17,41 @@ if backend_dir not in sys.path:
 
 from shared.exceptions.handlers import app_exception_handler, general_exception_handler
 from shared.exceptions.app_exceptions import AppException
+from shared.database.metrics import db_metrics
+from shared.database.async_session import AsyncSessionLocal
 from .api import routes
-from .config import SERVICE_PORT
+from .config import SERVICE_PORT, IDEMPOTENCY_PURGE_SECONDS, LEDGER_MAINTENANCE_ENABLED, LEDGER_MAINTENANCE_SECONDS
+from .services.idempotency import idempotency_store
+from .services.balance_cache import balance_cache
+from .services.ledger_maintenance import ledger_maintenance
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명 주기
+    만료된 멱등성 키 삭제, 장부 정리/대사를 주기적으로 실행하는 백그라운드 태스크
+    """
+    tasks = [asyncio.create_task(idempotency_store.run_purge(AsyncSessionLocal, IDEMPOTENCY_PURGE_SECONDS))]
+    if LEDGER_MAINTENANCE_ENABLED:
+        tasks.append(asyncio.create_task(ledger_maintenance.run(AsyncSessionLocal, LEDGER_MAINTENANCE_SECONDS)))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
 
 app = FastAPI(
     title="HairSpare Energy Service",
     description="에너지(예약금) 서비스",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -58,6 +88,19 @@ async def health():
     return {"status": "ok", "service": "energy-service"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """
+    DB 커넥션 풀 / 쿼리 지연 시간 / 멱등성 키 / 잔액 캐시 / 장부 정리·대사 지표
+    """
+    return {
+        **db_metrics.snapshot(),
+        "idempotency": idempotency_store.stats(),
+        "balanceCache": balance_cache.stats(),
+        "ledgerMaintenance": ledger_maintenance.stats(),
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=SERVICE_PORT)
@@ -2,6 +2,6 @@
 Energy Service 모델
 """
 
-from .energy import EnergyWallet, EnergyTransaction, NoShowHistory
+from .energy import EnergyWallet, EnergyTransaction, NoShowHistory, IdempotencyKey, EnergyLedgerSummary
 
-__all__ = ["EnergyWallet", "EnergyTransaction", "NoShowHistory"]
+__all__ = ["EnergyWallet", "EnergyTransaction", "NoShowHistory", "IdempotencyKey", "EnergyLedgerSummary"]
@@ -3,7 +3,7 @@ Energy 관련 모델
 """
 
 import uuid
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Index, Text, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import sys
@@ -48,6 +48,11 @@ class EnergyTransaction(Base):
         Index("idx_energy_transaction_job_id", "jobId"),
         Index("idx_energy_transaction_state", "state"),
         Index("idx_energy_transaction_timestamp", "timestamp"),
+        # 지갑별 거래 내역 커서 페이지네이션 (GET /api/energy/transactions)
+        Index("idx_energy_transaction_wallet_timestamp_id", "walletId", "timestamp", "id"),
+        # 반환/몰수 시 잠금 거래 조회 (walletId, jobId, state = 'locked')
+        # 잠금 중인 거래만 담는 부분 인덱스라 거래 내역이 늘어도 작게 유지
+        Index("idx_energy_transaction_locked", "walletId", "jobId", postgresql_where=(state == "locked")),
     )
 
 
@@ -64,3 +69,39 @@ class NoShowHistory(Base):
         Index("idx_no_show_history_wallet_id", "walletId"),
         Index("idx_no_show_history_job_id", "jobId"),
     )
+
+
+class IdempotencyKey(Base):
+    """
+    Idempotency-Key 헤더로 처리한 요청 (서비스 간 재시도 중복 방지)
+    장부 변경과 같은 트랜잭션에서 응답과 함께 커밋하며, 같은 키로 다시 오면 그 응답을 그대로 재사용
+    """
+    __tablename__ = "IdempotencyKey"
+    
+    user_id = Column("userId", String, primary_key=True)
+    key = Column("key", String, primary_key=True)
+    request_hash = Column("requestHash", String, nullable=False)  # 같은 키로 다른 요청을 보냈는지 확인
+    status_code = Column("statusCode", Integer, nullable=True)
+    response_body = Column("responseBody", Text, nullable=True)
+    created_at = Column("createdAt", DateTime, server_default=func.now(), nullable=False)
+    expires_at = Column("expiresAt", DateTime, nullable=False)
+    
+    __table_args__ = (
+        Index("idx_idempotency_key_expires_at", "expiresAt"),
+    )
+
+
+class EnergyLedgerSummary(Base):
+    """
+    지갑별 월 거래 요약 (오래된 정산 완료 거래를 합친 결과)
+    상태별 금액 합계를 그대로 보관하므로 대사 시 남은 거래와 같은 식으로 합산
+    """
+    __tablename__ = "EnergyLedgerSummary"
+    
+    wallet_id = Column("walletId", String, ForeignKey("EnergyWallet.id", ondelete="CASCADE"), primary_key=True)
+    month = Column("month", String, primary_key=True)  # "YYYY-MM"
+    available_amount = Column("availableAmount", Integer, default=0, nullable=False)
+    returned_amount = Column("returnedAmount", Integer, default=0, nullable=False)
+    forfeited_amount = Column("forfeitedAmount", Integer, default=0, nullable=False)
+    transaction_count = Column("transactionCount", Integer, default=0, nullable=False)
+    updated_at = Column("updatedAt", DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -4,6 +4,7 @@ Energy Service 비즈니스 로직
 
 from .energy_service import (
     get_energy_wallet,
+    get_wallet_balance,
     get_energy_transactions,
     purchase_energy,
     lock_energy_for_job,
@@ -14,6 +15,7 @@ from .energy_service import (
 
 __all__ = [
     "get_energy_wallet",
+    "get_wallet_balance",
     "get_energy_transactions",
     "purchase_energy",
     "lock_energy_for_job",
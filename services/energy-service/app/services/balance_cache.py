@@ -0,0 +1,90 @@
+"""
+사용자별 에너지 잔액 캐시 (메모리, 프로세스 단위)
+앱이 자주 폴링하는 GET /api/energy/balance를 DB 조회 없이 응답
+
+- 최근 조회한 사용자의 (지갑 ID, 잔액)을 LRU로 BALANCE_CACHE_TTL_SECONDS 동안 보관
+- 장부 변경(energy_service._run_ledger)이 커밋되면 해당 지갑 항목을 바로 무효화
+- 조회 도중 무효화된 지갑은 캐시에 넣지 않음 (무효화 순번 비교)
+  → 변경 전에 읽은 잔액이 변경 후에 캐시에 들어가 TTL 동안 남는 일이 없음
+"""
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from ..config import BALANCE_CACHE_TTL_SECONDS, BALANCE_CACHE_SIZE
+
+# (지갑 ID, 잔액, 지갑 수정 시각, 만료 시각(time.monotonic 기준))
+CachedBalance = Tuple[str, int, datetime, float]
+
+
+class BalanceCache:
+    """사용자별 잔액 LRU + TTL, 지갑 단위 무효화"""
+
+    def __init__(self, ttl_seconds: float = BALANCE_CACHE_TTL_SECONDS, max_entries: int = BALANCE_CACHE_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedBalance]" = OrderedDict()
+        self._users_by_wallet: Dict[str, str] = {}
+        # 지갑별 마지막 무효화 순번 (최근 max_entries개, 밀려난 순번 중 최댓값은 _floor)
+        self._sequence = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._floor = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, user_id: str) -> Optional[CachedBalance]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[3] <= time.monotonic():
+            if entry is not None:
+                self._drop(user_id)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry
+
+    def begin(self) -> int:
+        """DB 조회 시작 전 순번 (put에 그대로 전달)"""
+        return self._sequence
+
+    def put(self, user_id: str, wallet_id: str, balance: int, updated_at: datetime, sequence: int) -> None:
+        """begin() 이후 이 지갑이 무효화되지 않았을 때만 저장"""
+        if self.max_entries <= 0 or self._invalidated.get(wallet_id, self._floor) > sequence:
+            return
+        self._entries[user_id] = (wallet_id, balance, updated_at, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(user_id)
+        self._users_by_wallet[wallet_id] = user_id
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def invalidate(self, wallet_id: str) -> None:
+        """지갑 잔액이 바뀜 (장부 변경 커밋 후 호출)"""
+        self._sequence += 1
+        self._invalidated[wallet_id] = self._sequence
+        self._invalidated.move_to_end(wallet_id)
+        while len(self._invalidated) > max(self.max_entries, 1):
+            _, sequence = self._invalidated.popitem(last=False)
+            self._floor = max(self._floor, sequence)
+        user_id = self._users_by_wallet.get(wallet_id)
+        if user_id is not None:
+            self._drop(user_id)
+        self.invalidations += 1
+
+    def _drop(self, user_id: str) -> None:
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            self._users_by_wallet.pop(entry[0], None)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+# 프로세스 공용 캐시
+balance_cache = BalanceCache()
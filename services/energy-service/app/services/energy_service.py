@@ -2,11 +2,13 @@
 Energy Service 비즈니스 로직
 """
 
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import String, func, insert, literal, select, update
+from typing import Callable, Optional, List, Tuple
 from datetime import datetime
 import sys
 import os
+import uuid
 
 # shared 라이브러리 경로 추가
 current_file = os.path.abspath(__file__)
@@ -15,12 +17,16 @@ if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
 from shared.exceptions.app_exceptions import NotFoundException, ConflictException, AuthorizationException
+from shared.database.pagination import keyset_query
 from ..models.energy import EnergyWallet, EnergyTransaction, NoShowHistory
+from .balance_cache import balance_cache
+from .idempotency import pending_key
 
 
-def get_energy_wallet(db: Session, user_id: str) -> EnergyWallet:
+async def get_energy_wallet(db: AsyncSession, user_id: str) -> EnergyWallet:
     """에너지 지갑 조회 또는 생성"""
-    wallet = db.query(EnergyWallet).filter(EnergyWallet.user_id == user_id).first()
+    result = await db.execute(select(EnergyWallet).where(EnergyWallet.user_id == user_id))
+    wallet = result.scalars().first()
     
     if not wallet:
         # 지갑이 없으면 생성
@@ -29,158 +35,269 @@ def get_energy_wallet(db: Session, user_id: str) -> EnergyWallet:
             balance=0,
         )
         db.add(wallet)
-        db.commit()
-        db.refresh(wallet)
+        await db.commit()
+        await db.refresh(wallet)
     
     return wallet
 
 
-def get_energy_transactions(
-    db: Session,
+async def get_wallet_balance(db: AsyncSession, user_id: str) -> dict:
+    """
+    잔액 조회 (사용자별 캐시, 없으면 지갑 한 행만 조회)
+    지갑이 없으면 get_energy_wallet과 같이 생성
+    """
+    cached = balance_cache.get(user_id)
+    if cached is not None:
+        wallet_id, balance, updated_at, _ = cached
+    else:
+        sequence = balance_cache.begin()
+        result = await db.execute(
+            select(EnergyWallet.id, EnergyWallet.balance, EnergyWallet.updated_at).where(EnergyWallet.user_id == user_id)
+        )
+        row = result.first()
+        if row is None:
+            wallet = await get_energy_wallet(db, user_id)
+            row = (wallet.id, wallet.balance, wallet.updated_at)
+        wallet_id, balance, updated_at = row
+        balance_cache.put(user_id, wallet_id, balance, updated_at, sequence)
+    
+    return {"wallet_id": wallet_id, "balance": balance, "updated_at": updated_at}
+
+
+async def get_energy_transactions(
+    db: AsyncSession,
     wallet_id: str,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    keyset: bool = False,
+    after: Optional[Tuple[datetime, str]] = None,
 ) -> List[EnergyTransaction]:
-    """에너지 거래 내역 조회"""
-    return db.query(EnergyTransaction).filter(
-        EnergyTransaction.wallet_id == wallet_id
-    ).order_by(EnergyTransaction.timestamp.desc()).limit(limit).offset(offset).all()
+    """
+    에너지 거래 내역 조회
+    keyset=True면 OFFSET 대신 (timestamp, id) 커서 조건으로 after 다음부터 limit + 1개 조회
+    """
+    query = select(EnergyTransaction).where(EnergyTransaction.wallet_id == wallet_id)
+    if keyset:
+        query = keyset_query(query, EnergyTransaction.timestamp, EnergyTransaction.id, after, limit)
+    else:
+        query = query.order_by(EnergyTransaction.timestamp.desc()).limit(limit).offset(offset)
+    result = await db.execute(query)
+    return list(result.scalars().all())
 
 
-def purchase_energy(db: Session, wallet_id: str, amount: int) -> EnergyTransaction:
-    """에너지 구매"""
-    wallet = db.query(EnergyWallet).filter(EnergyWallet.id == wallet_id).first()
-    if not wallet:
-        raise NotFoundException("에너지 지갑을 찾을 수 없습니다")
-    
-    # 에너지 거래 생성
-    transaction = EnergyTransaction(
-        wallet_id=wallet_id,
-        amount=amount,
-        state="available",
-    )
-    
-    db.add(transaction)
-    
-    # 지갑 잔액 증가
-    wallet.balance += amount
+def _supports_dml_cte(db: AsyncSession) -> bool:
+    """UPDATE/INSERT ... RETURNING을 WITH 절에 넣을 수 있는지 (PostgreSQL)"""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+async def _run_ledger(db: AsyncSession, wallet_id: str, steps: List[Callable]) -> Optional[EnergyTransaction]:
+    """
+    wallet_id 지갑의 잔액/거래 변경 단계를 앞 단계의 RETURNING 결과에 이어 실행하고 커밋
+    (커밋 후 잔액 캐시 무효화)
+    각 단계는 앞 단계 결과(컬럼 .c 를 가진 selectable, 첫 단계는 None)를 받아 DML 문을 반환하고
+    마지막 단계는 EnergyTransaction INSERT ... RETURNING
+
+    조건(잔액 충분, 잠금 상태 등)은 각 UPDATE의 WHERE에 두므로 조건을 확인하는 조회와
+    변경 사이에 다른 요청이 끼어들 틈이 없음 (조건이 맞지 않으면 0행 → 이후 단계도 0행)
+    - PostgreSQL: 단계들을 data-modifying CTE로 묶어 한 문장(한 번의 왕복)으로 실행
+    - 그 외(로컬 SQLite): 같은 트랜잭션에서 순서대로 실행, 앞 단계 결과가 없으면 중단
+
+    Idempotency-Key 요청이면 같은 트랜잭션에 키 행을 먼저 넣고 커밋하지 않음
+    (멱등성 키 처리에서 응답을 기록한 뒤 장부 변경과 함께 커밋)
+
+    Returns:
+        생성된 거래 (조건이 맞지 않아 아무것도 바뀌지 않았으면 None)
+    """
+    pending = pending_key(db)
+    if pending is not None and not await pending.record(db):
+        # 같은 키의 다른 요청이 먼저 커밋함 (멱등성 키 처리에서 그 응답을 반환)
+        raise ConflictException("같은 Idempotency-Key의 요청이 이미 처리되었습니다", "IDEMPOTENCY_KEY_TAKEN")
     
-    db.commit()
-    db.refresh(transaction)
+    source = None
+    transaction = None
+    if _supports_dml_cte(db):
+        ctes = []
+        for i, step in enumerate(steps[:-1]):
+            source = step(source).cte(f"ledger_step_{i}")
+            ctes.append(source)
+        stmt = steps[-1](source)
+        for cte in ctes:
+            stmt = stmt.add_cte(cte)
+        transaction = (await db.scalars(stmt)).first()
+    else:
+        for step in steps[:-1]:
+            row = (await db.execute(step(source))).mappings().first()
+            if row is None:
+                break
+            source = select(*[literal(value).label(key) for key, value in row.items()]).subquery()
+        else:
+            transaction = (await db.scalars(steps[-1](source))).first()
     
+    if transaction is None:
+        await db.rollback()
+        if pending is not None:
+            pending.recorded = False
+        return None
+    if pending is not None:
+        pending.after_commit(lambda: balance_cache.invalidate(wallet_id))
+        return transaction
+    await db.commit()
+    balance_cache.invalidate(wallet_id)
     return transaction
 
 
-def lock_energy_for_job(db: Session, wallet_id: str, job_id: str, amount: int) -> EnergyTransaction:
-    """공고 지원 시 에너지 잠금"""
-    wallet = db.query(EnergyWallet).filter(EnergyWallet.id == wallet_id).first()
-    if not wallet:
+def _update_wallet_balance(delta: int, wallet_id: Optional[str] = None, minimum: Optional[int] = None) -> Callable:
+    """
+    지갑 잔액 증감 단계 (wallet_id가 없으면 앞 단계 결과의 wallet_id 대상)
+    minimum이 있으면 잔액이 minimum 이상일 때만 변경
+    """
+    def step(source):
+        stmt = update(EnergyWallet).values(balance=EnergyWallet.balance + delta, updated_at=func.now())
+        if wallet_id is not None:
+            stmt = stmt.where(EnergyWallet.id == wallet_id)
+        else:
+            stmt = stmt.where(EnergyWallet.id.in_(select(source.c.wallet_id)))
+        if minimum is not None:
+            stmt = stmt.where(EnergyWallet.balance >= minimum)
+        return stmt.returning(
+            EnergyWallet.id.label("wallet_id"), EnergyWallet.balance.label("balance")
+        ).execution_options(synchronize_session=False)
+    return step
+
+
+def _release_locked_transaction(wallet_id: str, job_id: str, state: str) -> Callable:
+    """공고의 잠금 거래 하나를 state로 변경 (잠금 상태일 때만)"""
+    def step(source):
+        locked_id = select(EnergyTransaction.id).where(
+            EnergyTransaction.wallet_id == wallet_id,
+            EnergyTransaction.job_id == job_id,
+            # 부분 인덱스(idx_energy_transaction_locked) 조건과 맞도록 값을 SQL에 직접 넣음
+            EnergyTransaction.state == literal("locked", literal_execute=True),
+        ).limit(1).scalar_subquery()
+        # 동시에 같은 거래를 고른 요청은 행 잠금 해제 후 state 조건을 다시 확인해 0행이 됨
+        return update(EnergyTransaction).where(
+            EnergyTransaction.id == locked_id,
+            EnergyTransaction.state == "locked",
+        ).values(state=state).returning(
+            EnergyTransaction.wallet_id.label("wallet_id")
+        ).execution_options(synchronize_session=False)
+    return step
+
+
+def _record_no_show(job_id: str) -> Callable:
+    """노쇼 이력 추가 단계"""
+    def step(source):
+        return insert(NoShowHistory).from_select(
+            [NoShowHistory.id, NoShowHistory.wallet_id, NoShowHistory.job_id],
+            select(literal(str(uuid.uuid4())), source.c.wallet_id, literal(job_id)),
+        ).returning(NoShowHistory.wallet_id.label("wallet_id"))
+    return step
+
+
+def _insert_transaction(job_id: Optional[str], amount: int, state: str) -> Callable:
+    """거래 생성 단계 (앞 단계 결과의 wallet_id로)"""
+    def step(source):
+        return insert(EnergyTransaction).from_select(
+            [
+                EnergyTransaction.id,
+                EnergyTransaction.wallet_id,
+                EnergyTransaction.job_id,
+                EnergyTransaction.amount,
+                EnergyTransaction.state,
+            ],
+            select(
+                literal(str(uuid.uuid4())),
+                source.c.wallet_id,
+                literal(job_id, String),
+                literal(amount),
+                literal(state),
+            ),
+        ).returning(EnergyTransaction)
+    return step
+
+
+async def _wallet_balance(db: AsyncSession, wallet_id: str) -> Optional[int]:
+    """지갑 잔액 (지갑이 없으면 None) - 변경이 실패한 이유 확인용"""
+    return await db.scalar(select(EnergyWallet.balance).where(EnergyWallet.id == wallet_id))
+
+
+async def purchase_energy(db: AsyncSession, wallet_id: str, amount: int) -> EnergyTransaction:
+    """에너지 구매 (잔액 증가 + 거래 생성)"""
+    transaction = await _run_ledger(db, wallet_id, [
+        _update_wallet_balance(amount, wallet_id=wallet_id),
+        _insert_transaction(None, amount, "available"),
+    ])
+    if transaction is None:
         raise NotFoundException("에너지 지갑을 찾을 수 없습니다")
     
-    if wallet.balance < amount:
-        raise ConflictException(f"에너지가 부족합니다. (필요: {amount}개, 보유: {wallet.balance}개)")
-    
-    # 에너지 거래 생성
-    transaction = EnergyTransaction(
-        wallet_id=wallet_id,
-        job_id=job_id,
-        amount=amount,
-        state="locked",
-    )
-    
-    db.add(transaction)
-    
-    # 지갑 잔액 차감
-    wallet.balance -= amount
-    
-    db.commit()
-    db.refresh(transaction)
+    return transaction
+
+
+async def lock_energy_for_job(db: AsyncSession, wallet_id: str, job_id: str, amount: int) -> EnergyTransaction:
+    """
+    공고 지원 시 에너지 잠금
+    잔액이 amount 이상일 때만 차감 (동시 지원이 잔액 확인을 함께 통과해 초과 차감되지 않음)
+    """
+    transaction = await _run_ledger(db, wallet_id, [
+        _update_wallet_balance(-amount, wallet_id=wallet_id, minimum=amount),
+        _insert_transaction(job_id, amount, "locked"),
+    ])
+    if transaction is None:
+        balance = await _wallet_balance(db, wallet_id)
+        if balance is None:
+            raise NotFoundException("에너지 지갑을 찾을 수 없습니다")
+        raise ConflictException(f"에너지가 부족합니다. (필요: {amount}개, 보유: {balance}개)")
     
     return transaction
 
 
-def return_energy_for_job(db: Session, wallet_id: str, job_id: str, amount: int) -> Optional[EnergyTransaction]:
-    """근무 완료 시 에너지 반환"""
-    wallet = db.query(EnergyWallet).filter(EnergyWallet.id == wallet_id).first()
-    if not wallet:
+async def return_energy_for_job(db: AsyncSession, wallet_id: str, job_id: str, amount: int) -> Optional[EnergyTransaction]:
+    """
+    근무 완료 시 에너지 반환
+    잠금 거래를 반환 상태로 바꾼 경우에만 잔액 증가 (중복/동시 반환 요청은 한 번만 반영)
+
+    Returns:
+        반환 거래 (잠금 거래가 없거나 이미 처리됐으면 None)
+    """
+    transaction = await _run_ledger(db, wallet_id, [
+        _release_locked_transaction(wallet_id, job_id, "returned"),
+        _update_wallet_balance(amount),
+        _insert_transaction(job_id, amount, "returned"),
+    ])
+    if transaction is None and await _wallet_balance(db, wallet_id) is None:
         raise NotFoundException("에너지 지갑을 찾을 수 없습니다")
     
-    # 잠금된 거래 찾기
-    locked_transaction = db.query(EnergyTransaction).filter(
-        EnergyTransaction.wallet_id == wallet_id,
-        EnergyTransaction.job_id == job_id,
-        EnergyTransaction.state == "locked"
-    ).first()
-    
-    if locked_transaction:
-        # 잠금 상태를 반환 상태로 변경
-        locked_transaction.state = "returned"
-    
-    # 반환 거래 생성
-    transaction = EnergyTransaction(
-        wallet_id=wallet_id,
-        job_id=job_id,
-        amount=amount,
-        state="returned",
-    )
-    
-    db.add(transaction)
-    
-    # 지갑 잔액 증가
-    wallet.balance += amount
-    
-    db.commit()
-    db.refresh(transaction)
-    
     return transaction
 
 
-def forfeit_energy_for_job(db: Session, wallet_id: str, job_id: str, amount: int) -> Optional[EnergyTransaction]:
-    """노쇼 시 에너지 몰수"""
-    wallet = db.query(EnergyWallet).filter(EnergyWallet.id == wallet_id).first()
-    if not wallet:
+async def forfeit_energy_for_job(db: AsyncSession, wallet_id: str, job_id: str, amount: int) -> Optional[EnergyTransaction]:
+    """
+    노쇼 시 에너지 몰수 (잠금 시 이미 차감했으므로 잔액 변경 없음)
+    잠금 거래를 몰수 상태로 바꾼 경우에만 몰수 거래/노쇼 이력 생성
+
+    Returns:
+        몰수 거래 (잠금 거래가 없거나 이미 처리됐으면 None)
+    """
+    transaction = await _run_ledger(db, wallet_id, [
+        _release_locked_transaction(wallet_id, job_id, "forfeited"),
+        _record_no_show(job_id),
+        _insert_transaction(job_id, amount, "forfeited"),
+    ])
+    if transaction is None and await _wallet_balance(db, wallet_id) is None:
         raise NotFoundException("에너지 지갑을 찾을 수 없습니다")
     
-    # 잠금된 거래 찾기
-    locked_transaction = db.query(EnergyTransaction).filter(
-        EnergyTransaction.wallet_id == wallet_id,
-        EnergyTransaction.job_id == job_id,
-        EnergyTransaction.state == "locked"
-    ).first()
-    
-    if locked_transaction:
-        # 잠금 상태를 몰수 상태로 변경
-        locked_transaction.state = "forfeited"
-    
-    # 몰수 거래 생성
-    transaction = EnergyTransaction(
-        wallet_id=wallet_id,
-        job_id=job_id,
-        amount=amount,
-        state="forfeited",
-    )
-    
-    db.add(transaction)
-    
-    # 노쇼 이력 추가
-    no_show = NoShowHistory(
-        wallet_id=wallet_id,
-        job_id=job_id,
-    )
-    db.add(no_show)
-    
-    db.commit()
-    db.refresh(transaction)
-    
     return transaction
 
 
-def get_no_show_history(
-    db: Session,
+async def get_no_show_history(
+    db: AsyncSession,
     wallet_id: str,
     limit: int = 10
 ) -> List[NoShowHistory]:
     """노쇼 이력 조회"""
-    return db.query(NoShowHistory).filter(
-        NoShowHistory.wallet_id == wallet_id
-    ).order_by(NoShowHistory.created_at.desc()).limit(limit).all()
+    result = await db.execute(
+        select(NoShowHistory).where(
+            NoShowHistory.wallet_id == wallet_id
+        ).order_by(NoShowHistory.created_at.desc()).limit(limit)
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,333 @@
+"""
+멱등성 키 처리 (Idempotency-Key 헤더)
+Job/Schedule Service가 타임아웃 후 같은 요청을 다시 보내도 에너지를 한 번만 잠금/반환하도록
+처리한 요청의 성공 응답을 IdempotencyKey 테이블에 보관했다가 같은 키로 오면 그대로 반환
+
+- 키는 사용자(JWT sub)별로 구분, IDEMPOTENCY_TTL_SECONDS 동안 유지
+- 최근 성공 응답은 프로세스 메모리 LRU에도 두어 재시도는 DB 조회 없이 응답
+- 키 행은 장부 변경(_run_ledger)과 같은 트랜잭션의 첫 문장으로 INSERT하고 응답을 기록한 뒤 함께 커밋
+  → 장부 변경이 커밋됐으면 응답도 반드시 남고, 커밋 전에 실패/중단되면 키도 남지 않아 다시 실행해도 안전
+- 동시에 온 같은 키의 요청은 키 행 INSERT에서 먼저 요청의 커밋을 기다린 뒤 (PK 충돌)
+  자기 변경을 버리고 먼저 요청의 응답을 받음
+- 실패 응답(4xx/5xx)은 보관하지 않음 (장부 변경이 있었어도 커밋하지 않고 버림)
+- 같은 키로 다른 요청(경로/파라미터)을 보내면 422
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional, Tuple
+from fastapi import Response
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+import sys
+import os
+
+# shared 라이브러리 경로 추가
+current_file = os.path.abspath(__file__)
+backend_dir = os.path.abspath(os.path.join(current_file, "../../../../"))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from shared.responses.formats import error_response
+from ..config import IDEMPOTENCY_TTL_SECONDS, IDEMPOTENCY_CACHE_SIZE
+from ..models.energy import IdempotencyKey
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+# 보관한 응답을 재사용했음을 알리는 응답 헤더
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# 처리 중인 키를 보관하는 세션 info 항목
+_SESSION_INFO_KEY = "idempotency_key"
+
+# (요청 해시, 상태 코드, 응답 본문, 만료 시각(time.monotonic 기준))
+CachedResponse = Tuple[str, int, str, float]
+
+
+def request_hash(request_data: dict) -> str:
+    """요청 내용 해시 (같은 키로 다른 요청을 보냈는지 비교)"""
+    payload = json.dumps(request_data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """최근 성공 응답 LRU (키당 O(1) 조회/저장)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], CachedResponse]" = OrderedDict()
+
+    def get(self, user_id: str, key: str) -> Optional[CachedResponse]:
+        cache_key = (user_id, key)
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        if entry[3] <= time.monotonic():
+            del self._entries[cache_key]
+            return None
+        self._entries.move_to_end(cache_key)
+        return entry
+
+    def put(self, user_id: str, key: str, entry: CachedResponse) -> None:
+        if self.max_entries <= 0:
+            return
+        cache_key = (user_id, key)
+        self._entries[cache_key] = entry
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PendingKey:
+    """
+    처리 중인 요청의 Idempotency-Key
+    요청 세션(db.info)에 두고 장부 변경 트랜잭션에서 키 행을 기록
+    """
+
+    def __init__(self, user_id: str, key: str, digest: str, ttl_seconds: int):
+        self.user_id = user_id
+        self.key = key
+        self.digest = digest
+        self.ttl_seconds = ttl_seconds
+        # 현재 트랜잭션에 키 행을 넣었는지 (롤백하면 False로)
+        self.recorded = False
+        # 같은 키의 다른 요청이 먼저 커밋함
+        self.taken = False
+        self._after_commit: List[Callable[[], None]] = []
+
+    async def record(self, db: AsyncSession) -> bool:
+        """
+        키 행 INSERT (커밋하지 않음, 이미 넣었으면 그대로)
+        같은 키의 다른 요청이 처리 중이면 그 트랜잭션이 끝날 때까지 대기
+
+        Returns:
+            같은 키가 이미 기록돼 있으면 False (트랜잭션은 롤백)
+        """
+        if self.recorded:
+            return True
+        now = datetime.now()
+        try:
+            await db.execute(insert(IdempotencyKey).values(
+                user_id=self.user_id,
+                key=self.key,
+                request_hash=self.digest,
+                created_at=now,
+                expires_at=now + timedelta(seconds=self.ttl_seconds),
+            ))
+        except IntegrityError:
+            await db.rollback()
+            self.taken = True
+            return False
+        self.recorded = True
+        return True
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """응답과 함께 커밋된 뒤 실행할 작업 (잔액 캐시 무효화 등)"""
+        self._after_commit.append(callback)
+
+    def committed(self) -> None:
+        for callback in self._after_commit:
+            callback()
+
+
+def pending_key(db: AsyncSession) -> Optional[PendingKey]:
+    """이 세션에서 처리 중인 Idempotency-Key (없으면 None)"""
+    return db.info.get(_SESSION_INFO_KEY)
+
+
+class IdempotencyStore:
+    """Idempotency-Key 요청 처리 (DB 테이블 + 메모리 LRU)"""
+
+    def __init__(
+        self,
+        ttl_seconds: int = IDEMPOTENCY_TTL_SECONDS,
+        cache_size: int = IDEMPOTENCY_CACHE_SIZE,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.cache = ResponseCache(cache_size)
+        self.executed = 0
+        self.replayed_memory = 0
+        self.replayed_db = 0
+        self.conflicts = 0
+
+    async def run(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        key: Optional[str],
+        request_data: dict,
+        handler: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """
+        키가 없으면 handler를 그대로 실행
+        키가 있으면 처음 한 번만 handler를 실행하고 성공 응답을 보관, 이후에는 보관한 응답 반환
+        """
+        if not key:
+            return await handler()
+        if len(key) > MAX_KEY_LENGTH:
+            return error_response(
+                f"{IDEMPOTENCY_HEADER}는 {MAX_KEY_LENGTH}자 이하여야 합니다", "VALIDATION_ERROR", status_code=400
+            )
+
+        digest = request_hash(request_data)
+        cached = self.cache.get(user_id, key)
+        if cached is not None:
+            if cached[0] != digest:
+                return self._reused_key_response()
+            self.replayed_memory += 1
+            return self._replay(cached[1], cached[2])
+
+        record = await self._lookup(db, user_id, key)
+        if record is not None:
+            if record.request_hash != digest:
+                return self._reused_key_response()
+            self.replayed_db += 1
+            self._remember(user_id, key, record)
+            return self._replay(record.status_code, record.response_body)
+
+        pending = PendingKey(user_id, key, digest, self.ttl_seconds)
+        db.info[_SESSION_INFO_KEY] = pending
+        self.executed += 1
+        try:
+            response = await self._execute(db, pending, handler)
+        finally:
+            db.info.pop(_SESSION_INFO_KEY, None)
+        if response is None:
+            # 같은 키의 다른 요청이 먼저 커밋 → 이 요청의 변경은 버려졌으므로 먼저 요청의 응답 반환
+            return await self.run(db, user_id, key, request_data, handler)
+        return response
+
+    async def _execute(
+        self, db: AsyncSession, pending: PendingKey, handler: Callable[[], Awaitable[Response]]
+    ) -> Optional[Response]:
+        """
+        handler 실행 후 성공 응답을 키 행에 기록하고 장부 변경과 함께 커밋
+        (같은 키를 다른 요청이 먼저 기록했으면 None)
+        """
+        try:
+            response = await handler()
+            if pending.taken:
+                return None
+            if response.status_code >= 400:
+                # 커밋 전이므로 장부 변경이 있었어도 함께 버림 (키도 남지 않아 다시 시도 가능)
+                await db.rollback()
+                return response
+
+            body = bytes(response.body).decode("utf-8")
+            # 장부를 바꾸지 않은 성공 응답(반환할 잠금 거래 없음 등)은 여기서 키 행 생성
+            if not await pending.record(db):
+                return None
+            await db.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.user_id == pending.user_id, IdempotencyKey.key == pending.key)
+                .values(status_code=response.status_code, response_body=body)
+            )
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+
+        pending.committed()
+        self.cache.put(
+            pending.user_id, pending.key,
+            (pending.digest, response.status_code, body, time.monotonic() + self.ttl_seconds),
+        )
+        return response
+
+    async def _lookup(self, db: AsyncSession, user_id: str, key: str):
+        """
+        보관한 응답 조회 (없으면 None)
+        만료된 기록과 응답 없이 남은 기록(이전 버전의 선점 행)은 지우고 None
+        """
+        record = await self._load(db, user_id, key)
+        if record is None:
+            return None
+        now = datetime.now()
+        if record.expires_at > now and record.status_code is not None:
+            return record
+        await db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                or_(IdempotencyKey.expires_at <= now, IdempotencyKey.status_code.is_(None)),
+            )
+        )
+        await db.commit()
+        return None
+
+    async def _load(self, db: AsyncSession, user_id: str, key: str):
+        result = await db.execute(
+            select(
+                IdempotencyKey.request_hash,
+                IdempotencyKey.status_code,
+                IdempotencyKey.response_body,
+                IdempotencyKey.created_at,
+                IdempotencyKey.expires_at,
+            ).where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+        )
+        record = result.first()
+        # 다음 조회가 새 스냅샷을 보도록 읽기 트랜잭션 종료
+        await db.rollback()
+        return record
+
+    def _remember(self, user_id: str, key: str, record) -> None:
+        remaining = (record.expires_at - datetime.now()).total_seconds()
+        if remaining > 0:
+            self.cache.put(
+                user_id, key, (record.request_hash, record.status_code, record.response_body, time.monotonic() + remaining)
+            )
+
+    def _replay(self, status_code: int, body: str) -> Response:
+        return Response(
+            content=body,
+            status_code=status_code,
+            media_type="application/json",
+            headers={REPLAYED_HEADER: "true"},
+        )
+
+    def _reused_key_response(self) -> Response:
+        self.conflicts += 1
+        return error_response(
+            "같은 Idempotency-Key로 다른 요청을 보냈습니다", "IDEMPOTENCY_KEY_REUSED", status_code=422
+        )
+
+    async def purge_expired(self, session_factory) -> int:
+        """만료된 키 삭제"""
+        async with session_factory() as db:
+            result = await db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.now()))
+            await db.commit()
+            return result.rowcount or 0
+
+    async def run_purge(self, session_factory, interval: float) -> None:
+        """주기적 만료 키 삭제 (앱 lifespan 동안 백그라운드 태스크로 실행)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                count = await self.purge_expired(session_factory)
+                if count:
+                    print(f"[Idempotency] 만료된 키 {count}건 삭제")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[Idempotency] 만료 키 삭제 실패: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "cached": len(self.cache),
+            "executed": self.executed,
+            "replayedMemory": self.replayed_memory,
+            "replayedDb": self.replayed_db,
+            "conflicts": self.conflicts,
+        }
+
+
+# 프로세스 공용 저장소
+idempotency_store = IdempotencyStore()
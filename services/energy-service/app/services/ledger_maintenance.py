@@ -0,0 +1,261 @@
+"""
+에너지 장부 정리/대사 (백그라운드 작업)
+
+1. 정리(compact): LEDGER_COMPACT_AFTER_DAYS보다 오래된 정산 완료 거래(available/returned/forfeited)를
+   지갑별 월 요약(EnergyLedgerSummary)에 더하고 원본 거래는 삭제
+   - 잠금 중(locked) 거래는 반환/몰수 대상이므로 남김
+   - PostgreSQL: DELETE ... RETURNING을 CTE로 두고 그 결과를 바로 요약에 UPSERT (한 문장)
+     → 삭제한 행과 요약에 더한 행이 항상 같음 (그 사이에 상태가 바뀌는 행이 없음)
+   - 그 외(로컬 SQLite): 같은 트랜잭션에서 UPSERT 후 DELETE (쓰기 잠금을 잡은 뒤라 끼어드는 쓰기 없음)
+2. 대사(reconcile): 지갑 잔액과 장부(남은 거래 + 월 요약)로 계산한 잔액을 지갑 묶음별 한 쿼리로 비교
+   - 불일치는 로그와 GET /metrics의 ledgerMaintenance에 남기고 잔액은 고치지 않음
+
+거래 상태별 잔액 반영 (energy_service)
+- 구매: available +amount
+- 잠금: locked -amount
+- 반환: 잠금 거래를 returned로 바꾸고 returned 거래 추가 (+amount) → 반환된 잠금 한 건당 returned 두 건, 합계 0
+- 몰수: 잠금 거래를 forfeited로 바꾸고 forfeited 거래 추가 (잔액 변경 없음) → 몰수된 잠금 한 건당 forfeited 두 건, 합계 -amount
+따라서 기대 잔액 = available 합계 - locked 합계 - forfeited 합계 / 2
+(잠금 없이 처리된 과거 반환/몰수, 잠금과 다른 금액의 반환, 장부 밖에서 바꾼 잔액은 불일치로 보고됨)
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy import Integer, case, delete, func, literal, literal_column, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config import LEDGER_COMPACT_AFTER_DAYS, LEDGER_MAINTENANCE_BATCH_SIZE
+from ..models.energy import EnergyWallet, EnergyTransaction, EnergyLedgerSummary
+
+# 요약으로 합치는 상태 (잠금 중 거래는 제외)
+SETTLED_STATES = ("available", "returned", "forfeited")
+
+# 로그/지표에 남길 불일치 지갑 수
+_MISMATCH_SAMPLE_SIZE = 20
+
+
+def _month(db: AsyncSession, column):
+    """
+    timestamp → "YYYY-MM"
+    (형식은 SQL에 직접 넣음: 바인드 파라미터면 SELECT와 GROUP BY의 식이 다른 식으로 취급될 수 있음)
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return func.to_char(column, literal_column("'YYYY-MM'"))
+    return func.strftime(literal_column("'%Y-%m'"), column)
+
+
+def _sum_state(state_column, amount_column, state: str):
+    return func.coalesce(func.sum(case((state_column == state, amount_column), else_=0)), 0)
+
+
+def _upsert_summary(db: AsyncSession, rows):
+    """(wallet_id, month, available, returned, forfeited, count) 행을 월 요약에 더함"""
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(EnergyLedgerSummary).from_select(
+        [
+            EnergyLedgerSummary.wallet_id,
+            EnergyLedgerSummary.month,
+            EnergyLedgerSummary.available_amount,
+            EnergyLedgerSummary.returned_amount,
+            EnergyLedgerSummary.forfeited_amount,
+            EnergyLedgerSummary.transaction_count,
+        ],
+        rows,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[EnergyLedgerSummary.wallet_id, EnergyLedgerSummary.month],
+        set_={
+            "availableAmount": EnergyLedgerSummary.available_amount + stmt.excluded.availableAmount,
+            "returnedAmount": EnergyLedgerSummary.returned_amount + stmt.excluded.returnedAmount,
+            "forfeitedAmount": EnergyLedgerSummary.forfeited_amount + stmt.excluded.forfeitedAmount,
+            "transactionCount": EnergyLedgerSummary.transaction_count + stmt.excluded.transactionCount,
+            "updatedAt": func.now(),
+        },
+    )
+
+
+def _summary_rows(db: AsyncSession, source):
+    """거래(wallet_id, timestamp, state, amount) → 지갑/월별 상태 합계"""
+    month = _month(db, source.c.timestamp)
+    return select(
+        source.c.wallet_id,
+        month,
+        _sum_state(source.c.state, source.c.amount, "available"),
+        _sum_state(source.c.state, source.c.amount, "returned"),
+        _sum_state(source.c.state, source.c.amount, "forfeited"),
+        func.count(),
+    ).group_by(source.c.wallet_id, month)
+
+
+class LedgerMaintenance:
+    """EnergyTransaction 정리 + 지갑 잔액 대사"""
+
+    def __init__(
+        self,
+        compact_after_days: int = LEDGER_COMPACT_AFTER_DAYS,
+        batch_size: int = LEDGER_MAINTENANCE_BATCH_SIZE,
+    ):
+        self.compact_after_days = compact_after_days
+        self.batch_size = batch_size
+        self.runs = 0
+        self.compacted_transactions = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.wallets_checked = 0
+        self.mismatches: List[dict] = []
+        self.mismatch_count = 0
+
+    async def _wallet_batches(self, db: AsyncSession):
+        """지갑 ID를 batch_size개씩 (id 오름차순 keyset)"""
+        after = ""
+        while True:
+            ids = list(await db.scalars(
+                select(EnergyWallet.id).where(EnergyWallet.id > after).order_by(EnergyWallet.id).limit(self.batch_size)
+            ))
+            await db.rollback()
+            if not ids:
+                return
+            yield ids
+            after = ids[-1]
+
+    def _compact_condition(self, wallet_ids: List[str], cutoff: datetime):
+        return (
+            EnergyTransaction.wallet_id.in_(wallet_ids),
+            EnergyTransaction.timestamp < cutoff,
+            EnergyTransaction.state.in_(SETTLED_STATES),
+        )
+
+    async def compact_wallets(self, db: AsyncSession, wallet_ids: List[str], cutoff: datetime) -> int:
+        """지갑들의 cutoff 이전 정산 완료 거래를 월 요약으로 옮기고 커밋 (옮긴 거래 수 반환)"""
+        condition = self._compact_condition(wallet_ids, cutoff)
+        if db.get_bind().dialect.name == "postgresql":
+            moved = delete(EnergyTransaction).where(*condition).returning(
+                EnergyTransaction.wallet_id.label("wallet_id"),
+                EnergyTransaction.timestamp.label("timestamp"),
+                EnergyTransaction.state.label("state"),
+                EnergyTransaction.amount.label("amount"),
+            ).cte("compacted")
+            summarized = _upsert_summary(db, _summary_rows(db, moved)).returning(literal(1)).cte("summarized")
+            count = await db.scalar(select(func.count()).select_from(moved).add_cte(summarized))
+        else:
+            source = select(
+                EnergyTransaction.wallet_id.label("wallet_id"),
+                EnergyTransaction.timestamp.label("timestamp"),
+                EnergyTransaction.state.label("state"),
+                EnergyTransaction.amount.label("amount"),
+            ).where(*condition).subquery()
+            await db.execute(_upsert_summary(db, _summary_rows(db, source)))
+            result = await db.execute(
+                delete(EnergyTransaction).where(*condition).execution_options(synchronize_session=False)
+            )
+            count = result.rowcount
+        await db.commit()
+        return count or 0
+
+    async def compact(self, session_factory) -> int:
+        """전체 지갑 정리 (지갑 batch_size개마다 커밋)"""
+        cutoff = datetime.now() - timedelta(days=self.compact_after_days)
+        total = 0
+        async with session_factory() as db:
+            async for wallet_ids in self._wallet_batches(db):
+                total += await self.compact_wallets(db, wallet_ids, cutoff)
+        self.compacted_transactions += total
+        return total
+
+    def _reconcile_query(self, wallet_ids: List[str]):
+        """지갑별 (잔액, 장부상 잔액) 중 다른 것만 조회"""
+        live = select(
+            EnergyTransaction.wallet_id.label("wallet_id"),
+            _sum_state(EnergyTransaction.state, EnergyTransaction.amount, "available").label("available"),
+            _sum_state(EnergyTransaction.state, EnergyTransaction.amount, "locked").label("locked"),
+            _sum_state(EnergyTransaction.state, EnergyTransaction.amount, "forfeited").label("forfeited"),
+        ).where(EnergyTransaction.wallet_id.in_(wallet_ids)).group_by(EnergyTransaction.wallet_id).subquery()
+        summary = select(
+            EnergyLedgerSummary.wallet_id.label("wallet_id"),
+            func.sum(EnergyLedgerSummary.available_amount).label("available"),
+            func.sum(EnergyLedgerSummary.forfeited_amount).label("forfeited"),
+        ).where(EnergyLedgerSummary.wallet_id.in_(wallet_ids)).group_by(EnergyLedgerSummary.wallet_id).subquery()
+
+        available = func.coalesce(live.c.available, 0) + func.coalesce(summary.c.available, 0)
+        forfeited = func.coalesce(live.c.forfeited, 0) + func.coalesce(summary.c.forfeited, 0)
+        # 몰수된 잠금 한 건당 forfeited 거래 두 건 (바뀐 잠금 거래 + 몰수 거래)
+        expected = (available - func.coalesce(live.c.locked, 0) - forfeited // literal(2, Integer)).label("expected")
+        return select(EnergyWallet.id, EnergyWallet.user_id, EnergyWallet.balance, expected).outerjoin(
+            live, live.c.wallet_id == EnergyWallet.id
+        ).outerjoin(
+            summary, summary.c.wallet_id == EnergyWallet.id
+        ).where(EnergyWallet.id.in_(wallet_ids), EnergyWallet.balance != expected)
+
+    async def reconcile(self, session_factory) -> List[dict]:
+        """전체 지갑 대사 (불일치 목록 반환)"""
+        mismatches = []
+        checked = 0
+        async with session_factory() as db:
+            async for wallet_ids in self._wallet_batches(db):
+                result = await db.execute(self._reconcile_query(wallet_ids))
+                for row in result:
+                    mismatches.append({
+                        "walletId": row.id,
+                        "userId": row.user_id,
+                        "balance": row.balance,
+                        "expected": row.expected,
+                        "difference": row.balance - row.expected,
+                    })
+                await db.rollback()
+                checked += len(wallet_ids)
+        self.wallets_checked = checked
+        self.mismatch_count = len(mismatches)
+        self.mismatches = mismatches[:_MISMATCH_SAMPLE_SIZE]
+        return mismatches
+
+    async def run_once(self, session_factory) -> None:
+        """정리 후 대사"""
+        started = time.perf_counter()
+        self.last_run_at = datetime.now()
+        try:
+            compacted = await self.compact(session_factory)
+            mismatches = await self.reconcile(session_factory)
+            self.last_error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"[Ledger] 장부 정리/대사 실패: {e}")
+            return
+        finally:
+            self.runs += 1
+            self.last_duration_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        print(f"[Ledger] 거래 {compacted}건 월 요약으로 정리, 지갑 {self.wallets_checked}개 대사 ({self.last_duration_ms}ms)")
+        for mismatch in mismatches[:_MISMATCH_SAMPLE_SIZE]:
+            print(
+                f"[Ledger] 잔액 불일치 wallet={mismatch['walletId']} "
+                f"balance={mismatch['balance']} expected={mismatch['expected']}"
+            )
+        if len(mismatches) > _MISMATCH_SAMPLE_SIZE:
+            print(f"[Ledger] 잔액 불일치 지갑 {len(mismatches)}개 중 {_MISMATCH_SAMPLE_SIZE}개만 표시")
+
+    async def run(self, session_factory, interval: float) -> None:
+        """주기적 정리/대사 (앱 lifespan 동안 백그라운드 태스크로 실행)"""
+        while True:
+            await asyncio.sleep(interval)
+            await self.run_once(session_factory)
+
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "lastRunAt": self.last_run_at.isoformat() if self.last_run_at else None,
+            "lastDurationMs": self.last_duration_ms,
+            "lastError": self.last_error,
+            "compactedTransactions": self.compacted_transactions,
+            "walletsChecked": self.wallets_checked,
+            "mismatchCount": self.mismatch_count,
+            "mismatches": self.mismatches,
+        }
+
+
+# 프로세스 공용 작업
+ledger_maintenance = LedgerMaintenance()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+에너지 장부 정리/대사 벤치마크
+지갑 하나에 거래 10만 건(2년치)을 만들고 다음을 단계별로 비교
+
+1. 이전: 기존 단일 컬럼 인덱스만 (잠금 거래 조회용 부분 인덱스 없음)
+2. 잠금 거래 부분 인덱스 추가 (idx_energy_transaction_locked)
+3. 장부 정리 후 (LEDGER_COMPACT_AFTER_DAYS 이전 정산 완료 거래 → 월 요약)
+
+- 반환: 실제 return_energy_for_job (잠금 거래 조회 + 조건부 UPDATE)를 단계마다 다른 잠금 거래로 실행
+- 대사: ledger_maintenance의 지갑 잔액 대사 쿼리
+- 각 단계에서 대사 결과가 일치하는지(불일치 0) 함께 확인
+
+BENCH_DATABASE_URL이 PostgreSQL이면 별도 스키마(bench_energy_ledger)에 테이블을 만들어 실행하므로
+기존 데이터에는 영향 없음, 없으면 임시 SQLite DB에서 실행
+
+실행:
+    cd services/energy-service
+    python bench_energy_ledger.py [거래 수] [단계별 반환 횟수]
+    BENCH_DATABASE_URL=postgresql://... python bench_energy_ledger.py 100000 100 [--keep]
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL")
+if not BENCH_DATABASE_URL:
+    BENCH_DATABASE_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_energy_ledger.db')}"
+os.environ["DATABASE_URL"] = BENCH_DATABASE_URL
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.pop("DATABASE_REPLICA_URLS", None)
+os.environ.pop("ASYNC_DATABASE_REPLICA_URLS", None)
+
+# 앱/shared 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+sys.path.insert(0, os.path.abspath(os.path.join(current_dir, "../..")))
+
+from sqlalchemy import Column, String, Table, create_engine, func, insert, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from shared.database.base import Base
+from shared.database.models.user import User
+from app.models.energy import EnergyWallet, EnergyTransaction, EnergyLedgerSummary
+from app.services.energy_service import return_energy_for_job
+from app.services.ledger_maintenance import LedgerMaintenance
+
+SCHEMA = "bench_energy_ledger"
+WALLET_ID = "bench-wallet"
+USER_ID = "bench-user"
+AMOUNT = 5
+HISTORY_DAYS = 730
+
+LOCKED_INDEX = "idx_energy_transaction_locked"
+# 모델과 같은 부분 인덱스 (SQLite도 부분 인덱스 지원)
+CREATE_LOCKED_INDEX = (
+    f'CREATE INDEX {LOCKED_INDEX} ON "EnergyTransaction" ("walletId", "jobId") WHERE state = \'locked\''
+)
+
+
+def seed_rows(transaction_count: int):
+    """
+    (공고 ID 목록, 잠금 중 공고 ID 목록, 거래 행, 최종 잔액)
+    공고 하나당 잠금 → 반환 90% / 몰수 8% / 잠금 유지 2%, 공고 10개마다 구매 1건
+    """
+    rng = random.Random(42)
+    now = datetime.now()
+    jobs, locked_jobs, rows = [], [], []
+    balance = 0
+    k = 0
+    while len(rows) < transaction_count:
+        at = now - timedelta(days=HISTORY_DAYS * (1 - len(rows) / transaction_count), seconds=rng.randint(0, 3600))
+        if k % 10 == 0:
+            rows.append({"id": f"tx-{len(rows)}", "walletId": WALLET_ID, "jobId": None,
+                         "amount": AMOUNT * 20, "state": "available", "timestamp": at})
+            balance += AMOUNT * 20
+        job_id = f"bench-job-{k}"
+        jobs.append(job_id)
+        r = rng.random()
+        balance -= AMOUNT
+        if r < 0.90:
+            # 잠금 거래가 returned로 바뀌고 반환 거래 추가
+            rows.append({"id": f"tx-{len(rows)}", "walletId": WALLET_ID, "jobId": job_id,
+                         "amount": AMOUNT, "state": "returned", "timestamp": at})
+            rows.append({"id": f"tx-{len(rows)}", "walletId": WALLET_ID, "jobId": job_id,
+                         "amount": AMOUNT, "state": "returned", "timestamp": at + timedelta(hours=8)})
+            balance += AMOUNT
+        elif r < 0.98:
+            rows.append({"id": f"tx-{len(rows)}", "walletId": WALLET_ID, "jobId": job_id,
+                         "amount": AMOUNT, "state": "forfeited", "timestamp": at})
+            rows.append({"id": f"tx-{len(rows)}", "walletId": WALLET_ID, "jobId": job_id,
+                         "amount": AMOUNT, "state": "forfeited", "timestamp": at + timedelta(hours=8)})
+        else:
+            rows.append({"id": f"tx-{len(rows)}", "walletId": WALLET_ID, "jobId": job_id,
+                         "amount": AMOUNT, "state": "locked", "timestamp": at})
+            locked_jobs.append(job_id)
+        k += 1
+    return jobs, locked_jobs, rows, balance
+
+
+def make_engines():
+    if BENCH_DATABASE_URL.startswith("postgresql"):
+        sync_engine = create_engine(BENCH_DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+        async_url = BENCH_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+        async_engine = create_async_engine(async_url, connect_args={"server_settings": {"search_path": SCHEMA}})
+    else:
+        sync_engine = create_engine(BENCH_DATABASE_URL)
+        async_engine = create_async_engine(BENCH_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1))
+    return sync_engine, async_engine
+
+
+def seed(engine, transaction_count: int):
+    if "Job" not in Base.metadata.tables:
+        # 거래의 공고 FK 대상만
+        Table("Job", Base.metadata, Column("id", String, primary_key=True))
+    job_table = Base.metadata.tables["Job"]
+    tables = [User.__table__, job_table, EnergyWallet.__table__, EnergyTransaction.__table__, EnergyLedgerSummary.__table__]
+    jobs, locked_jobs, rows, balance = seed_rows(transaction_count)
+
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn, tables=tables)
+        # 이전 상태: 잠금 거래 부분 인덱스 없음
+        conn.execute(text(f"DROP INDEX {LOCKED_INDEX}"))
+
+        started = time.perf_counter()
+        conn.execute(insert(User), [{"id": USER_ID, "password": "x", "role": "spare"}])
+        conn.execute(insert(job_table), [{"id": job_id} for job_id in jobs])
+        conn.execute(insert(EnergyWallet), [{"id": WALLET_ID, "userId": USER_ID, "balance": balance}])
+        for i in range(0, len(rows), 5000):
+            conn.execute(insert(EnergyTransaction), rows[i:i + 5000])
+        print(f"데이터 생성: 거래 {len(rows):,}건, 잠금 중 {len(locked_jobs):,}건, {time.perf_counter() - started:.1f}s")
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("ANALYZE"))
+    return locked_jobs
+
+
+async def measure_returns(session_factory, job_ids: list) -> dict:
+    timings = []
+    async with session_factory() as db:
+        for job_id in job_ids:
+            started = time.perf_counter()
+            transaction = await return_energy_for_job(db, WALLET_ID, job_id, AMOUNT)
+            timings.append((time.perf_counter() - started) * 1000)
+            assert transaction is not None, f"반환 실패: {job_id}"
+    return {"p50": statistics.median(timings), "max": max(timings)}
+
+
+async def measure_reconcile(session_factory, maintenance: LedgerMaintenance, repeat: int = 5) -> dict:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        mismatches = await maintenance.reconcile(session_factory)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {"p50": statistics.median(timings), "mismatches": len(mismatches)}
+
+
+async def transaction_count(session_factory) -> int:
+    async with session_factory() as db:
+        return await db.scalar(select(func.count()).select_from(EnergyTransaction))
+
+
+async def run(sync_engine, async_engine, locked_jobs: list, returns: int) -> bool:
+    session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+    maintenance = LedgerMaintenance()
+    batches = [locked_jobs[i * returns:(i + 1) * returns] for i in range(3)]
+    results = []
+
+    async def stage(name: str, jobs: list):
+        rows = await transaction_count(session_factory)
+        returned = await measure_returns(session_factory, jobs)
+        reconciled = await measure_reconcile(session_factory, maintenance)
+        results.append((name, rows, returned, reconciled))
+
+    await stage("이전 (단일 컬럼 인덱스)", batches[0])
+
+    with sync_engine.begin() as conn:
+        started = time.perf_counter()
+        conn.execute(text(CREATE_LOCKED_INDEX))
+        print(f"잠금 거래 부분 인덱스 생성: {(time.perf_counter() - started) * 1000:.0f}ms")
+    await stage("+ 잠금 거래 부분 인덱스", batches[1])
+
+    started = time.perf_counter()
+    compacted = await maintenance.compact(session_factory)
+    print(f"장부 정리: 거래 {compacted:,}건 → 월 요약, {time.perf_counter() - started:.2f}s")
+    if sync_engine.dialect.name == "postgresql":
+        with sync_engine.begin() as conn:
+            conn.execute(text('ANALYZE "EnergyTransaction"'))
+    await stage("+ 장부 정리", batches[2])
+    await async_engine.dispose()
+
+    print(f"\n{'단계':<24} {'거래 행':>9} {'반환 p50':>10} {'반환 max':>10} {'대사 p50':>10} {'불일치':>6}")
+    for name, rows, returned, reconciled in results:
+        print(
+            f"{name:<24} {rows:>9,} {returned['p50']:>8.2f}ms {returned['max']:>8.2f}ms "
+            f"{reconciled['p50']:>8.2f}ms {reconciled['mismatches']:>6}"
+        )
+    return all(reconciled["mismatches"] == 0 for _, _, _, reconciled in results)
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    count = int(args[0]) if len(args) > 0 else 100000
+    returns = int(args[1]) if len(args) > 1 else 100
+    keep = "--keep" in sys.argv
+
+    admin = create_engine(BENCH_DATABASE_URL)
+    if admin.dialect.name == "postgresql":
+        with admin.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    sync_engine, async_engine = make_engines()
+
+    print("=" * 80)
+    print(f"에너지 장부 벤치마크 ({admin.dialect.name}): 지갑 1개, 거래 {count:,}건, 단계별 반환 {returns}회")
+    print("=" * 80)
+
+    try:
+        locked_jobs = seed(sync_engine, count)
+        if len(locked_jobs) < returns * 3:
+            print(f"잠금 중 거래가 부족합니다 ({len(locked_jobs)}건 < {returns * 3}건, 반환 횟수를 줄이세요)")
+            sys.exit(1)
+        passed = asyncio.run(run(sync_engine, async_engine, locked_jobs, returns))
+    finally:
+        sync_engine.dispose()
+        if admin.dialect.name == "postgresql" and not keep:
+            with admin.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin.dispose()
+
+    if not passed:
+        print("\n✗ 대사 결과 잔액 불일치가 있습니다")
+        sys.exit(1)
+    print("\n✓ 모든 단계에서 지갑 잔액과 장부가 일치합니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+-- 멱등성 키 테이블 (POST /api/energy/lock|return|forfeit|purchase 의 Idempotency-Key 헤더)
+-- psql "$DATABASE_URL" -f create_idempotency_keys.sql
+
+CREATE TABLE IF NOT EXISTS "IdempotencyKey" (
+    "userId"       TEXT NOT NULL,
+    "key"          TEXT NOT NULL,
+    "requestHash"  TEXT NOT NULL,
+    "statusCode"   INTEGER,
+    "responseBody" TEXT,
+    "createdAt"    TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "expiresAt"    TIMESTAMP(3) NOT NULL,
+    PRIMARY KEY ("userId", "key")
+);
+
+CREATE INDEX IF NOT EXISTS idx_idempotency_key_expires_at
+    ON "IdempotencyKey" ("expiresAt");
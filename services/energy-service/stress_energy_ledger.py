@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+에너지 지갑 동시성 스트레스 테스트
+지갑 하나에 여러 워커가 동시에 잠금/반환을 보내고 장부가 맞는지 확인
+
+- 잔액이 음수가 되지 않음 (초과 차감 없음)
+- 최종 잔액 = 초기 잔액 - 잠금 성공 수 + 반환 성공 수
+- 남은 잠금 거래 수 = 잠금 성공 수 - 반환 성공 수 (같은 잠금을 두 번 반환하지 않음)
+- 거래 행 수 = 구매 1 + 잠금/반환 성공 수
+
+몰수는 반환과 같은 조건부 잠금 해제 단계를 쓰며, 노쇼 이력에 공고 ID가 필요해
+공고 FK 없이(job_id 없이) 실행하는 이 테스트에서는 제외
+
+--legacy 이면 잠금을 이전 방식(잔액 조회 → 파이썬에서 비교 → 차감)으로 실행해 비교
+(동시 잠금이 잔액 확인을 함께 통과해 초과 차감되거나 차감이 덮어써져 잔액이 맞지 않음)
+
+STRESS_DATABASE_URL이 없으면 임시 SQLite DB에서 실행
+(SQLite는 쓰기를 직렬화하므로 일부 요청이 "database is locked" 오류로 실패할 수 있음 - 실패한 요청은 아무것도 바꾸지 않음)
+PostgreSQL에서는 기존 스키마에 테스트 사용자/지갑을 만들고 끝나면 삭제
+
+실행:
+    cd services/energy-service
+    python stress_energy_ledger.py [워커 수] [워커당 요청 수] [--legacy]
+    STRESS_DATABASE_URL=postgresql://... python stress_energy_ledger.py 50 40
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+STRESS_DATABASE_URL = os.getenv("STRESS_DATABASE_URL")
+if STRESS_DATABASE_URL:
+    os.environ["DATABASE_URL"] = STRESS_DATABASE_URL
+else:
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'stress_energy_ledger.db')}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.pop("DATABASE_REPLICA_URLS", None)
+os.environ.pop("ASYNC_DATABASE_REPLICA_URLS", None)
+
+# 앱/shared 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+sys.path.insert(0, os.path.abspath(os.path.join(current_dir, "../..")))
+
+from sqlalchemy import Column, String, Table, delete, func, select
+from shared.database.base import Base
+from shared.database.session import engine
+from shared.database.async_session import AsyncSessionLocal, async_engine
+from shared.database.models.user import User
+from shared.exceptions.app_exceptions import ConflictException
+from app.models.energy import EnergyWallet, EnergyTransaction
+from app.services.energy_service import (
+    get_energy_wallet,
+    purchase_energy,
+    lock_energy_for_job,
+    return_energy_for_job,
+)
+
+AMOUNT = 1
+
+
+async def legacy_lock(db, wallet_id: str, job_id, amount: int):
+    """이전 잠금 방식: 잔액 조회 후 파이썬에서 비교하고 ORM으로 차감"""
+    wallet = await db.get(EnergyWallet, wallet_id)
+    if wallet.balance < amount:
+        raise ConflictException("에너지가 부족합니다.")
+    db.add(EnergyTransaction(wallet_id=wallet_id, job_id=job_id, amount=amount, state="locked"))
+    wallet.balance -= amount
+    await db.commit()
+
+
+class Result:
+    def __init__(self):
+        self.ok = {"lock": 0, "return": 0}
+        self.rejected = {"lock": 0, "return": 0}
+        self.errors = 0
+        self.timings = []
+
+
+async def worker(wallet_id: str, ops: int, legacy: bool, seed: int, result: Result) -> None:
+    rng = random.Random(seed)
+    for _ in range(ops):
+        op = "lock" if rng.random() < 0.7 else "return"
+        started = time.perf_counter()
+        try:
+            # 공고 FK를 피하려고 job_id 없이 잠금 (반환은 잠금 거래 아무거나 하나)
+            async with AsyncSessionLocal() as db:
+                if op == "lock":
+                    if legacy:
+                        await legacy_lock(db, wallet_id, None, AMOUNT)
+                    else:
+                        await lock_energy_for_job(db, wallet_id, None, AMOUNT)
+                    done = True
+                else:
+                    done = await return_energy_for_job(db, wallet_id, None, AMOUNT) is not None
+            if done:
+                result.ok[op] += 1
+            else:
+                result.rejected[op] += 1
+        except ConflictException:
+            result.rejected[op] += 1
+        except Exception as e:
+            result.errors += 1
+            if result.errors <= 3:
+                print(f"  오류 ({op}): {e}")
+        result.timings.append((time.perf_counter() - started) * 1000)
+
+
+async def ledger_state(wallet_id: str) -> dict:
+    async with AsyncSessionLocal() as db:
+        balance = await db.scalar(select(EnergyWallet.balance).where(EnergyWallet.id == wallet_id))
+        rows = await db.scalar(select(func.count()).where(EnergyTransaction.wallet_id == wallet_id))
+        locked = await db.scalar(select(func.count()).where(
+            EnergyTransaction.wallet_id == wallet_id, EnergyTransaction.state == "locked"
+        ))
+    return {"balance": balance, "rows": rows, "locked": locked}
+
+
+async def run(workers: int, ops: int, legacy: bool) -> bool:
+    user_id = f"stress-{uuid.uuid4()}"
+    # 잠금 요청의 절반 정도만 성공하도록 초기 잔액 설정
+    initial = max(1, int(workers * ops * 0.7 * AMOUNT / 2))
+
+    async with AsyncSessionLocal() as db:
+        db.add(User(id=user_id, password="x", role="spare"))
+        await db.commit()
+        wallet = await get_energy_wallet(db, user_id)
+        wallet_id = wallet.id
+        await purchase_energy(db, wallet_id, initial)
+
+    try:
+        result = Result()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(wallet_id, ops, legacy, i, result) for i in range(workers)))
+        elapsed = time.perf_counter() - started
+        state = await ledger_state(wallet_id)
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(EnergyTransaction).where(EnergyTransaction.wallet_id == wallet_id))
+            await db.execute(delete(EnergyWallet).where(EnergyWallet.id == wallet_id))
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()
+
+    ok = result.ok
+    timings = sorted(result.timings)
+    print(f"요청 {len(timings)}건, {elapsed:.2f}s ({len(timings) / elapsed:.0f} req/s)")
+    print(f"지연 p50 {statistics.median(timings):.1f}ms, p99 {timings[int(len(timings) * 0.99) - 1]:.1f}ms")
+    for op in ("lock", "return"):
+        print(f"  {op:<8} 성공 {ok[op]:5d}  거절 {result.rejected[op]:5d}")
+    print(f"  오류     {result.errors:5d}")
+
+    expected_balance = initial - ok["lock"] * AMOUNT + ok["return"] * AMOUNT
+    checks = [
+        ("잔액이 음수가 아님", state["balance"] >= 0, state["balance"]),
+        ("잔액 = 초기 - 잠금 + 반환", state["balance"] == expected_balance, f"{state['balance']} / 기대 {expected_balance}"),
+        ("남은 잠금 = 잠금 - 반환", state["locked"] == ok["lock"] - ok["return"],
+         f"{state['locked']} / 기대 {ok['lock'] - ok['return']}"),
+        ("거래 행 수", state["rows"] == 1 + ok["lock"] + ok["return"], f"{state['rows']} / 기대 {1 + ok['lock'] + ok['return']}"),
+    ]
+    passed = True
+    for name, ok_, detail in checks:
+        print(f"{'✓' if ok_ else '✗'} {name}: {detail}")
+        passed = passed and ok_
+    return passed
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    workers = int(args[0]) if len(args) > 0 else 50
+    ops = int(args[1]) if len(args) > 1 else 40
+    legacy = "--legacy" in sys.argv
+
+    if engine.dialect.name == "sqlite":
+        # 로컬 실행용 스키마 (공고 테이블은 FK 대상만)
+        if "Job" not in Base.metadata.tables:
+            Table("Job", Base.metadata, Column("id", String, primary_key=True))
+        Base.metadata.create_all(engine)
+
+    print("=" * 60)
+    print(f"에너지 지갑 스트레스 테스트 ({async_engine.dialect.name}, {'이전 방식 잠금' if legacy else '조건부 UPDATE'})")
+    print(f"워커 {workers}개 x {ops}건, 지갑 1개")
+    print("=" * 60)
+
+    passed = asyncio.run(run(workers, ops, legacy))
+    if not passed:
+        print("\n✗ 장부가 맞지 않습니다")
+        sys.exit(1)
+    print("\n✓ 동시 요청에서도 장부가 맞습니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+-- 커서 페이지네이션용 복합 인덱스 (GET /api/jobs?cursor=)
+-- 운영 DB에서 테이블 잠금 없이 생성 (트랜잭션 밖에서 실행)
+-- psql "$DATABASE_URL" -f add_keyset_indexes.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_status_created_at_id
+    ON "Job" (status, "createdAt", id);
@@ -0,0 +1,45 @@
+"""Job feed composite / partial indexes
+
+Revision ID: 5b1f3c2a9d47
+Revises:
+Create Date: 2026-10-18 11:02:37.418205
+
+Job/Application/Region 테이블은 이미 존재(Prisma로 생성)하므로 인덱스만 관리
+운영 중 쓰기가 막히지 않도록 CONCURRENTLY로 생성/삭제 (트랜잭션 밖에서 실행)
+add_keyset_indexes.sql로 먼저 만든 idx_job_status_created_at_id는 IF NOT EXISTS로 건너뜀
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1f3c2a9d47'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+PUBLISHED = sa.text("status = 'published'")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # 공고 피드 / 커서 페이지네이션: status = ? ORDER BY createdAt DESC, id DESC
+        op.create_index('idx_job_status_created_at_id', 'Job', ['status', 'createdAt', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        # 지역 필터 피드: regionId IN (...) 지역별 최신순
+        op.create_index('idx_job_feed_region', 'Job', ['regionId', sa.text('"createdAt" DESC'), sa.text('id DESC')], unique=False, postgresql_where=PUBLISHED, postgresql_concurrently=True, if_not_exists=True)
+        # 급구/프리미엄 피드
+        op.create_index('idx_job_feed_urgent', 'Job', [sa.text('"createdAt" DESC'), sa.text('id DESC')], unique=False, postgresql_where=sa.text("status = 'published' AND \"isUrgent\""), postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_job_feed_premium', 'Job', [sa.text('"createdAt" DESC'), sa.text('id DESC')], unique=False, postgresql_where=sa.text("status = 'published' AND \"isPremium\""), postgresql_concurrently=True, if_not_exists=True)
+        # idx_job_status_created_at_id의 앞부분과 같아 중복
+        op.drop_index('idx_job_status', table_name='Job', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('idx_job_status', 'Job', ['status'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('idx_job_feed_premium', table_name='Job', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_job_feed_urgent', table_name='Job', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_job_feed_region', table_name='Job', postgresql_concurrently=True, if_exists=True)
+        # idx_job_status_created_at_id는 커서 페이지네이션(add_keyset_indexes.sql)에서도 쓰므로 유지
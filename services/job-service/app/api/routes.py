@@ -3,7 +3,8 @@ Job Service API 라우트
 """
 
 from fastapi import APIRouter, Depends, Query, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from typing import Optional, List
 import sys
 import os
@@ -13,15 +14,21 @@ current_file = os.path.abspath(__file__)
 backend_dir = os.path.abspath(os.path.join(current_file, "../../../../"))
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
-from shared.database.session import get_db
+from shared.database.async_session import get_async_db, get_async_read_db
+from shared.database.pagination import split_page
+from shared.database.outbox import actor_claims
+from shared.schemas.base import PaginationParams
 from shared.responses.formats import success_response, error_response
 from shared.auth.dependencies import get_current_user_dependency
 from shared.exceptions.app_exceptions import NotFoundException, ConflictException, AuthorizationException
-from ..schemas.job import JobCreate, JobUpdate, JobResponse, ApplicationResponse
+from ..config import JOB_FEED_ENABLED
+from ..schemas.job import JobCreate, JobUpdate, JobBulkCreate, ApplicationBulkAction, JobResponse, ApplicationResponse
+from ..services.job_feed import job_feed, serialize_job
 from ..services.job_service import (
     get_jobs as get_jobs_service,
     get_job_by_id,
     create_job as create_job_service,
+    create_jobs_bulk as create_jobs_bulk_service,
     update_job,
     delete_job,
     apply_to_job as apply_to_job_service,
@@ -30,6 +37,8 @@ from ..services.job_service import (
     get_applications_for_shop,
     approve_application as approve_application_service,
     reject_application as reject_application_service,
+    approve_applications_bulk as approve_applications_bulk_service,
+    reject_applications_bulk as reject_applications_bulk_service,
 )
 
 router = APIRouter()
@@ -42,43 +51,48 @@ async def get_jobs(
     is_premium: Optional[bool] = None,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (빈 값이면 첫 페이지, 이후 next_cursor)"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """공고 목록 조회"""
+    """
+    공고 목록 조회
+    메모리 피드가 적재되어 있으면 피드에서, 아니면 DB에서 조회
+    """
+    page = PaginationParams(limit=limit, cursor=cursor)
+    after = page.after()
     try:
-        jobs = get_jobs_service(
-            db,
-            region_ids=region_ids,
-            is_urgent=is_urgent,
-            is_premium=is_premium,
-            limit=limit,
-            offset=offset
-        )
-        
-        jobs_data = []
-        for job in jobs:
-            job_dict = {
-                "id": job.id,
-                "shop_id": job.shop_id,
-                "title": job.title,
-                "date": job.date,
-                "time": job.time,
-                # "end_time": getattr(job, 'end_time', None),  # 데이터베이스에 없음
-                "amount": job.amount,
-                "energy": job.energy,
-                "required_count": job.required_count,
-                "region_id": job.region_id,
-                # "description": getattr(job, 'description', None),  # 데이터베이스에 없음
-                # "requirements": getattr(job, 'requirements', None),  # 데이터베이스에 없음
-                # "images": getattr(job, 'images', None) or [],  # 데이터베이스에 없음
-                "is_urgent": job.is_urgent,
-                "is_premium": job.is_premium,
-                "status": job.status,
-                "created_at": job.created_at.isoformat(),
-                "updated_at": job.updated_at.isoformat(),
-            }
-            jobs_data.append(job_dict)
+        next_cursor = None
+        if JOB_FEED_ENABLED and job_feed.ready:
+            entries = job_feed.page(
+                region_ids=region_ids,
+                is_urgent=is_urgent,
+                is_premium=is_premium,
+                limit=limit,
+                offset=offset,
+                keyset=page.is_cursor,
+                after=after,
+            )
+            if page.is_cursor:
+                entries, next_cursor = split_page(entries, limit)
+            jobs_data = [entry.data for entry in entries]
+        else:
+            job_feed.misses += 1
+            jobs = await get_jobs_service(
+                db,
+                region_ids=region_ids,
+                is_urgent=is_urgent,
+                is_premium=is_premium,
+                limit=limit,
+                offset=offset,
+                keyset=page.is_cursor,
+                after=after,
+            )
+            if page.is_cursor:
+                jobs, next_cursor = split_page(jobs, limit)
+            jobs_data = [serialize_job(job) for job in jobs]
         
+        if page.is_cursor:
+            return success_response({"jobs": jobs_data, "next_cursor": next_cursor})
         return success_response({"jobs": jobs_data})
     except Exception as e:
         import traceback
@@ -97,10 +111,10 @@ async def get_jobs(
 
 
 @router.get("/api/jobs/{job_id}")
-async def get_job(job_id: str, db: Session = Depends(get_db)):
+async def get_job(job_id: str, db: AsyncSession = Depends(get_async_read_db)):
     """공고 상세 조회"""
     try:
-        job = get_job_by_id(db, job_id)
+        job = await get_job_by_id(db, job_id)
         if not job:
             return error_response("공고를 찾을 수 없습니다", "NOT_FOUND", status_code=404)
         
@@ -134,7 +148,7 @@ async def get_job(job_id: str, db: Session = Depends(get_db)):
 async def create_job(
     job_data: JobCreate,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """공고 생성"""
     try:
@@ -146,7 +160,7 @@ async def create_job(
         if current_user.get("role") != "shop":
             return error_response("공고는 매장만 생성할 수 있습니다", "FORBIDDEN", status_code=403)
         
-        job = create_job_service(db, shop_id, job_data)
+        job = await create_job_service(db, shop_id, job_data)
         
         job_response = {
             "id": job.id,
@@ -174,12 +188,35 @@ async def create_job(
         return error_response("공고 생성 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
 
 
-def _job_to_dict(db, job, shop_name=None):
+@router.post("/api/jobs/bulk")
+async def create_jobs_bulk(
+    bulk_data: JobBulkCreate,
+    current_user: dict = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """공고 일괄 생성 (반복 근무 공고 등, 한 트랜잭션)"""
+    try:
+        shop_id = current_user.get("user_id") or current_user.get("sub")
+        if not shop_id:
+            return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
+        
+        # shop 역할만 공고 생성 가능
+        if current_user.get("role") != "shop":
+            return error_response("공고는 매장만 생성할 수 있습니다", "FORBIDDEN", status_code=403)
+        
+        jobs = await create_jobs_bulk_service(db, shop_id, bulk_data.jobs)
+        
+        return success_response({"jobs": [serialize_job(job) for job in jobs]}, status_code=201)
+    except Exception as e:
+        return error_response("공고 일괄 생성 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+
+
+async def _job_to_dict(db, job, shop_name=None):
     """Job 응답 생성 (shopName 포함)"""
     if not shop_name:
         try:
             from shared.database.models.user import User
-            shop_user = db.query(User).filter(User.id == job.shop_id).first()
+            shop_user = await db.get(User, job.shop_id)
             shop_name = (shop_user.name or shop_user.username or "매장") if shop_user else "매장"
         except Exception:
             shop_name = "매장"
@@ -201,7 +238,7 @@ def _job_to_dict(db, job, shop_name=None):
     }
 
 
-def _application_to_dict(app, job=None, spare_user=None, db=None):
+async def _application_to_dict(app, job=None, spare_user=None, db=None, shop_name=None):
     """Application 응답 생성 (Job, spare 포함)"""
     d = {
         "id": app.id,
@@ -212,7 +249,7 @@ def _application_to_dict(app, job=None, spare_user=None, db=None):
         "createdAt": app.created_at.isoformat(),
     }
     if job and db:
-        d["job"] = _job_to_dict(db, job)
+        d["job"] = await _job_to_dict(db, job, shop_name)
     if spare_user:
         d["spare"] = {
             "id": spare_user.id,
@@ -224,16 +261,34 @@ def _application_to_dict(app, job=None, spare_user=None, db=None):
     return d
 
 
-def _build_applications_response(db, applications):
-    """Application 목록을 Job, spare 포함하여 빌드"""
+async def _build_applications_response(db, applications):
+    """
+    Application 목록을 Job, spare 포함하여 빌드
+    
+    지원 건수와 관계없이 Job 1회 + User 1회(spare와 매장 함께) IN 조회로 처리
+    """
     from shared.database.models.user import User
+    from ..models.job import Job
+    if not applications:
+        return []
+    
+    job_ids = list({a.job_id for a in applications})
+    result = await db.execute(select(Job).where(Job.id.in_(job_ids)))
+    jobs = {j.id: j for j in result.scalars().all()}
+    
+    user_ids = list({a.spare_id for a in applications} | {j.shop_id for j in jobs.values()})
+    result = await db.execute(select(User).where(User.id.in_(user_ids)))
+    users = {u.id: u for u in result.scalars().all()}
+    
     applications_data = []
-    user_ids = list(set([a.spare_id for a in applications]))
-    users = {u.id: u for u in db.query(User).filter(User.id.in_(user_ids)).all()}
     for app in applications:
-        job = get_job_by_id(db, app.job_id)
+        job = jobs.get(app.job_id)
+        shop_name = None
+        if job:
+            shop_user = users.get(job.shop_id)
+            shop_name = (shop_user.name or shop_user.username or "매장") if shop_user else "매장"
         spare_user = users.get(app.spare_id)
-        applications_data.append(_application_to_dict(app, job, spare_user, db))
+        applications_data.append(await _application_to_dict(app, job, spare_user, db, shop_name))
     return applications_data
 
 
@@ -242,7 +297,7 @@ async def apply_to_job(
     job_id: str,
     request: Request,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """공고 지원"""
     try:
@@ -255,15 +310,15 @@ async def apply_to_job(
             return error_response("스페어만 공고에 지원할 수 있습니다", "FORBIDDEN", status_code=403)
         
         auth_header = request.headers.get("Authorization")
-        application = apply_to_job_service(db, job_id, spare_id, auth_header)
-        job = get_job_by_id(db, application.job_id)
+        application = await apply_to_job_service(db, job_id, spare_id, auth_header)
+        job = await get_job_by_id(db, application.job_id)
         spare_user = None
         try:
             from shared.database.models.user import User
-            spare_user = db.query(User).filter(User.id == application.spare_id).first()
+            spare_user = await db.get(User, application.spare_id)
         except Exception:
             pass
-        return success_response(_application_to_dict(application, job, spare_user, db), status_code=201)
+        return success_response(await _application_to_dict(application, job, spare_user, db), status_code=201)
     except NotFoundException as e:
         return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
     except ConflictException as e:
@@ -275,7 +330,7 @@ async def apply_to_job(
 @router.get("/api/jobs/my")
 async def get_my_jobs(
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """내 공고 목록"""
     try:
@@ -283,7 +338,7 @@ async def get_my_jobs(
         if not shop_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        jobs = get_user_jobs(db, shop_id)
+        jobs = await get_user_jobs(db, shop_id)
         
         jobs_data = []
         for job in jobs:
@@ -310,7 +365,7 @@ async def get_my_jobs(
 @router.get("/api/applications/my")
 async def get_my_applications(
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """내 지원 목록 (Spare용)"""
     try:
@@ -318,8 +373,8 @@ async def get_my_applications(
         if not spare_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        applications = get_user_applications(db, spare_id)
-        applications_data = _build_applications_response(db, applications)
+        applications = await get_user_applications(db, spare_id)
+        applications_data = await _build_applications_response(db, applications)
         return success_response({"applications": applications_data})
     except Exception as e:
         return error_response("지원 목록 조회 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
@@ -328,7 +383,7 @@ async def get_my_applications(
 @router.get("/api/applications/shop")
 async def get_shop_applications(
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """매장 지원자 목록 (Shop용)"""
     try:
@@ -338,8 +393,8 @@ async def get_shop_applications(
         if current_user.get("role") != "shop":
             return error_response("매장만 조회할 수 있습니다", "FORBIDDEN", status_code=403)
         
-        applications = get_applications_for_shop(db, shop_id)
-        applications_data = _build_applications_response(db, applications)
+        applications = await get_applications_for_shop(db, shop_id)
+        applications_data = await _build_applications_response(db, applications)
         return success_response({"applications": applications_data})
     except Exception as e:
         return error_response("지원 목록 조회 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
@@ -348,9 +403,8 @@ async def get_shop_applications(
 @router.post("/api/applications/{application_id}/approve")
 async def approve_application(
     application_id: str,
-    request: Request,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """지원 승인 (Shop만)"""
     try:
@@ -360,9 +414,8 @@ async def approve_application(
         if current_user.get("role") != "shop":
             return error_response("매장만 승인할 수 있습니다", "FORBIDDEN", status_code=403)
         
-        auth_header = request.headers.get("Authorization")
-        application = approve_application_service(db, application_id, shop_id, auth_header)
-        applications_data = _build_applications_response(db, [application])
+        application = await approve_application_service(db, application_id, shop_id, actor_claims(current_user))
+        applications_data = await _build_applications_response(db, [application])
         return success_response(applications_data[0] if applications_data else {})
     except NotFoundException as e:
         return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
@@ -378,7 +431,7 @@ async def approve_application(
 async def reject_application(
     application_id: str,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """지원 거절 (Shop만)"""
     try:
@@ -388,8 +441,8 @@ async def reject_application(
         if current_user.get("role") != "shop":
             return error_response("매장만 거절할 수 있습니다", "FORBIDDEN", status_code=403)
         
-        application = reject_application_service(db, application_id, shop_id)
-        applications_data = _build_applications_response(db, [application])
+        application = await reject_application_service(db, application_id, shop_id)
+        applications_data = await _build_applications_response(db, [application])
         return success_response(applications_data[0] if applications_data else {})
     except NotFoundException as e:
         return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
@@ -401,6 +454,62 @@ async def reject_application(
         return error_response("거절 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
 
 
+@router.post("/api/applications/bulk-approve")
+async def approve_applications_bulk(
+    bulk_data: ApplicationBulkAction,
+    current_user: dict = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """지원 일괄 승인 (Shop만, 하나라도 처리할 수 없으면 전체 미처리)"""
+    try:
+        shop_id = current_user.get("user_id") or current_user.get("sub")
+        if not shop_id:
+            return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
+        if current_user.get("role") != "shop":
+            return error_response("매장만 승인할 수 있습니다", "FORBIDDEN", status_code=403)
+        
+        applications = await approve_applications_bulk_service(
+            db, bulk_data.application_ids, shop_id, actor_claims(current_user)
+        )
+        applications_data = await _build_applications_response(db, applications)
+        return success_response({"applications": applications_data})
+    except NotFoundException as e:
+        return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
+    except AuthorizationException as e:
+        return error_response(e.message, e.code or "FORBIDDEN", status_code=403)
+    except ConflictException as e:
+        return error_response(e.message, e.code or "CONFLICT", status_code=409)
+    except Exception as e:
+        return error_response("일괄 승인 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+
+
+@router.post("/api/applications/bulk-reject")
+async def reject_applications_bulk(
+    bulk_data: ApplicationBulkAction,
+    current_user: dict = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """지원 일괄 거절 (Shop만, 하나라도 처리할 수 없으면 전체 미처리)"""
+    try:
+        shop_id = current_user.get("user_id") or current_user.get("sub")
+        if not shop_id:
+            return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
+        if current_user.get("role") != "shop":
+            return error_response("매장만 거절할 수 있습니다", "FORBIDDEN", status_code=403)
+        
+        applications = await reject_applications_bulk_service(db, bulk_data.application_ids, shop_id)
+        applications_data = await _build_applications_response(db, applications)
+        return success_response({"applications": applications_data})
+    except NotFoundException as e:
+        return error_response(e.message, e.code or "NOT_FOUND", status_code=404)
+    except AuthorizationException as e:
+        return error_response(e.message, e.code or "FORBIDDEN", status_code=403)
+    except ConflictException as e:
+        return error_response(e.message, e.code or "CONFLICT", status_code=409)
+    except Exception as e:
+        return error_response("일괄 거절 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+
+
 @router.get("/health")
 async def health_check():
     return {"status": "ok", "service": "job-service"}
@@ -24,4 +24,9 @@ AUTH_SERVICE_URL = os.getenv("AUTH_SERVICE_URL", "http://localhost:8101")
 ENERGY_SERVICE_URL = os.getenv("ENERGY_SERVICE_URL", "http://localhost:8106")
 SCHEDULE_SERVICE_URL = os.getenv("SCHEDULE_SERVICE_URL", "http://localhost:8104")
 ENERGY_SERVICE_URL = os.getenv("ENERGY_SERVICE_URL", "http://localhost:8106")
-SCHEDULE_SERVICE_URL = os.getenv("SCHEDULE_SERVICE_URL", "http://localhost:8104")
\ No newline at end of file
+SCHEDULE_SERVICE_URL = os.getenv("SCHEDULE_SERVICE_URL", "http://localhost:8104")
+
+# 메모리 공고 피드 (GET /api/jobs를 DB 조회 없이 응답)
+JOB_FEED_ENABLED = os.getenv("JOB_FEED_ENABLED", "true").lower() in ("1", "true", "yes")
+# 전체 재적재 주기 (초) - 다른 워커/서비스에서 바뀐 공고가 반영되는 최대 지연
+JOB_FEED_REFRESH_SECONDS = float(os.getenv("JOB_FEED_REFRESH_SECONDS", "30"))
@@ -2,6 +2,8 @@
 Job Service 메인 애플리케이션
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import sys
@@ -14,10 +16,41 @@ if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 from shared.exceptions.handlers import app_exception_handler, general_exception_handler
 from shared.exceptions.app_exceptions import AppException
+from shared.database.metrics import db_metrics
+from shared.database.async_session import AsyncSessionLocal
+from shared.clients import RequestDeadlineMiddleware, close_service_clients, service_clients_snapshot
 from .api import routes
-from .config import SERVICE_PORT
+from .config import SERVICE_PORT, JOB_FEED_ENABLED, JOB_FEED_REFRESH_SECONDS
+from .services.job_feed import job_feed
+from .services.job_service import outbox
 
-app = FastAPI(title="HairSpare Job Service", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명 주기
+    메모리 공고 피드를 주기적으로 재적재하는 백그라운드 태스크 실행
+    (복제 지연으로 방금 쓴 공고가 빠지지 않도록 프라이머리에서 적재)
+    아웃박스 이벤트(승인 → 스케줄 생성)를 전달하는 백그라운드 태스크 실행
+    종료 시 서비스 간 호출 클라이언트의 커넥션 정리
+    """
+    tasks = [asyncio.create_task(outbox.run(AsyncSessionLocal))]
+    if JOB_FEED_ENABLED:
+        tasks.append(asyncio.create_task(job_feed.run(AsyncSessionLocal, JOB_FEED_REFRESH_SECONDS)))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await close_service_clients()
+
+
+app = FastAPI(title="HairSpare Job Service", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +60,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 데드라인/요청 ID를 다른 서비스 호출에 전달
+app.add_middleware(RequestDeadlineMiddleware)
+
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
@@ -45,6 +81,19 @@ async def root():
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """
+    DB 커넥션 풀 / 쿼리 지연 시간 / 메모리 공고 피드 / 서비스 간 호출 / 아웃박스 지표
+    """
+    return {
+        **db_metrics.snapshot(),
+        "jobFeed": job_feed.stats(),
+        "serviceClients": service_clients_snapshot(),
+        "outbox": outbox.stats.snapshot(),
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=SERVICE_PORT)
@@ -4,6 +4,7 @@ Job 및 Application 모델
 
 import uuid
 from sqlalchemy import Column, String, DateTime, Boolean, Integer, ARRAY, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import and_
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import sys
@@ -58,9 +59,28 @@ class Job(Base):
         Index("idx_job_region_id", "regionId"),
         Index("idx_job_is_urgent", "isUrgent"),
         Index("idx_job_is_premium", "isPremium"),
-        Index("idx_job_status", "status"),
         Index("idx_job_exposure_time", "exposureTime"),
         Index("idx_job_created_at", "createdAt"),
+        # 공고 피드 (status 필터 + createdAt, id 내림차순), 커서 페이지네이션
+        # idx_job_status는 이 인덱스의 앞부분과 같아 제거
+        Index("idx_job_status_created_at_id", "status", "createdAt", "id"),
+        # 지역 필터 피드: regionId IN (...) 각 지역을 최신순으로 읽음
+        Index(
+            "idx_job_feed_region",
+            region_id, created_at.desc(), id.desc(),
+            postgresql_where=(status == "published"),
+        ),
+        # 급구/프리미엄 피드: 해당 공고만 담은 작은 부분 인덱스
+        Index(
+            "idx_job_feed_urgent",
+            created_at.desc(), id.desc(),
+            postgresql_where=and_(status == "published", is_urgent),
+        ),
+        Index(
+            "idx_job_feed_premium",
+            created_at.desc(), id.desc(),
+            postgresql_where=and_(status == "published", is_premium),
+        ),
     )
 
 
@@ -51,6 +51,20 @@ class JobUpdate(BaseSchema):
     status: Optional[str] = None
 
 
+# 일괄 요청 한 번에 처리하는 최대 건수
+BULK_MAX_ITEMS = 100
+
+
+class JobBulkCreate(BaseSchema):
+    """공고 일괄 생성 스키마 (한 트랜잭션)"""
+    jobs: List[JobCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class ApplicationBulkAction(BaseSchema):
+    """지원 일괄 승인/거절 스키마 (한 트랜잭션)"""
+    application_ids: List[str] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class JobResponse(BaseSchema):
     """공고 응답 스키마"""
     id: str
@@ -0,0 +1,236 @@
+"""
+지역별 공고 피드 (메모리)
+게시 중인 공고를 (createdAt, id) 순으로 정렬해 전체/지역별로 들고 있다가
+GET /api/jobs를 DB 조회 없이 응답
+
+- 공고 생성/수정/삭제 시 해당 공고만 피드에 반영 (upsert / remove)
+- JOB_FEED_REFRESH_SECONDS마다 DB에서 전체 재적재
+  (다른 워커/서비스에서 바뀐 공고는 이 주기 안에 반영)
+- 첫 적재 전이거나 JOB_FEED_ENABLED=false면 기존처럼 DB에서 조회
+
+노출 시간(exposureTime)은 조회 시점 기준으로 거르므로 예약 노출 공고도 그대로 보관
+"""
+
+import asyncio
+import heapq
+import time
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import select
+from ..models.job import Job
+
+FeedKey = Tuple[datetime, str]
+
+
+def serialize_job(job: Job) -> dict:
+    """공고 목록 항목 응답 형식"""
+    return {
+        "id": job.id,
+        "shop_id": job.shop_id,
+        "title": job.title,
+        "date": job.date,
+        "time": job.time,
+        # "end_time": getattr(job, 'end_time', None),  # 데이터베이스에 없음
+        "amount": job.amount,
+        "energy": job.energy,
+        "required_count": job.required_count,
+        "region_id": job.region_id,
+        # "description": getattr(job, 'description', None),  # 데이터베이스에 없음
+        # "requirements": getattr(job, 'requirements', None),  # 데이터베이스에 없음
+        # "images": getattr(job, 'images', None) or [],  # 데이터베이스에 없음
+        "is_urgent": job.is_urgent,
+        "is_premium": job.is_premium,
+        "status": job.status,
+        "created_at": job.created_at.isoformat(),
+        "updated_at": job.updated_at.isoformat(),
+    }
+
+
+class FeedEntry:
+    """피드에 보관하는 공고 (필터 필드 + 응답 데이터)"""
+
+    __slots__ = ("id", "created_at", "region_id", "is_urgent", "is_premium", "exposure_time", "data")
+
+    def __init__(self, job: Job):
+        self.id = job.id
+        self.created_at = job.created_at
+        self.region_id = job.region_id
+        self.is_urgent = bool(job.is_urgent)
+        self.is_premium = bool(job.is_premium)
+        self.exposure_time = job.exposure_time
+        self.data = serialize_job(job)
+
+    @property
+    def key(self) -> FeedKey:
+        return (self.created_at, self.id)
+
+
+class FeedIndex:
+    """
+    정렬된 공고 인덱스 (전체 + 지역별)
+    키는 오름차순으로 저장하고 뒤에서부터 읽어 최신순으로 반환
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, FeedEntry] = {}
+        self.all: List[FeedKey] = []
+        self.by_region: Dict[str, List[FeedKey]] = {}
+
+    def add(self, entry: FeedEntry) -> None:
+        self.discard(entry.id)
+        self.entries[entry.id] = entry
+        insort(self.all, entry.key)
+        insort(self.by_region.setdefault(entry.region_id, []), entry.key)
+
+    def discard(self, job_id: str) -> None:
+        entry = self.entries.pop(job_id, None)
+        if entry is None:
+            return
+        key = entry.key
+        self.all.pop(bisect_left(self.all, key))
+        region = self.by_region[entry.region_id]
+        region.pop(bisect_left(region, key))
+        if not region:
+            del self.by_region[entry.region_id]
+
+    @classmethod
+    def build(cls, entries: List[FeedEntry]) -> "FeedIndex":
+        """재적재용 일괄 생성 (정렬 한 번)"""
+        index = cls()
+        index.entries = {entry.id: entry for entry in entries}
+        index.all = sorted(entry.key for entry in index.entries.values())
+        for key in index.all:
+            index.by_region.setdefault(index.entries[key[1]].region_id, []).append(key)
+        return index
+
+    def newest_first(self, region_ids: Optional[List[str]], after: Optional[FeedKey]) -> Iterator[FeedKey]:
+        """after보다 이전 키를 최신순으로 (지역이 여러 개면 병합)"""
+        if region_ids:
+            lists = [self.by_region[r] for r in dict.fromkeys(region_ids) if r in self.by_region]
+        else:
+            lists = [self.all]
+
+        def descending(keys: List[FeedKey]) -> Iterator[FeedKey]:
+            end = len(keys) if after is None else bisect_left(keys, after)
+            for i in range(end - 1, -1, -1):
+                yield keys[i]
+
+        if len(lists) == 1:
+            return descending(lists[0])
+        return heapq.merge(*(descending(keys) for keys in lists), reverse=True)
+
+
+class JobFeed:
+    """게시 중인 공고의 메모리 피드 (프로세스 단위)"""
+
+    def __init__(self):
+        self._index = FeedIndex()
+        self._journals: List[List[Tuple[str, object]]] = []  # 진행 중인 재적재별로 그 사이 들어온 변경
+        self.ready = False
+        self.loaded_at: Optional[float] = None
+        self.reloads = 0
+        self.hits = 0
+        self.misses = 0
+
+    def upsert(self, job: Job) -> None:
+        """공고 생성/수정 반영 (게시 상태가 아니면 피드에서 제거)"""
+        if job.status != "published":
+            self.remove(job.id)
+            return
+        entry = FeedEntry(job)
+        self._index.add(entry)
+        for journal in self._journals:
+            journal.append(("add", entry))
+
+    def remove(self, job_id: str) -> None:
+        """공고 삭제 반영"""
+        self._index.discard(job_id)
+        for journal in self._journals:
+            journal.append(("discard", job_id))
+
+    async def reload(self, session_factory) -> int:
+        """
+        DB에서 게시 중인 공고 전체 재적재
+        조회하는 동안 들어온 변경은 새 인덱스에 다시 적용한 뒤 교체
+        """
+        journal: List[Tuple[str, object]] = []
+        self._journals.append(journal)
+        try:
+            async with session_factory() as db:
+                result = await db.execute(select(Job).where(Job.status == "published"))
+                entries = [FeedEntry(job) for job in result.scalars()]
+            index = FeedIndex.build(entries)
+            for op, arg in journal:
+                getattr(index, op)(arg)
+        finally:
+            self._journals.remove(journal)
+        self._index = index
+        self.ready = True
+        self.loaded_at = time.time()
+        self.reloads += 1
+        return len(index.entries)
+
+    async def run(self, session_factory, interval: float) -> None:
+        """주기적 재적재 (앱 lifespan 동안 백그라운드 태스크로 실행)"""
+        while True:
+            try:
+                count = await self.reload(session_factory)
+                print(f"[JobFeed] 공고 {count}건 적재")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[JobFeed] 재적재 실패 (DB 조회로 계속 응답): {e}")
+            await asyncio.sleep(interval)
+
+    def page(
+        self,
+        region_ids: Optional[List[str]] = None,
+        is_urgent: Optional[bool] = None,
+        is_premium: Optional[bool] = None,
+        limit: int = 50,
+        offset: int = 0,
+        keyset: bool = False,
+        after: Optional[FeedKey] = None,
+    ) -> List[FeedEntry]:
+        """
+        get_jobs(status="published")와 같은 조건/순서로 조회
+        keyset=True면 after 다음부터 limit + 1개 (split_page로 다음 커서 계산)
+        """
+        index = self._index
+        now = datetime.now()
+        skip = 0 if keyset else offset
+        want = limit + 1 if keyset else limit
+        items: List[FeedEntry] = []
+        for key in index.newest_first(region_ids, after if keyset else None):
+            entry = index.entries[key[1]]
+            if is_urgent is not None and entry.is_urgent != is_urgent:
+                continue
+            if is_premium is not None and entry.is_premium != is_premium:
+                continue
+            if entry.exposure_time is not None and entry.exposure_time > now:
+                continue
+            if skip:
+                skip -= 1
+                continue
+            items.append(entry)
+            if len(items) >= want:
+                break
+        self.hits += 1
+        return items
+
+    def stats(self) -> dict:
+        index = self._index
+        return {
+            "ready": self.ready,
+            "jobs": len(index.entries),
+            "regions": len(index.by_region),
+            "loadedAt": datetime.fromtimestamp(self.loaded_at).isoformat() if self.loaded_at else None,
+            "reloads": self.reloads,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# 프로세스 공용 피드
+job_feed = JobFeed()
@@ -2,14 +2,13 @@
 Job Service 비즈니스 로직
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, and_, insert, literal, or_, select
+from typing import Optional, List, Tuple
 from datetime import datetime
 import sys
 import os
-import httpx
-import httpx
+import uuid
 
 # shared 라이브러리 경로 추가
 current_file = os.path.abspath(__file__)
@@ -17,36 +16,56 @@ backend_dir = os.path.abspath(os.path.join(current_file, "../../../../"))
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 from shared.exceptions.app_exceptions import NotFoundException, ConflictException, AuthorizationException
+from shared.database.pagination import keyset_query
+from shared.clients import IDEMPOTENCY_HEADER, service_client
+from shared.database.outbox import OutboxDispatcher
 from ..models.job import Job, Application, Region
+from .job_feed import job_feed
+from ..config import ENERGY_SERVICE_URL, SCHEDULE_SERVICE_URL
 from ..schemas.job import JobCreate, JobUpdate
 
+# 서비스 간 호출 클라이언트 (커넥션 풀 재사용, 데드라인 전파)
+energy_client = service_client("energy", ENERGY_SERVICE_URL)
+schedule_client = service_client("schedule", SCHEDULE_SERVICE_URL)
 
-def get_jobs(
-    db: Session,
+# 승인 후 스케줄 생성은 아웃박스로 기록해 커밋 후 비동기 전달
+outbox = OutboxDispatcher("job", {"schedule": schedule_client})
+
+
+def build_jobs_query(
     region_ids: Optional[List[str]] = None,
     is_urgent: Optional[bool] = None,
     is_premium: Optional[bool] = None,
     status: str = "published",
     limit: int = 50,
-    offset: int = 0
-) -> List[Job]:
-    """공고 목록 조회"""
-    query = db.query(Job).filter(Job.status == status)
+    offset: int = 0,
+    keyset: bool = False,
+    after: Optional[Tuple[datetime, str]] = None
+) -> Select:
+    """
+    공고 목록(피드) 쿼리 생성
+    
+    models/job.py의 피드 인덱스(idx_job_feed_*)가 이 조건/정렬에 맞춰져 있으므로
+    조건이나 정렬을 바꾸면 인덱스와 bench_job_feed_indexes.py도 함께 확인
+    """
+    # status는 바인드 파라미터 대신 SQL에 값으로 넣음
+    # (prepared statement의 generic plan에서도 WHERE status = 'published' 부분 인덱스를 쓰도록)
+    query = select(Job).where(Job.status == literal(status, literal_execute=True))
     
     if region_ids:
-        query = query.filter(Job.region_id.in_(region_ids))
+        query = query.where(Job.region_id.in_(region_ids))
     
     if is_urgent is not None:
-        query = query.filter(Job.is_urgent == is_urgent)
+        query = query.where(Job.is_urgent == is_urgent)
     
     if is_premium is not None:
-        query = query.filter(Job.is_premium == is_premium)
+        query = query.where(Job.is_premium == is_premium)
     
     # 노출 시간 체크 (필드가 있는 경우에만)
     # Prisma 스키마에는 exposureTime이 있지만 SQLAlchemy 모델에는 exposure_time으로 매핑됨
     # 필드가 없을 수 있으므로 try-except로 처리
     try:
-        query = query.filter(
+        query = query.where(
             or_(
                 Job.exposure_time <= datetime.now(),
                 Job.exposure_time.is_(None)
@@ -56,17 +75,49 @@ def get_jobs(
         # exposure_time 필드가 없으면 필터링하지 않음
         pass
     
-    return query.order_by(Job.created_at.desc()).limit(limit).offset(offset).all()
+    if keyset:
+        return keyset_query(query, Job.created_at, Job.id, after, limit)
+    return query.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit).offset(offset)
+
+
+async def get_jobs(
+    db: AsyncSession,
+    region_ids: Optional[List[str]] = None,
+    is_urgent: Optional[bool] = None,
+    is_premium: Optional[bool] = None,
+    status: str = "published",
+    limit: int = 50,
+    offset: int = 0,
+    keyset: bool = False,
+    after: Optional[Tuple[datetime, str]] = None
+) -> List[Job]:
+    """
+    공고 목록 조회
+    
+    keyset=True면 OFFSET 대신 (createdAt, id) 커서 조건으로 after 다음부터 limit + 1개 조회
+    """
+    query = build_jobs_query(
+        region_ids=region_ids,
+        is_urgent=is_urgent,
+        is_premium=is_premium,
+        status=status,
+        limit=limit,
+        offset=offset,
+        keyset=keyset,
+        after=after,
+    )
+    result = await db.execute(query)
+    return list(result.scalars().all())
 
 
-def get_job_by_id(db: Session, job_id: str) -> Optional[Job]:
+async def get_job_by_id(db: AsyncSession, job_id: str) -> Optional[Job]:
     """ID로 공고 조회"""
-    return db.query(Job).filter(Job.id == job_id).first()
+    return await db.get(Job, job_id)
 
 
-def create_job(db: Session, shop_id: str, job_data: JobCreate) -> Job:
-    """공고 생성"""
-    job = Job(
+def _new_job_values(shop_id: str, job_data: JobCreate) -> dict:
+    """새 공고 컬럼 값 (단건/일괄 생성 공통)"""
+    return dict(
         shop_id=shop_id,
         title=job_data.title,
         date=job_data.date,
@@ -84,17 +135,39 @@ def create_job(db: Session, shop_id: str, job_data: JobCreate) -> Job:
         status="published",
         exposure_time=datetime.now(),  # TODO: 노출 정책에 따라 설정
     )
+
+
+async def create_job(db: AsyncSession, shop_id: str, job_data: JobCreate) -> Job:
+    """공고 생성"""
+    job = Job(**_new_job_values(shop_id, job_data))
     
     db.add(job)
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    await db.refresh(job)
+    job_feed.upsert(job)
     
     return job
 
 
-def update_job(db: Session, job_id: str, shop_id: str, job_data: JobUpdate) -> Job:
+async def create_jobs_bulk(db: AsyncSession, shop_id: str, jobs_data: List[JobCreate]) -> List[Job]:
+    """
+    공고 일괄 생성 (반복 근무 공고 등)
+    
+    한 트랜잭션에서 다중 행 INSERT ... RETURNING 한 번으로 생성 (하나라도 실패하면 전체 롤백)
+    """
+    rows = [_new_job_values(shop_id, job_data) for job_data in jobs_data]
+    result = await db.scalars(insert(Job).returning(Job, sort_by_parameter_order=True), rows)
+    jobs = list(result.all())
+    await db.commit()
+    for job in jobs:
+        job_feed.upsert(job)
+    
+    return jobs
+
+
+async def update_job(db: AsyncSession, job_id: str, shop_id: str, job_data: JobUpdate) -> Job:
     """공고 수정"""
-    job = get_job_by_id(db, job_id)
+    job = await get_job_by_id(db, job_id)
     if not job:
         raise NotFoundException("공고를 찾을 수 없습니다")
     
@@ -105,48 +178,53 @@ def update_job(db: Session, job_id: str, shop_id: str, job_data: JobUpdate) -> J
     for key, value in update_data.items():
         setattr(job, key, value)
     
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    await db.refresh(job)
+    job_feed.upsert(job)
     
     return job
 
 
-def delete_job(db: Session, job_id: str, shop_id: str) -> None:
+async def delete_job(db: AsyncSession, job_id: str, shop_id: str) -> None:
     """공고 삭제"""
-    job = get_job_by_id(db, job_id)
+    job = await get_job_by_id(db, job_id)
     if not job:
         raise NotFoundException("공고를 찾을 수 없습니다")
     
     if job.shop_id != shop_id:
         raise AuthorizationException("공고를 삭제할 권한이 없습니다")
     
-    db.delete(job)
-    db.commit()
+    await db.delete(job)
+    await db.commit()
+    job_feed.remove(job_id)
 
 
-def apply_to_job(db: Session, job_id: str, spare_id: str, auth_header: Optional[str] = None) -> Application:
+async def apply_to_job(db: AsyncSession, job_id: str, spare_id: str, auth_header: Optional[str] = None) -> Application:
     """공고 지원 + 에너지 잠금"""
-    job = get_job_by_id(db, job_id)
+    job = await get_job_by_id(db, job_id)
     if not job:
         raise NotFoundException("공고를 찾을 수 없습니다")
     
     # 중복 지원 체크
-    existing = db.query(Application).filter(
-        and_(Application.job_id == job_id, Application.spare_id == spare_id)
-    ).first()
+    result = await db.execute(
+        select(Application).where(
+            and_(Application.job_id == job_id, Application.spare_id == spare_id)
+        )
+    )
+    existing = result.scalars().first()
     
     if existing:
         raise ConflictException("이미 지원한 공고입니다")
     
     energy_locked = False
     if job.energy > 0 and auth_header:
-        from ..config import ENERGY_SERVICE_URL
         try:
-            resp = httpx.post(
-                f"{ENERGY_SERVICE_URL}/api/energy/lock",
+            # 재시도해도 한 번만 잠기도록 Idempotency-Key를 붙여 타임아웃/5xx도 재시도
+            resp = await energy_client.post(
+                "/api/energy/lock",
                 params={"job_id": job_id, "amount": job.energy},
-                headers={"Authorization": auth_header},
-                timeout=10.0,
+                headers={"Authorization": auth_header, IDEMPOTENCY_HEADER: str(uuid.uuid4())},
+                idempotent=True,
             )
             if resp.status_code in (200, 201):
                 energy_locked = True
@@ -167,35 +245,60 @@ def apply_to_job(db: Session, job_id: str, spare_id: str, auth_header: Optional[
     )
     
     db.add(application)
-    db.commit()
-    db.refresh(application)
+    await db.commit()
+    await db.refresh(application)
     
     return application
 
 
-def get_applications_for_shop(db: Session, shop_id: str) -> List[Application]:
+async def get_applications_for_shop(db: AsyncSession, shop_id: str) -> List[Application]:
     """매장의 공고에 대한 지원 목록 (Application + Job join)"""
-    return (
-        db.query(Application)
+    result = await db.execute(
+        select(Application)
         .join(Job, Application.job_id == Job.id)
-        .filter(Job.shop_id == shop_id)
+        .where(Job.shop_id == shop_id)
         .order_by(Application.created_at.desc())
-        .all()
     )
+    return list(result.scalars().all())
+
 
+def _schedule_body(job: Job, spare_id: str) -> dict:
+    """승인된 지원의 스케줄 생성 요청 본문 (종료 시간은 시작 + 1시간)"""
+    end_time = None
+    if job.time:
+        parts = job.time.split(":")
+        if len(parts) >= 2:
+            h, m = int(parts[0]), int(parts[1])
+            end_h = (h + 1) % 24
+            end_time = f"{end_h:02d}:{m:02d}"
+    return {
+        "job_id": job.id,
+        "spare_id": spare_id,
+        "shop_id": job.shop_id,
+        "date": job.date,
+        "start_time": job.time,
+        "end_time": end_time or job.time,
+    }
 
-def approve_application(
-    db: Session,
+
+async def approve_application(
+    db: AsyncSession,
     application_id: str,
     shop_id: str,
-    auth_header: Optional[str] = None,
+    actor: Optional[dict] = None,
 ) -> Application:
-    """지원 승인 + 스케줄 생성"""
-    application = db.query(Application).filter(Application.id == application_id).first()
+    """
+    지원 승인 + 스케줄 생성
+    스케줄 생성 요청은 승인과 같은 트랜잭션에 아웃박스 이벤트로 기록하고 커밋 후 비동기 전달
+
+    Args:
+        actor: 스케줄 생성 요청에 쓸 사용자 클레임 (outbox.actor_claims)
+    """
+    application = await db.get(Application, application_id)
     if not application:
         raise NotFoundException("지원을 찾을 수 없습니다")
     
-    job = get_job_by_id(db, application.job_id)
+    job = await get_job_by_id(db, application.job_id)
     if not job or job.shop_id != shop_id:
         raise AuthorizationException("해당 지원을 승인할 권한이 없습니다")
     
@@ -203,51 +306,21 @@ def approve_application(
         raise ConflictException("이미 처리된 지원입니다")
     
     application.status = "approved"
-    db.commit()
+    outbox.enqueue(db, "schedule", "/api/schedules", body=_schedule_body(job, application.spare_id), claims=actor)
+    await db.commit()
+    outbox.notify()
     
-    # Schedule Service에 스케줄 생성 요청
-    from ..config import SCHEDULE_SERVICE_URL
-    try:
-        end_time = None
-        if job.time:
-            parts = job.time.split(":")
-            if len(parts) >= 2:
-                h, m = int(parts[0]), int(parts[1])
-                end_h = (h + 1) % 24
-                end_time = f"{end_h:02d}:{m:02d}"
-        body = {
-            "job_id": job.id,
-            "spare_id": application.spare_id,
-            "shop_id": job.shop_id,
-            "date": job.date,
-            "start_time": job.time,
-            "end_time": end_time or job.time,
-        }
-        headers = {"Content-Type": "application/json"}
-        if auth_header:
-            headers["Authorization"] = auth_header
-        resp = httpx.post(
-            f"{SCHEDULE_SERVICE_URL}/api/schedules",
-            json=body,
-            headers=headers,
-            timeout=10.0,
-        )
-        if resp.status_code not in (200, 201):
-            print(f"[Job] Schedule 생성 실패: {resp.status_code} {resp.text}")
-    except Exception as e:
-        print(f"[Job] Schedule 생성 오류: {e}")
-    
-    db.refresh(application)
+    await db.refresh(application)
     return application
 
 
-def reject_application(db: Session, application_id: str, shop_id: str) -> Application:
+async def reject_application(db: AsyncSession, application_id: str, shop_id: str) -> Application:
     """지원 거절 (에너지 잠금 시 반환은 Energy Service에서 처리 - 추후)"""
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = await db.get(Application, application_id)
     if not application:
         raise NotFoundException("지원을 찾을 수 없습니다")
     
-    job = get_job_by_id(db, application.job_id)
+    job = await get_job_by_id(db, application.job_id)
     if not job or job.shop_id != shop_id:
         raise AuthorizationException("해당 지원을 거절할 권한이 없습니다")
     
@@ -255,16 +328,81 @@ def reject_application(db: Session, application_id: str, shop_id: str) -> Applic
         raise ConflictException("이미 처리된 지원입니다")
     
     application.status = "rejected"
-    db.commit()
-    db.refresh(application)
+    await db.commit()
+    await db.refresh(application)
     return application
 
 
-def get_user_jobs(db: Session, shop_id: str) -> List[Job]:
+async def _lock_pending_applications(
+    db: AsyncSession,
+    application_ids: List[str],
+    shop_id: str,
+    action: str,
+) -> List[Tuple[Application, Job]]:
+    """
+    일괄 처리 대상 지원을 공고와 함께 한 번에 조회 (행 잠금)
+    하나라도 없거나, 다른 매장 공고이거나, 이미 처리됐으면 아무것도 바꾸지 않고 예외
+    """
+    ids = list(dict.fromkeys(application_ids))
+    result = await db.execute(
+        select(Application, Job)
+        .join(Job, Application.job_id == Job.id)
+        .where(Application.id.in_(ids))
+        .with_for_update(of=Application)
+    )
+    rows = {application.id: (application, job) for application, job in result.all()}
+    
+    missing = [i for i in ids if i not in rows]
+    if missing:
+        raise NotFoundException(f"지원을 찾을 수 없습니다: {', '.join(missing)}")
+    if any(job.shop_id != shop_id for _, job in rows.values()):
+        raise AuthorizationException(f"해당 지원을 {action}할 권한이 없습니다")
+    processed = [i for i in ids if rows[i][0].status != "pending"]
+    if processed:
+        raise ConflictException(f"이미 처리된 지원입니다: {', '.join(processed)}")
+    
+    return [rows[i] for i in ids]
+
+
+async def approve_applications_bulk(
+    db: AsyncSession,
+    application_ids: List[str],
+    shop_id: str,
+    actor: Optional[dict] = None,
+) -> List[Application]:
+    """
+    지원 일괄 승인 + 스케줄 일괄 생성
+    한 트랜잭션으로 승인하고 /api/schedules/bulk 요청 하나를 아웃박스 이벤트로 함께 기록 (커밋 후 비동기 전달)
+    """
+    pairs = await _lock_pending_applications(db, application_ids, shop_id, "승인")
+    for application, _ in pairs:
+        application.status = "approved"
+    body = {"schedules": [_schedule_body(job, application.spare_id) for application, job in pairs]}
+    outbox.enqueue(db, "schedule", "/api/schedules/bulk", body=body, claims=actor)
+    await db.commit()
+    outbox.notify()
+    
+    return [application for application, _ in pairs]
+
+
+async def reject_applications_bulk(db: AsyncSession, application_ids: List[str], shop_id: str) -> List[Application]:
+    """지원 일괄 거절 (한 트랜잭션)"""
+    pairs = await _lock_pending_applications(db, application_ids, shop_id, "거절")
+    for application, _ in pairs:
+        application.status = "rejected"
+    await db.commit()
+    return [application for application, _ in pairs]
+
+
+async def get_user_jobs(db: AsyncSession, shop_id: str) -> List[Job]:
     """사용자의 공고 목록"""
-    return db.query(Job).filter(Job.shop_id == shop_id).order_by(Job.created_at.desc()).all()
+    result = await db.execute(select(Job).where(Job.shop_id == shop_id).order_by(Job.created_at.desc()))
+    return list(result.scalars().all())
 
 
-def get_user_applications(db: Session, spare_id: str) -> List[Application]:
+async def get_user_applications(db: AsyncSession, spare_id: str) -> List[Application]:
     """사용자의 지원 목록"""
-    return db.query(Application).filter(Application.spare_id == spare_id).order_by(Application.created_at.desc()).all()
+    result = await db.execute(
+        select(Application).where(Application.spare_id == spare_id).order_by(Application.created_at.desc())
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+공고 피드 인덱스 벤치마크
+대량의 공고 데이터를 만들어 기존 단일 컬럼 인덱스와 피드용 복합/부분 인덱스
+(alembic 5b1f3c2a9d47)의 실행 계획과 지연 시간을 비교
+
+실제 공고 목록과 같은 쿼리(job_service.build_jobs_query)를 사용하며,
+별도 스키마(bench_job_feed)에 테이블을 만들어 실행하므로 기존 데이터에는 영향 없음
+(PostgreSQL 전용: 부분 인덱스 / EXPLAIN ANALYZE)
+
+실행:
+    cd services/job-service
+    BENCH_DATABASE_URL=postgresql://... python bench_job_feed_indexes.py [공고 수] [반복 횟수]
+    (BENCH_DATABASE_URL이 없으면 DATABASE_URL 사용, --keep 이면 스키마를 남김)
+"""
+
+import os
+import statistics
+import sys
+import time
+
+# 앱/shared 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+sys.path.insert(0, os.path.abspath(os.path.join(current_dir, "../..")))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+from shared.database.base import Base
+from shared.database.models.user import User
+from app.config import DATABASE_URL
+from app.models.job import Job, Region
+from app.services.job_service import build_jobs_query
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL", DATABASE_URL)
+SCHEMA = "bench_job_feed"
+
+SHOP_COUNT = 2000
+REGION_COUNT = 250
+PAGE_SIZE = 20
+
+# 마이그레이션에서 추가하는 인덱스 (모델 정의 그대로 생성)
+FEED_INDEXES = ("idx_job_status_created_at_id", "idx_job_feed_region", "idx_job_feed_urgent", "idx_job_feed_premium")
+
+SEED_SQL = """
+INSERT INTO "User" (id, password, role)
+SELECT 'shop-' || g, 'x', 'shop' FROM generate_series(1, :shops) g;
+
+INSERT INTO "Region" (id, name, type)
+SELECT 'region-' || g, '지역' || g, 'district' FROM generate_series(1, :regions) g;
+
+-- 게시 30% / 마감 60% / 임시저장 10%, 급구 5%, 프리미엄 2%
+INSERT INTO "Job" (
+    id, "shopId", title, date, time, amount, energy, "requiredCount", "regionId",
+    "isUrgent", "isPremium", status, "exposureTime", "createdAt", "updatedAt"
+)
+SELECT
+    'job-' || lpad(g::text, 9, '0'),
+    'shop-' || (1 + g % :shops),
+    '공고', '2026-01-01', '10:00', 10000, 0, 1,
+    'region-' || (1 + (g * 7919) % :regions),
+    random() < 0.05,
+    random() < 0.02,
+    CASE WHEN r < 0.3 THEN 'published' WHEN r < 0.9 THEN 'closed' ELSE 'draft' END,
+    now() - g * interval '30 seconds',
+    now() - g * interval '30 seconds',
+    now() - g * interval '30 seconds'
+FROM (SELECT g, random() AS r FROM generate_series(1, :jobs) g) s;
+"""
+
+
+def scenarios(conn) -> list:
+    """(이름, build_jobs_query 인자) 목록"""
+    regions = [f"region-{i}" for i in (1, 2, 3)]
+    # 커서 50페이지째 (약 1000번째 게시 공고 다음부터)
+    row = conn.execute(text(
+        """SELECT "createdAt", id FROM "Job" WHERE status = 'published'
+           ORDER BY "createdAt" DESC, id DESC OFFSET :n LIMIT 1"""
+    ), {"n": PAGE_SIZE * 50}).first()
+    return [
+        ("전체 피드", {}),
+        ("지역 3곳", {"region_ids": regions}),
+        ("급구", {"is_urgent": True}),
+        ("프리미엄", {"is_premium": True}),
+        ("지역 3곳 + 급구", {"region_ids": regions, "is_urgent": True}),
+        ("OFFSET 50페이지", {"offset": PAGE_SIZE * 50}),
+        ("커서 50페이지", {"keyset": True, "after": (row[0], row[1]) if row else None}),
+    ]
+
+
+def compile_query(**kwargs):
+    query = build_jobs_query(limit=PAGE_SIZE, **kwargs)
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True})
+    return str(compiled), compiled.params
+
+
+def plan_summary(node: dict) -> str:
+    """실행 계획 노드 요약 (노드 종류 + 사용 인덱스)"""
+    parts = []
+
+    def walk(n):
+        label = n["Node Type"]
+        if n.get("Index Name"):
+            label += f"({n['Index Name']})"
+        parts.append(label)
+        for child in n.get("Plans", []):
+            walk(child)
+
+    walk(node)
+    return " > ".join(parts)
+
+
+def measure(conn, name: str, kwargs: dict, repeat: int) -> dict:
+    sql, params = compile_query(**kwargs)
+    plan = conn.exec_driver_sql("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, params).scalar()[0]
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.exec_driver_sql(sql, params).fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "name": name,
+        "plan": plan_summary(plan["Plan"]),
+        "buffers": plan["Plan"].get("Shared Hit Blocks", 0) + plan["Plan"].get("Shared Read Blocks", 0),
+        "p50": statistics.median(timings),
+        "max": max(timings),
+    }
+
+
+def run_all(conn, repeat: int) -> list:
+    conn.execute(text("ANALYZE"))
+    return [measure(conn, name, kwargs, repeat) for name, kwargs in scenarios(conn)]
+
+
+def print_results(title: str, results: list) -> None:
+    print(f"\n[{title}]")
+    for r in results:
+        print(f"  {r['name']:<16} p50 {r['p50']:8.2f}ms  max {r['max']:8.2f}ms  buffers {r['buffers']:7d}")
+        print(f"  {'':<16} {r['plan']}")
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    job_count = int(args[0]) if len(args) > 0 else 500000
+    repeat = int(args[1]) if len(args) > 1 else 20
+    keep = "--keep" in sys.argv
+
+    admin = create_engine(BENCH_DATABASE_URL)
+    if admin.dialect.name != "postgresql":
+        print("PostgreSQL에서만 실행할 수 있습니다 (BENCH_DATABASE_URL 확인)")
+        sys.exit(1)
+    with admin.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(BENCH_DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    tables = [User.__table__, Region.__table__, Job.__table__]
+
+    print("=" * 70)
+    print(f"공고 피드 인덱스 벤치마크: 공고 {job_count:,}건, 쿼리당 {repeat}회, 페이지 {PAGE_SIZE}건")
+    print("=" * 70)
+
+    try:
+        with engine.begin() as conn:
+            Base.metadata.create_all(conn, tables=tables)
+            # 마이그레이션 이전 상태: 단일 컬럼 인덱스만
+            for name in FEED_INDEXES:
+                conn.execute(text(f"DROP INDEX {name}"))
+            conn.execute(text('CREATE INDEX idx_job_status ON "Job" (status)'))
+
+            started = time.perf_counter()
+            for statement in SEED_SQL.split(";"):
+                if statement.strip():
+                    conn.execute(text(statement), {"shops": SHOP_COUNT, "regions": REGION_COUNT, "jobs": job_count})
+            print(f"데이터 생성: {time.perf_counter() - started:.1f}s")
+
+        with engine.connect() as conn:
+            before = run_all(conn, repeat)
+        print_results("이전 (단일 컬럼 인덱스)", before)
+
+        with engine.begin() as conn:
+            started = time.perf_counter()
+            for index in Job.__table__.indexes:
+                if index.name in FEED_INDEXES:
+                    conn.execute(CreateIndex(index))
+            conn.execute(text("DROP INDEX idx_job_status"))
+            print(f"\n피드 인덱스 생성: {time.perf_counter() - started:.1f}s")
+
+        with engine.connect() as conn:
+            after = run_all(conn, repeat)
+        print_results("이후 (피드 복합/부분 인덱스)", after)
+
+        print("\n[p50 비교]")
+        for b, a in zip(before, after):
+            speedup = b["p50"] / a["p50"] if a["p50"] else float("inf")
+            print(f"  {b['name']:<16} {b['p50']:8.2f}ms → {a['p50']:8.2f}ms  ({speedup:5.1f}x)")
+    finally:
+        engine.dispose()
+        if not keep:
+            with admin.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin.dispose()
+
+
+if __name__ == "__main__":
+    main()
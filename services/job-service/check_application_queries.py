@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+지원 목록 API 쿼리 수 회귀 확인 스크립트
+/api/applications/my, /api/applications/shop 이 지원 건수와 관계없이
+일정한 횟수의 쿼리로 응답하는지 확인 (N+1 재발 방지)
+
+임시 SQLite DB에 데이터를 만들어 실행하므로 실제 DB에는 영향 없음
+앱 lifespan(공고 피드 재적재, 아웃박스 전달 태스크)은 실행하지 않으므로
+집계되는 쿼리는 요청이 실행한 것뿐
+
+실행:
+    cd services/job-service
+    python check_application_queries.py
+"""
+
+import os
+import sys
+import tempfile
+
+# 임시 DB (shared.database import 전에 설정)
+_db_file = os.path.join(tempfile.mkdtemp(), "check_application_queries.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_file}"
+os.environ.pop("DATABASE_REPLICA_URLS", None)
+os.environ.pop("ASYNC_DATABASE_REPLICA_URLS", None)
+
+# 앱/shared 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+sys.path.insert(0, os.path.abspath(os.path.join(current_dir, "../..")))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from shared.auth.jwt import create_access_token
+from shared.database.base import Base
+from shared.database.session import engine
+from shared.database.async_session import async_engine
+from shared.database.models.user import User
+from app.main import app
+from app.models.job import Job, Application, Region
+
+# 지원 목록 한 번에 허용하는 쿼리 수 (지원 목록 + Job + User)
+MAX_QUERIES = 3
+
+SHOP_COUNT = 5
+JOBS_PER_SHOP = 4
+
+
+class QueryCounter:
+    """비동기 엔진에서 실행된 SQL 수 집계"""
+
+    def __init__(self):
+        self.count = 0
+        event.listen(async_engine.sync_engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+def seed(spare_count: int) -> None:
+    """매장 SHOP_COUNT개 × 공고 JOBS_PER_SHOP개, spare 1명당 공고마다 지원"""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add(Region(id="r1", name="강남", type="district"))
+        jobs = []
+        for s in range(SHOP_COUNT):
+            db.add(User(id=f"shop{s}", password="x", role="shop", name=f"매장{s}"))
+            for j in range(JOBS_PER_SHOP):
+                job = Job(
+                    id=f"job{s}-{j}", shop_id=f"shop{s}", title="공고", date="2026-01-01", time="10:00",
+                    amount=10000, energy=0, required_count=1, region_id="r1", status="published",
+                )
+                jobs.append(job)
+                db.add(job)
+        for p in range(spare_count):
+            db.add(User(id=f"spare{p}", password="x", role="spare", name=f"스페어{p}"))
+            for job in jobs:
+                db.add(Application(job_id=job.id, spare_id=f"spare{p}", status="pending"))
+        db.commit()
+
+
+def measure(client: TestClient, counter: QueryCounter, path: str, user_id: str, role: str) -> tuple:
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user_id, 'role': role})}"}
+    counter.count = 0
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200, response.text
+    applications = response.json()["data"]["applications"]
+    assert all("job" in a and a["job"]["shopName"] and "spare" in a for a in applications)
+    return len(applications), counter.count
+
+
+def main():
+    counter = QueryCounter()
+    failed = False
+
+    print("=" * 60)
+    print(f"지원 목록 쿼리 수 확인 (허용: {MAX_QUERIES}회)")
+    print("=" * 60)
+
+    # with 블록 없이 만들면 lifespan을 실행하지 않음 (백그라운드 태스크 쿼리가 집계에 섞이지 않도록)
+    client = TestClient(app)
+    for spare_count in (1, 10):
+        seed(spare_count)
+        for path, user_id, role in (
+            ("/api/applications/my", "spare0", "spare"),
+            ("/api/applications/shop", "shop0", "shop"),
+        ):
+            rows, queries = measure(client, counter, path, user_id, role)
+            ok = queries <= MAX_QUERIES
+            failed = failed or not ok
+            print(f"{'✓' if ok else '✗'} {path:<26} 지원 {rows:4d}건 → 쿼리 {queries}회")
+
+    if failed:
+        print("\n✗ 지원 목록에서 N+1 쿼리가 발생합니다")
+        sys.exit(1)
+    print("\n✓ 지원 건수와 관계없이 쿼리 수가 일정합니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+메모리 공고 피드 정합성 확인 스크립트
+- 피드 조회 결과가 DB 조회(get_jobs)와 같은지 여러 필터/페이지 조합으로 비교
+- 공고 생성/수정/삭제 후 재적재 없이 피드에 바로 반영되는지 확인
+- 피드가 적재된 뒤 GET /api/jobs가 DB 쿼리 없이 응답하는지 확인
+
+임시 SQLite DB에 데이터를 만들어 실행하므로 실제 DB에는 영향 없음
+
+실행:
+    cd services/job-service
+    python check_job_feed.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+# 임시 DB (shared.database import 전에 설정)
+_db_file = os.path.join(tempfile.mkdtemp(), "check_job_feed.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_file}"
+os.environ.pop("DATABASE_REPLICA_URLS", None)
+os.environ.pop("ASYNC_DATABASE_REPLICA_URLS", None)
+# lifespan의 주기 재적재 대신 직접 적재
+os.environ["JOB_FEED_REFRESH_SECONDS"] = "3600"
+
+# 앱/shared 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+sys.path.insert(0, os.path.abspath(os.path.join(current_dir, "../..")))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from shared.auth.jwt import create_access_token
+from shared.database.base import Base
+from shared.database.session import engine
+from shared.database.async_session import AsyncSessionLocal, async_engine
+from shared.database.models.user import User
+from app.main import app
+from app.models.job import Job, Region
+from app.services.job_feed import job_feed, serialize_job
+from app.schemas.job import JobUpdate
+from app.services.job_service import get_jobs, update_job, delete_job
+
+JOB_COUNT = 400
+REGIONS = [f"r{i}" for i in range(8)]
+SHOP_ID = "shop0"
+
+
+class QueryCounter:
+    """비동기 엔진에서 실행된 SQL 수 집계"""
+
+    def __init__(self):
+        self.count = 0
+        event.listen(async_engine.sync_engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+def seed() -> None:
+    """공고 JOB_COUNT개 (같은 createdAt 다수, 예약 노출/마감 공고 포함)"""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    rng = random.Random(7)
+    base = datetime.now() - timedelta(days=1)
+    with Session(engine) as db:
+        db.add(User(id=SHOP_ID, password="x", role="shop"))
+        for region_id in REGIONS:
+            db.add(Region(id=region_id, name=region_id, type="district"))
+        for i in range(JOB_COUNT):
+            created_at = base + timedelta(minutes=rng.randint(0, 300))
+            db.add(Job(
+                id=f"job{i:04d}", shop_id=SHOP_ID, title="공고", date="2026-01-01", time="10:00",
+                amount=10000, energy=0, required_count=1, region_id=rng.choice(REGIONS),
+                is_urgent=rng.random() < 0.2, is_premium=rng.random() < 0.1,
+                status=rng.choice(["published", "published", "published", "closed", "draft"]),
+                exposure_time=created_at if rng.random() < 0.9 else datetime.now() + timedelta(hours=1),
+                created_at=created_at, updated_at=created_at,
+            ))
+        db.commit()
+
+
+def cases() -> list:
+    filters = [
+        {},
+        {"region_ids": ["r1"]},
+        {"region_ids": ["r1", "r2", "r5"]},
+        {"region_ids": ["r3", "없는지역"]},
+        {"is_urgent": True},
+        {"is_premium": False},
+        {"region_ids": ["r0", "r4"], "is_urgent": True},
+    ]
+    return [(f, limit, offset) for f in filters for limit, offset in ((20, 0), (20, 40), (7, 3), (100, 0))]
+
+
+async def db_ids(kwargs: dict, **page) -> list:
+    async with AsyncSessionLocal() as db:
+        return [job.id for job in await get_jobs(db, **kwargs, **page)]
+
+
+async def compare() -> int:
+    """필터/페이지 조합별로 피드와 DB 결과 비교, 불일치 수 반환"""
+    mismatches = 0
+    for kwargs, limit, offset in cases():
+        expected = await db_ids(kwargs, limit=limit, offset=offset)
+        actual = [e.id for e in job_feed.page(**kwargs, limit=limit, offset=offset)]
+        if expected != actual:
+            mismatches += 1
+            print(f"✗ offset {kwargs} limit={limit} offset={offset}: DB {expected[:5]}… / 피드 {actual[:5]}…")
+
+        # 커서 페이지를 끝까지 넘기며 비교
+        after = None
+        while True:
+            expected = await db_ids(kwargs, limit=limit, keyset=True, after=after)
+            actual = [e.id for e in job_feed.page(**kwargs, limit=limit, keyset=True, after=after)]
+            if expected != actual:
+                mismatches += 1
+                print(f"✗ cursor {kwargs} limit={limit} after={after}: DB {expected[:5]}… / 피드 {actual[:5]}…")
+                break
+            if len(actual) <= limit:
+                break
+            last = job_feed._index.entries[actual[limit - 1]]
+            after = last.key
+    return mismatches
+
+
+async def modify(moved: str, removed: str) -> None:
+    """공고 하나는 지역/프리미엄 변경, 하나는 삭제"""
+    async with AsyncSessionLocal() as db:
+        await update_job(db, moved, SHOP_ID, JobUpdate(region_id="r7", is_premium=True))
+        await delete_job(db, removed, SHOP_ID)
+
+
+def db_job_item(job_id: str) -> dict:
+    """같은 공고를 DB에서 읽어 목록 항목 형식으로 변환 (피드 응답 데이터 비교용)"""
+    with Session(engine) as db:
+        return serialize_job(db.get(Job, job_id))
+
+
+def main():
+    seed()
+    counter = QueryCounter()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': SHOP_ID, 'role': 'shop'})}"}
+    failed = False
+
+    print("=" * 60)
+    print("메모리 공고 피드 정합성 확인")
+    print("=" * 60)
+
+    with TestClient(app) as client:
+        loop_run = client.portal.call
+        count = loop_run(job_feed.reload, AsyncSessionLocal)
+        print(f"적재: 게시 공고 {count}건")
+
+        mismatches = loop_run(compare)
+        print(f"{'✓' if not mismatches else '✗'} 적재 직후 DB와 비교: 불일치 {mismatches}건")
+        failed = failed or bool(mismatches)
+
+        # 생성(API)/수정/삭제(서비스 함수, 라우트 없음) → 재적재 없이 반영
+        created = client.post("/api/jobs", headers=headers, json={
+            "title": "새 공고", "date": "2026-01-02", "time": "11:00", "amount": 20000, "energy": 1,
+            "required_count": 1, "region_id": "r1", "is_urgent": True,
+        })
+        assert created.status_code in (200, 201), created.text
+        new_id = created.json()["data"]["id"]
+        published = [jid for jid, e in job_feed._index.entries.items() if jid != new_id]
+        moved, removed = published[0], published[1]
+        loop_run(modify, moved, removed)
+
+        mismatches = loop_run(compare)
+        ok = not mismatches and new_id in job_feed._index.entries and removed not in job_feed._index.entries
+        print(f"{'✓' if ok else '✗'} 생성/수정/삭제 반영 후 DB와 비교: 불일치 {mismatches}건")
+        failed = failed or not ok
+
+        counter.count = 0
+        response = client.get("/api/jobs", params={"region_ids": ["r1", "r7"], "limit": 20})
+        assert response.status_code == 200, response.text
+        jobs = response.json()["data"]["jobs"]
+        ok = counter.count == 0 and jobs and jobs[0] == db_job_item(jobs[0]["id"])
+        print(f"{'✓' if ok else '✗'} GET /api/jobs 피드 응답: {len(jobs)}건, DB 쿼리 {counter.count}회")
+        failed = failed or not ok
+
+    if failed:
+        print("\n✗ 메모리 피드가 DB 조회 결과와 다릅니다")
+        sys.exit(1)
+    print("\n✓ 메모리 피드가 DB 조회 결과와 같습니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+느린 쿼리 동시성 부하 테스트
+동기 get_db(이벤트 루프에서 psycopg2 블로킹)와 get_async_db(asyncpg)를 비교
+
+느린 쿼리(pg_sleep) 요청 1개를 보내 놓고 그 동안 가벼운 쿼리 요청을 동시에 보내
+가벼운 요청의 지연 시간을 측정
+- 동기 세션: 느린 쿼리가 끝날 때까지 워커 전체가 멈춤
+- 비동기 세션: 느린 쿼리와 무관하게 가벼운 요청이 바로 처리됨
+
+실행:
+    cd services/job-service
+    DATABASE_URL=postgresql://... python load_test_async_db.py [동시 요청 수] [느린 쿼리 초]
+    (SQLite URL이면 sleep 함수를 등록해 로컬에서도 실행 가능)
+"""
+
+import asyncio
+import statistics
+import sys
+import os
+import time
+
+# shared 라이브러리 경로 추가
+current_file = os.path.abspath(__file__)
+backend_dir = os.path.abspath(os.path.join(current_file, "../../../"))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.database.session import engine, get_db
+from shared.database.async_session import async_engine, get_async_db
+
+
+def _sqlite_sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def _register_sqlite_sleep(sync_engine):
+    """SQLite에는 pg_sleep이 없으므로 같은 이름의 함수 등록"""
+    @event.listens_for(sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.create_function("pg_sleep", 1, _sqlite_sleep)
+
+
+if engine.dialect.name == "sqlite":
+    _register_sqlite_sleep(engine)
+if async_engine.dialect.name == "sqlite":
+    _register_sqlite_sleep(async_engine.sync_engine)
+
+
+def build_sync_app(slow_seconds: float) -> FastAPI:
+    """기존 방식: async def 라우트 + 동기 세션"""
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow(db: Session = Depends(get_db)):
+        db.execute(text("SELECT pg_sleep(:s)"), {"s": slow_seconds})
+        return {"ok": True}
+
+    @app.get("/fast")
+    async def fast(db: Session = Depends(get_db)):
+        db.execute(text("SELECT 1"))
+        return {"ok": True}
+
+    return app
+
+
+def build_async_app(slow_seconds: float) -> FastAPI:
+    """비동기 세션"""
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow(db: AsyncSession = Depends(get_async_db)):
+        await db.execute(text("SELECT pg_sleep(:s)"), {"s": slow_seconds})
+        return {"ok": True}
+
+    @app.get("/fast")
+    async def fast(db: AsyncSession = Depends(get_async_db)):
+        await db.execute(text("SELECT 1"))
+        return {"ok": True}
+
+    return app
+
+
+async def run(name: str, app: FastAPI, concurrency: int) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+        # 워밍업 (커넥션 풀 채우기)
+        await asyncio.gather(*(client.get("/fast") for _ in range(min(concurrency, 10))))
+
+        async def timed(path: str, delay: float = 0.0) -> float:
+            # 요청 도착 예정 시각 기준으로 측정 (루프가 막혀 있던 시간도 포함)
+            arrival = start + delay
+            await asyncio.sleep(delay)
+            response = await client.get(path)
+            assert response.status_code == 200, response.text
+            return (time.perf_counter() - arrival) * 1000
+
+        start = time.perf_counter()
+        slow_task = asyncio.create_task(timed("/slow"))
+        # 느린 쿼리 실행 중에 가벼운 요청이 조금씩 나눠 도착
+        fast = await asyncio.gather(*(timed("/fast", 0.05 + i * 0.01) for i in range(concurrency)))
+        slow_ms = await slow_task
+        total_ms = (time.perf_counter() - start) * 1000
+
+    fast.sort()
+    p95 = fast[max(0, int(len(fast) * 0.95) - 1)]
+    print(
+        f"{name:<12} 가벼운 요청 {concurrency}개: "
+        f"p50 {statistics.median(fast):7.1f}ms  p95 {p95:7.1f}ms  max {fast[-1]:7.1f}ms | "
+        f"느린 요청 {slow_ms:7.1f}ms | 전체 {total_ms:7.1f}ms"
+    )
+
+
+async def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    slow_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+
+    print("=" * 70)
+    print(f"느린 쿼리({slow_seconds}s) 진행 중 가벼운 요청 지연 ({engine.dialect.name})")
+    print("=" * 70)
+
+    await run("동기 get_db", build_sync_app(slow_seconds), concurrency)
+    await run("get_async_db", build_async_app(slow_seconds), concurrency)
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,10 @@
+-- 공고/스페어당 스케줄 하나만 허용 (job-service 아웃박스가 같은 승인을 다시 보내도 중복 생성 방지)
+-- 운영 DB에서 테이블 잠금 없이 생성 (트랜잭션 밖에서 실행)
+-- psql "$DATABASE_URL" -f add_schedule_job_spare_unique.sql
+--
+-- 중복 행이 있으면 인덱스 생성이 실패하고 INVALID 인덱스가 남으므로 먼저 확인 후 정리:
+--   SELECT "jobId", "spareId", count(*) FROM "Schedule" GROUP BY 1, 2 HAVING count(*) > 1;
+--   DROP INDEX CONCURRENTLY IF EXISTS uq_schedule_job_spare;  -- 실패 후 다시 실행할 때
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_schedule_job_spare
+    ON "Schedule" ("jobId", "spareId");
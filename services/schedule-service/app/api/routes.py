@@ -3,7 +3,8 @@ Schedule Service API 라우트
 """
 
 from fastapi import APIRouter, Depends, Query, HTTPException, status, Request, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from typing import Optional, List
 import sys
 import os
@@ -14,16 +15,20 @@ backend_dir = os.path.abspath(os.path.join(current_file, "../../../../"))
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
-from shared.database.session import get_db
+from shared.database.async_session import get_async_db, get_async_read_db
+from shared.database.pagination import split_page
+from shared.database.outbox import actor_claims
+from shared.schemas.base import PaginationParams
 from shared.responses.formats import success_response, error_response
 from shared.auth.dependencies import get_current_user_dependency, get_optional_user_dependency
 from typing import Optional as TypingOptional
 from shared.exceptions.app_exceptions import NotFoundException, ConflictException, AuthorizationException
-from ..schemas.schedule import ScheduleCreate, ScheduleUpdate, ScheduleResponse
+from ..schemas.schedule import ScheduleCreate, ScheduleBulkCreate, ScheduleUpdate, ScheduleResponse
 from ..services.schedule_service import (
     get_schedules as get_schedules_service,
     get_schedule_by_id,
     create_schedule as create_schedule_service,
+    create_schedules_bulk as create_schedules_bulk_service,
     update_schedule,
     cancel_schedule,
     get_user_schedules,
@@ -46,9 +51,12 @@ async def get_schedules(
     date: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (빈 값이면 첫 페이지, 이후 nextCursor)"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """스케줄 목록 조회"""
+    page = PaginationParams(limit=limit, cursor=cursor)
+    after = page.after()
     try:
         # ownerId가 'me'인 경우 현재 사용자 정보 사용
         if owner_id == "me":
@@ -73,15 +81,20 @@ async def get_schedules(
             else:
                 return error_response("권한이 없습니다", "FORBIDDEN", status_code=403)
         
-        schedules = get_schedules_service(
+        schedules = await get_schedules_service(
             db,
             spare_id=spare_id,
             shop_id=shop_id,
             status=status,
             date=date,
             limit=limit,
-            offset=offset
+            offset=offset,
+            keyset=page.is_cursor,
+            after=after,
         )
+        next_cursor = None
+        if page.is_cursor:
+            schedules, next_cursor = split_page(schedules, limit)
         
         # User 정보 조회를 위한 import
         try:
@@ -89,7 +102,8 @@ async def get_schedules(
             # spare_id 목록 수집
             spare_ids = list(set([s.spare_id for s in schedules]))
             # User 정보 조회
-            users = db.query(User).filter(User.id.in_(spare_ids)).all()
+            result = await db.execute(select(User).where(User.id.in_(spare_ids)))
+            users = result.scalars().all()
             user_dict = {user.id: user for user in users}
         except:
             user_dict = {}
@@ -127,6 +141,8 @@ async def get_schedules(
             
             schedules_data.append(schedule_dict)
         
+        if page.is_cursor:
+            return success_response({"schedules": schedules_data, "nextCursor": next_cursor})
         return success_response({"schedules": schedules_data})
     except Exception as e:
         import traceback
@@ -145,10 +161,10 @@ async def get_schedules(
 
 
 @router.get("/api/schedules/{schedule_id}")
-async def get_schedule(schedule_id: str, db: Session = Depends(get_db)):
+async def get_schedule(schedule_id: str, db: AsyncSession = Depends(get_async_read_db)):
     """스케줄 상세 조회"""
     try:
-        schedule = get_schedule_by_id(db, schedule_id)
+        schedule = await get_schedule_by_id(db, schedule_id)
         if not schedule:
             return error_response("스케줄을 찾을 수 없습니다", "NOT_FOUND", status_code=404)
         
@@ -176,7 +192,7 @@ async def get_schedule(schedule_id: str, db: Session = Depends(get_db)):
 async def create_schedule(
     schedule_data: ScheduleCreate,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """스케줄 생성"""
     try:
@@ -191,7 +207,7 @@ async def create_schedule(
         if not spare_id:
             return error_response("spare_id가 필요합니다", "VALIDATION_ERROR", status_code=400)
         
-        schedule = create_schedule_service(
+        schedule = await create_schedule_service(
             db,
             job_id=schedule_data.job_id,
             spare_id=spare_id,
@@ -217,11 +233,55 @@ async def create_schedule(
         return error_response("스케줄 생성 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
 
 
+@router.post("/api/schedules/bulk")
+async def create_schedules_bulk(
+    bulk_data: ScheduleBulkCreate,
+    current_user: dict = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """스케줄 일괄 생성 (지원 일괄 승인 시 job-service에서 한 번에 호출)"""
+    try:
+        if current_user.get("role") != "shop":
+            return error_response("스케줄은 매장만 생성할 수 있습니다", "FORBIDDEN", status_code=403)
+        
+        user_id = current_user.get("user_id") or current_user.get("sub")
+        items = []
+        for schedule_data in bulk_data.schedules:
+            shop_id = schedule_data.shop_id or user_id
+            if not shop_id:
+                return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
+            if not schedule_data.spare_id:
+                return error_response("spare_id가 필요합니다", "VALIDATION_ERROR", status_code=400)
+            items.append((schedule_data.job_id, schedule_data.spare_id, shop_id, schedule_data))
+        
+        schedules = await create_schedules_bulk_service(db, items)
+        
+        return success_response({
+            "schedules": [
+                {
+                    "id": schedule.id,
+                    "job_id": schedule.job_id,
+                    "spare_id": schedule.spare_id,
+                    "shop_id": schedule.shop_id,
+                    "date": schedule.date,
+                    "start_time": schedule.start_time,
+                    "end_time": schedule.end_time,
+                    "status": schedule.status,
+                    "created_at": schedule.created_at.isoformat(),
+                    "updated_at": schedule.updated_at.isoformat(),
+                }
+                for schedule in schedules
+            ]
+        }, status_code=201)
+    except Exception as e:
+        return error_response("스케줄 일괄 생성 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
+
+
 @router.post("/api/schedules/{schedule_id}/cancel")
 async def cancel_schedule_endpoint(
     schedule_id: str,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """스케줄 취소"""
     try:
@@ -229,7 +289,7 @@ async def cancel_schedule_endpoint(
         if not user_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        schedule = cancel_schedule(db, schedule_id, user_id)
+        schedule = await cancel_schedule(db, schedule_id, user_id)
         
         schedule_response = {
             "id": schedule.id,
@@ -251,7 +311,7 @@ async def cancel_schedule_endpoint(
 @router.get("/api/schedules/my")
 async def get_my_schedules(
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """내 스케줄 목록"""
     try:
@@ -260,7 +320,7 @@ async def get_my_schedules(
         if not user_id or not role:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         
-        schedules = get_user_schedules(db, user_id, role)
+        schedules = await get_user_schedules(db, user_id, role)
         
         schedules_data = []
         for schedule in schedules:
@@ -284,9 +344,8 @@ async def get_my_schedules(
 @router.post("/api/schedules/{schedule_id}/check-in")
 async def check_in_schedule_endpoint(
     schedule_id: str,
-    request: Request,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """스케줄 체크인 (Spare만, 출근 완료 시)"""
     try:
@@ -295,8 +354,7 @@ async def check_in_schedule_endpoint(
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         if current_user.get("role") != "spare":
             return error_response("체크인은 스페어만 가능합니다", "FORBIDDEN", status_code=403)
-        auth_header = request.headers.get("Authorization")
-        schedule = check_in_schedule(db, schedule_id, user_id, auth_header)
+        schedule = await check_in_schedule(db, schedule_id, user_id, actor_claims(current_user))
         schedule_data = {
             "id": schedule.id,
             "jobId": schedule.job_id,
@@ -327,7 +385,7 @@ async def confirm_schedule_endpoint(
     schedule_id: str,
     request: Request,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """근무 확인/정산 (Shop만)"""
     try:
@@ -342,7 +400,7 @@ async def confirm_schedule_endpoint(
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         if current_user.get("role") != "shop":
             return error_response("근무 확인은 매장만 가능합니다", "FORBIDDEN", status_code=403)
-        schedule, result = confirm_schedule(db, schedule_id, user_id, thumbs_up)
+        schedule, result = await confirm_schedule(db, schedule_id, user_id, thumbs_up)
         schedule_data = {
             "id": schedule.id,
             "status": schedule.status,
@@ -362,14 +420,14 @@ async def confirm_schedule_endpoint(
 @router.get("/api/work-check/stats")
 async def work_check_stats(
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """출근 체크 통계 (Spare용)"""
     try:
         user_id = current_user.get("user_id") or current_user.get("sub")
         if not user_id:
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
-        stats = get_work_check_stats(db, user_id)
+        stats = await get_work_check_stats(db, user_id)
         return success_response(stats)
     except Exception as e:
         return error_response("통계 조회 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
@@ -378,7 +436,7 @@ async def work_check_stats(
 @router.get("/api/work-check/shop-stats")
 async def shop_work_check_stats(
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Shop VIP 등급 통계 (미용실용)"""
     try:
@@ -387,7 +445,7 @@ async def shop_work_check_stats(
             return error_response("사용자 정보를 찾을 수 없습니다", "UNAUTHORIZED", status_code=401)
         if current_user.get("role") != "shop":
             return error_response("미용실만 조회 가능합니다", "FORBIDDEN", status_code=403)
-        stats = get_shop_work_check_stats(db, user_id)
+        stats = await get_shop_work_check_stats(db, user_id)
         return success_response(stats)
     except Exception as e:
         return error_response("VIP 통계 조회 중 오류가 발생했습니다", "INTERNAL_ERROR", status_code=500)
@@ -2,6 +2,8 @@
 Schedule Service 메인 애플리케이션
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import sys
@@ -15,13 +17,38 @@ if backend_dir not in sys.path:
 
 from shared.exceptions.handlers import app_exception_handler, general_exception_handler
 from shared.exceptions.app_exceptions import AppException
+from shared.database.metrics import db_metrics
+from shared.database.async_session import AsyncSessionLocal
+from shared.clients import RequestDeadlineMiddleware, close_service_clients, service_clients_snapshot
 from .api import routes
 from .config import SERVICE_PORT
+from .services.schedule_service import outbox
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명 주기
+    아웃박스 이벤트(체크인 → 에너지 반환)를 전달하는 백그라운드 태스크 실행
+    종료 시 서비스 간 호출 클라이언트의 커넥션 정리
+    """
+    task = asyncio.create_task(outbox.run(AsyncSessionLocal))
+    try:
+        yield
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await close_service_clients()
+
 
 app = FastAPI(
     title="HairSpare Schedule Service",
     description="스케줄 관리 서비스",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -33,6 +60,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 데드라인/요청 ID를 다른 서비스 호출에 전달
+app.add_middleware(RequestDeadlineMiddleware)
+
 # 예외 핸들러 등록
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
@@ -58,6 +88,14 @@ async def health():
     return {"status": "ok", "service": "schedule-service"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """
+    DB 커넥션 풀 / 쿼리 지연 시간 / 서비스 간 호출 / 아웃박스 지표
+    """
+    return {**db_metrics.snapshot(), "serviceClients": service_clients_snapshot(), "outbox": outbox.stats.snapshot()}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=SERVICE_PORT)
@@ -35,8 +35,12 @@ class Schedule(Base):
     
     __table_args__ = (
         Index("idx_schedule_job_id", "jobId"),
+        # 공고/스페어당 스케줄 하나 (승인 아웃박스 재전달 시 중복 생성 방지)
+        Index("uq_schedule_job_spare", "jobId", "spareId", unique=True),
         Index("idx_schedule_spare_id", "spareId"),
         Index("idx_schedule_shop_id", "shopId"),
         Index("idx_schedule_date", "date"),
         Index("idx_schedule_status", "status"),
+        Index("idx_schedule_spare_created_at_id", "spareId", "createdAt", "id"),  # 커서 페이지네이션
+        Index("idx_schedule_shop_created_at_id", "shopId", "createdAt", "id"),
     )
@@ -3,7 +3,7 @@ Schedule 관련 Pydantic 스키마
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 import sys
 import os
@@ -26,6 +26,15 @@ class ScheduleCreate(BaseSchema):
     end_time: Optional[str] = Field(None, description="HH:mm 형식")
 
 
+# 일괄 요청 한 번에 처리하는 최대 건수
+BULK_MAX_ITEMS = 100
+
+
+class ScheduleBulkCreate(BaseSchema):
+    """스케줄 일괄 생성 스키마 (지원 일괄 승인 시 job-service에서 호출, 한 트랜잭션)"""
+    schedules: List[ScheduleCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class ScheduleUpdate(BaseSchema):
     """스케줄 수정 스키마"""
     date: Optional[str] = Field(None, description="YYYY-MM-DD 형식")
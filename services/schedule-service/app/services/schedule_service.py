@@ -2,13 +2,13 @@
 Schedule Service 비즈니스 로직
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql, sqlite
 from typing import Optional, List, Tuple
 from datetime import datetime
 import sys
 import os
-import httpx
 
 # shared 라이브러리 경로 추가
 current_file = os.path.abspath(__file__)
@@ -17,64 +17,124 @@ if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
 from shared.exceptions.app_exceptions import NotFoundException, ConflictException, AuthorizationException
+from shared.database.pagination import keyset_query
+from shared.clients import service_client
+from shared.database.outbox import OutboxDispatcher
 from ..models.schedule import Schedule
 from ..schemas.schedule import ScheduleCreate, ScheduleUpdate
+from ..config import ENERGY_SERVICE_URL
 
+# 서비스 간 호출 클라이언트 (커넥션 풀 재사용, 데드라인 전파)
+energy_client = service_client("energy", ENERGY_SERVICE_URL)
 
-def get_schedules(
-    db: Session,
+# 체크인 후 에너지 반환은 아웃박스로 기록해 커밋 후 비동기 전달
+outbox = OutboxDispatcher("schedule", {"energy": energy_client})
+
+
+async def get_schedules(
+    db: AsyncSession,
     spare_id: Optional[str] = None,
     shop_id: Optional[str] = None,
     status: Optional[str] = None,
     date: Optional[str] = None,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    keyset: bool = False,
+    after: Optional[Tuple[datetime, str]] = None
 ) -> List[Schedule]:
-    """스케줄 목록 조회"""
-    query = db.query(Schedule)
+    """
+    스케줄 목록 조회
+    
+    keyset=True면 근무일 순서 대신 (createdAt, id) 커서 조건으로 after 다음부터 limit + 1개 조회
+    """
+    query = select(Schedule)
     
     if spare_id:
-        query = query.filter(Schedule.spare_id == spare_id)
+        query = query.where(Schedule.spare_id == spare_id)
     
     if shop_id:
-        query = query.filter(Schedule.shop_id == shop_id)
+        query = query.where(Schedule.shop_id == shop_id)
     
     if status:
-        query = query.filter(Schedule.status == status)
+        query = query.where(Schedule.status == status)
     
     if date:
-        query = query.filter(Schedule.date == date)
+        query = query.where(Schedule.date == date)
     
-    return query.order_by(Schedule.date.desc(), Schedule.start_time.desc()).limit(limit).offset(offset).all()
+    if keyset:
+        query = keyset_query(query, Schedule.created_at, Schedule.id, after, limit)
+    else:
+        query = query.order_by(Schedule.date.desc(), Schedule.start_time.desc()).limit(limit).offset(offset)
+    result = await db.execute(query)
+    return list(result.scalars().all())
 
 
-def get_schedule_by_id(db: Session, schedule_id: str) -> Optional[Schedule]:
+async def get_schedule_by_id(db: AsyncSession, schedule_id: str) -> Optional[Schedule]:
     """ID로 스케줄 조회"""
-    return db.query(Schedule).filter(Schedule.id == schedule_id).first()
-
-
-def create_schedule(db: Session, job_id: str, spare_id: str, shop_id: str, schedule_data: ScheduleCreate) -> Schedule:
-    """스케줄 생성"""
-    schedule = Schedule(
-        job_id=job_id,
-        spare_id=spare_id,
-        shop_id=shop_id,
-        date=schedule_data.date,
-        start_time=schedule_data.start_time,
-        end_time=schedule_data.end_time,
-        status="scheduled",
+    return await db.get(Schedule, schedule_id)
+
+
+def _insert_schedule_once(db: AsyncSession):
+    """
+    스케줄 INSERT (같은 공고/스페어의 스케줄이 이미 있으면 아무것도 하지 않음)
+    uq_schedule_job_spare 유니크 인덱스로 판단하므로 같은 요청이 동시에 와도 스케줄은 하나
+    """
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(Schedule).on_conflict_do_nothing(index_elements=[Schedule.job_id, Schedule.spare_id])
+
+
+def _schedule_row(job_id: str, spare_id: str, shop_id: str, schedule_data: ScheduleCreate) -> dict:
+    return {
+        "job_id": job_id,
+        "spare_id": spare_id,
+        "shop_id": shop_id,
+        "date": schedule_data.date,
+        "start_time": schedule_data.start_time,
+        "end_time": schedule_data.end_time,
+        "status": "scheduled",
+    }
+
+
+async def create_schedule(db: AsyncSession, job_id: str, spare_id: str, shop_id: str, schedule_data: ScheduleCreate) -> Schedule:
+    """
+    스케줄 생성
+    같은 공고/스페어의 스케줄이 이미 있으면 새로 만들지 않고 그대로 반환
+    (job-service 아웃박스가 응답을 받지 못해 같은 요청을 다시 보내도 스케줄은 하나)
+    """
+    await db.execute(_insert_schedule_once(db).values(**_schedule_row(job_id, spare_id, shop_id, schedule_data)))
+    schedule = await db.scalar(
+        select(Schedule).where(Schedule.job_id == job_id, Schedule.spare_id == spare_id)
     )
-    
-    db.add(schedule)
-    db.commit()
-    db.refresh(schedule)
+    await db.commit()
     
     return schedule
 
 
-def update_schedule(db: Session, schedule_id: str, user_id: str, schedule_data: ScheduleUpdate) -> Schedule:
+async def create_schedules_bulk(db: AsyncSession, schedules: List[Tuple[str, str, str, ScheduleCreate]]) -> List[Schedule]:
+    """
+    스케줄 일괄 생성 (한 트랜잭션)
+    이미 있는 공고/스페어의 스케줄은 새로 만들지 않고 기존 스케줄을 돌려줌 (create_schedule과 같음)
+    
+    Args:
+        schedules: (job_id, spare_id, shop_id, schedule_data) 목록
+    
+    Returns:
+        요청 순서대로의 스케줄 목록
+    """
+    rows = [_schedule_row(*item) for item in schedules]
+    await db.execute(_insert_schedule_once(db), rows)
+    
+    job_ids = list({job_id for job_id, _, _, _ in schedules})
+    result = await db.scalars(select(Schedule).where(Schedule.job_id.in_(job_ids)))
+    existing = {(schedule.job_id, schedule.spare_id): schedule for schedule in result.all()}
+    await db.commit()
+    
+    return [existing[(job_id, spare_id)] for job_id, spare_id, _, _ in schedules]
+
+
+async def update_schedule(db: AsyncSession, schedule_id: str, user_id: str, schedule_data: ScheduleUpdate) -> Schedule:
     """스케줄 수정"""
-    schedule = get_schedule_by_id(db, schedule_id)
+    schedule = await get_schedule_by_id(db, schedule_id)
     if not schedule:
         raise NotFoundException("스케줄을 찾을 수 없습니다")
     
@@ -86,15 +146,15 @@ def update_schedule(db: Session, schedule_id: str, user_id: str, schedule_data:
     for key, value in update_data.items():
         setattr(schedule, key, value)
     
-    db.commit()
-    db.refresh(schedule)
+    await db.commit()
+    await db.refresh(schedule)
     
     return schedule
 
 
-def cancel_schedule(db: Session, schedule_id: str, user_id: str) -> Schedule:
+async def cancel_schedule(db: AsyncSession, schedule_id: str, user_id: str) -> Schedule:
     """스케줄 취소"""
-    schedule = get_schedule_by_id(db, schedule_id)
+    schedule = await get_schedule_by_id(db, schedule_id)
     if not schedule:
         raise NotFoundException("스케줄을 찾을 수 없습니다")
     
@@ -107,41 +167,46 @@ def cancel_schedule(db: Session, schedule_id: str, user_id: str) -> Schedule:
         raise ConflictException("이미 완료되거나 취소된 스케줄입니다")
     
     schedule.status = "cancelled"
-    db.commit()
-    db.refresh(schedule)
+    await db.commit()
+    await db.refresh(schedule)
     
     return schedule
 
 
-def get_user_schedules(db: Session, user_id: str, role: str) -> List[Schedule]:
+async def get_user_schedules(db: AsyncSession, user_id: str, role: str) -> List[Schedule]:
     """사용자의 스케줄 목록"""
     if role == "spare":
-        return db.query(Schedule).filter(Schedule.spare_id == user_id).order_by(Schedule.date.desc(), Schedule.start_time.desc()).all()
+        query = select(Schedule).where(Schedule.spare_id == user_id)
     elif role == "shop":
-        return db.query(Schedule).filter(Schedule.shop_id == user_id).order_by(Schedule.date.desc(), Schedule.start_time.desc()).all()
+        query = select(Schedule).where(Schedule.shop_id == user_id)
     else:
         return []
+    result = await db.execute(query.order_by(Schedule.date.desc(), Schedule.start_time.desc()))
+    return list(result.scalars().all())
 
 
-def _get_job_energy(db: Session, job_id: str) -> int:
+async def _get_job_energy(db: AsyncSession, job_id: str) -> int:
     """Job의 energy 수량 조회 (공유 DB)"""
-    result = db.execute(text('SELECT energy FROM "Job" WHERE id = :job_id'), {"job_id": job_id})
+    result = await db.execute(text('SELECT energy FROM "Job" WHERE id = :job_id'), {"job_id": job_id})
     row = result.fetchone()
     return int(row[0]) if row and row[0] is not None else 0
 
 
-def check_in_schedule(
-    db: Session,
+async def check_in_schedule(
+    db: AsyncSession,
     schedule_id: str,
     user_id: str,
-    auth_header: Optional[str] = None,
+    actor: Optional[dict] = None,
 ) -> Schedule:
     """
     스케줄 체크인 (Spare만 가능)
     - check_in_time 설정, status=completed
-    - Energy Service에 에너지 반환 요청
+    - Energy Service 에너지 반환 요청을 같은 트랜잭션에 아웃박스 이벤트로 기록 (커밋 후 비동기 전달)
+
+    Args:
+        actor: 에너지 반환 요청에 쓸 스페어 클레임 (outbox.actor_claims, 없으면 반환 요청 안 함)
     """
-    schedule = get_schedule_by_id(db, schedule_id)
+    schedule = await get_schedule_by_id(db, schedule_id)
     if not schedule:
         raise NotFoundException("스케줄을 찾을 수 없습니다")
 
@@ -151,32 +216,26 @@ def check_in_schedule(
     if schedule.status != "scheduled":
         raise ConflictException("이미 완료되었거나 취소된 스케줄입니다")
 
-    energy_amount = _get_job_energy(db, schedule.job_id)
-
-    # Energy Service에 반환 요청 (스페어의 에너지 잠금 해제)
-    if energy_amount > 0 and auth_header:
-        from ..config import ENERGY_SERVICE_URL
-        try:
-            resp = httpx.post(
-                f"{ENERGY_SERVICE_URL}/api/energy/return",
-                params={"job_id": schedule.job_id, "amount": energy_amount},
-                headers={"Authorization": auth_header},
-                timeout=10.0,
-            )
-            if resp.status_code >= 400:
-                print(f"[Schedule] Energy return 실패: {resp.status_code} {resp.text}")
-        except Exception as e:
-            print(f"[Schedule] Energy return 호출 실패: {e}")
+    energy_amount = await _get_job_energy(db, schedule.job_id)
+
+    # Energy Service에 반환 요청 (스페어의 에너지 잠금 해제) - 이벤트 ID가 Idempotency-Key라 재전달해도 한 번만 반환
+    if energy_amount > 0 and actor:
+        outbox.enqueue(
+            db, "energy", "/api/energy/return",
+            params={"job_id": schedule.job_id, "amount": energy_amount},
+            claims=actor,
+        )
 
     schedule.check_in_time = datetime.now()
     schedule.status = "completed"
-    db.commit()
-    db.refresh(schedule)
+    await db.commit()
+    outbox.notify()
+    await db.refresh(schedule)
     return schedule
 
 
-def confirm_schedule(
-    db: Session,
+async def confirm_schedule(
+    db: AsyncSession,
     schedule_id: str,
     user_id: str,
     thumbs_up: bool = False,
@@ -187,7 +246,7 @@ def confirm_schedule(
     - thumbs_up: 따봉 (추후 ThumbsUp 테이블에 저장)
     - 에너지 반환은 Spare 체크인 시에만 처리 (Shop 확인은 완료 표시만)
     """
-    schedule = get_schedule_by_id(db, schedule_id)
+    schedule = await get_schedule_by_id(db, schedule_id)
     if not schedule:
         raise NotFoundException("스케줄을 찾을 수 없습니다")
 
@@ -201,30 +260,29 @@ def confirm_schedule(
         schedule.check_in_time = schedule.check_in_time or datetime.now()
         schedule.status = "completed"
 
-    db.commit()
-    db.refresh(schedule)
+    await db.commit()
+    await db.refresh(schedule)
 
-    energy_amount = _get_job_energy(db, schedule.job_id)
+    energy_amount = await _get_job_energy(db, schedule.job_id)
     return schedule, {"amount": 0, "returnedEnergy": energy_amount if schedule.status == "completed" else 0}
 
 
-def get_work_check_stats(db: Session, user_id: str) -> dict:
+async def get_work_check_stats(db: AsyncSession, user_id: str) -> dict:
     """
     출근 체크 통계 (Spare용)
     - consecutiveDays: 최근 연속 출근 일수
     - energyFromWork: 근무로 받은 에너지 (체크인 완료 건 수 * 평균 등, 또는 별도 집계)
     """
     from datetime import timedelta
-    from sqlalchemy import func
 
-    schedules = (
-        db.query(Schedule)
-        .filter(Schedule.spare_id == user_id)
-        .filter(Schedule.status == "completed")
-        .filter(Schedule.check_in_time.isnot(None))
+    result = await db.execute(
+        select(Schedule)
+        .where(Schedule.spare_id == user_id)
+        .where(Schedule.status == "completed")
+        .where(Schedule.check_in_time.isnot(None))
         .order_by(Schedule.check_in_time.desc())
-        .all()
     )
+    schedules = result.scalars().all()
 
     # 체크인 날짜별로 그룹화 (하루에 여러 건이어도 1일로)
     check_dates = set()
@@ -250,20 +308,19 @@ def get_work_check_stats(db: Session, user_id: str) -> dict:
     return {"consecutiveDays": consecutive_days, "energyFromWork": energy_from_work}
 
 
-def get_shop_work_check_stats(db: Session, shop_id: str) -> dict:
+async def get_shop_work_check_stats(db: AsyncSession, shop_id: str) -> dict:
     """
     Shop VIP 등급 통계
     - totalCompleted: 완료한 스케줄 수
     - thumbsUpReceived: 받은 따봉 수 (추후 ThumbsUp 테이블 연동)
     - vipLevel: bronze | silver | gold | platinum | vip
     """
-    from sqlalchemy import func
-
     total_completed = (
-        db.query(func.count(Schedule.id))
-        .filter(Schedule.shop_id == shop_id)
-        .filter(Schedule.status == "completed")
-        .scalar()
+        await db.scalar(
+            select(func.count(Schedule.id))
+            .where(Schedule.shop_id == shop_id)
+            .where(Schedule.status == "completed")
+        )
         or 0
     )
 
@@ -2,25 +2,43 @@
 FastAPI 인증 의존성
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional, Dict, Any
 from .jwt import verify_token
+from .internal import INTERNAL_CLAIMS_HEADER, verify_internal_claims
 
-security = HTTPBearer()
+# 내부 클레임 헤더만 있는 요청도 허용해야 하므로 Bearer 헤더가 없어도 여기서 거절하지 않음
+security = HTTPBearer(auto_error=False)
+
+
+def _not_authenticated() -> HTTPException:
+    """Bearer 헤더가 없을 때 (기존 HTTPBearer(auto_error=True)와 같은 403 응답 유지)"""
+    return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated")
 
 
 def get_current_user_dependency(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Dict[str, Any]:
     """
     FastAPI 의존성: 현재 사용자 정보 추출
     
+    API Gateway가 검증 후 전달한 내부 클레임 헤더(X-Internal-Claims)가 있으면
+    JWT를 다시 디코딩하지 않고 그 클레임을 사용
+    
     사용 예:
         @app.get("/api/users/me")
         def get_me(current_user: dict = Depends(get_current_user_dependency)):
             return current_user
     """
+    claims = verify_internal_claims(request.headers.get(INTERNAL_CLAIMS_HEADER))
+    if claims is not None:
+        return claims
+    
+    if credentials is None:
+        raise _not_authenticated()
+    
     token = credentials.credentials
     payload = verify_token(token)
     
@@ -35,11 +53,16 @@ def get_current_user_dependency(
 
 
 def get_optional_user_dependency(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[Dict[str, Any]]:
     """
     선택적 인증 의존성 (인증되지 않은 사용자도 허용)
     """
+    claims = verify_internal_claims(request.headers.get(INTERNAL_CLAIMS_HEADER))
+    if claims is not None:
+        return claims
+    
     if credentials is None:
         return None
     
@@ -0,0 +1,105 @@
+"""
+내부 인증 클레임 헤더
+API Gateway가 JWT를 한 번 검증한 뒤 클레임을 서명된 헤더로 서비스에 전달
+서비스는 JWT를 다시 디코딩하지 않고 헤더만 확인
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from .jwt import SECRET_KEY
+
+# 게이트웨이 → 서비스 클레임 헤더
+INTERNAL_CLAIMS_HEADER = "X-Internal-Claims"
+
+# 내부 헤더 서명 키 (게이트웨이와 모든 서비스가 같은 값을 사용해야 함)
+INTERNAL_AUTH_SECRET = os.getenv("INTERNAL_AUTH_SECRET", SECRET_KEY).encode()
+
+# 검증된 헤더 캐시 크기 (같은 토큰의 반복 요청은 서명 검증/JSON 파싱 생략)
+INTERNAL_CLAIMS_CACHE_SIZE = int(os.getenv("INTERNAL_CLAIMS_CACHE_SIZE", "10000"))
+
+_verified: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+# 인증 의존성은 동기 함수라 스레드풀에서 동시에 실행되므로 캐시 접근은 잠금 안에서
+_verified_lock = threading.Lock()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _signature(body: str) -> str:
+    return _b64encode(hmac.new(INTERNAL_AUTH_SECRET, body.encode(), hashlib.sha256).digest())
+
+
+def _expiry(claims: Dict[str, Any]) -> float:
+    exp = claims.get("exp")
+    return float(exp) if isinstance(exp, (int, float)) else float("inf")
+
+
+def sign_internal_claims(claims: Dict[str, Any]) -> str:
+    """
+    클레임을 내부 헤더 값으로 서명
+
+    Args:
+        claims: 검증된 JWT 페이로드 (exp 포함)
+
+    Returns:
+        "<base64url JSON>.<base64url HMAC-SHA256>" 형식 문자열
+    """
+    body = _b64encode(json.dumps(claims, separators=(",", ":"), default=str).encode())
+    return f"{body}.{_signature(body)}"
+
+
+def verify_internal_claims(value: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    내부 헤더 값 검증
+
+    Args:
+        value: X-Internal-Claims 헤더 값
+
+    Returns:
+        클레임 딕셔너리 복사본 (서명 불일치, 형식 오류, 만료 시 None)
+    """
+    if not value:
+        return None
+
+    with _verified_lock:
+        cached = _verified.get(value)
+        if cached is not None:
+            claims, expires_at = cached
+            if time.time() < expires_at:
+                _verified.move_to_end(value)
+                return dict(claims)
+            _verified.pop(value, None)
+            return None
+
+    body, _, signature = value.partition(".")
+    if not signature or not hmac.compare_digest(signature, _signature(body)):
+        return None
+    try:
+        claims = json.loads(_b64decode(body))
+    except (ValueError, json.JSONDecodeError):
+        return None
+    if not isinstance(claims, dict):
+        return None
+
+    expires_at = _expiry(claims)
+    if time.time() >= expires_at:
+        return None
+
+    with _verified_lock:
+        _verified[value] = (claims, expires_at)
+        if len(_verified) > INTERNAL_CLAIMS_CACHE_SIZE:
+            _verified.popitem(last=False)
+    # 캐시한 클레임은 다른 요청과 공유하므로 호출자에게는 복사본 반환
+    return dict(claims)
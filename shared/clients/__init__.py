@@ -0,0 +1,24 @@
+"""
+서비스 간 통신 공통 모듈
+풀링/재시도/데드라인 전파를 적용한 비동기 HTTP 클라이언트
+"""
+
+from .service_client import (
+    IDEMPOTENCY_HEADER,
+    ServiceClient,
+    DeadlineExceeded,
+    RequestDeadlineMiddleware,
+    service_client,
+    service_clients_snapshot,
+    close_service_clients,
+)
+
+__all__ = [
+    "IDEMPOTENCY_HEADER",
+    "ServiceClient",
+    "DeadlineExceeded",
+    "RequestDeadlineMiddleware",
+    "service_client",
+    "service_clients_snapshot",
+    "close_service_clients",
+]
@@ -0,0 +1,280 @@
+"""
+서비스 간 비동기 HTTP 클라이언트
+대상 서비스마다 httpx.AsyncClient 하나를 프로세스 수명 동안 유지해 커넥션을 재사용
+
+- 멱등 요청(GET/HEAD/PUT/DELETE/OPTIONS, 또는 idempotent=True)은
+  연결 실패/타임아웃/502·503·504 응답 시 지수 백오프 + 지터로 재시도
+  비멱등 요청은 요청이 나가기 전 실패(연결 실패)만 재시도
+- 들어온 요청의 남은 시간(X-Request-Timeout-Ms)을 데드라인으로 삼아
+  시도별 타임아웃과 재시도 대기를 그 안으로 제한하고, 남은 시간을 다음 서비스로 전달
+- 대상별 호출 수/오류/재시도/지연 시간 히스토그램 집계 (GET /metrics)
+
+사용 예:
+    energy_client = service_client("energy", ENERGY_SERVICE_URL)
+    resp = await energy_client.post("/api/energy/lock", params=..., headers=...)
+"""
+
+import asyncio
+import contextvars
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+import httpx
+from ..database.metrics import LatencyHistogram
+
+# 요청 남은 시간(ms) 헤더 - 시계가 다른 호스트 사이에서도 쓰도록 절대 시각 대신 남은 시간 전달
+DEADLINE_HEADER = "X-Request-Timeout-Ms"
+REQUEST_ID_HEADER = "X-Request-ID"
+# 같은 키로 다시 보낸 요청은 대상 서비스가 한 번만 처리 (POST를 idempotent=True로 재시도할 때 함께 전송)
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+SERVICE_CLIENT_TIMEOUT = float(os.getenv("SERVICE_CLIENT_TIMEOUT", "10.0"))
+SERVICE_CLIENT_CONNECT_TIMEOUT = float(os.getenv("SERVICE_CLIENT_CONNECT_TIMEOUT", "3.0"))
+SERVICE_CLIENT_MAX_CONNECTIONS = int(os.getenv("SERVICE_CLIENT_MAX_CONNECTIONS", "50"))
+SERVICE_CLIENT_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("SERVICE_CLIENT_MAX_KEEPALIVE_CONNECTIONS", "20"))
+SERVICE_CLIENT_KEEPALIVE_EXPIRY = float(os.getenv("SERVICE_CLIENT_KEEPALIVE_EXPIRY", "30.0"))
+# 첫 시도 이후 최대 재시도 횟수
+SERVICE_CLIENT_RETRIES = int(os.getenv("SERVICE_CLIENT_RETRIES", "2"))
+# 재시도 대기: 0 ~ min(MAX, BASE * 2^n) 사이 무작위 (full jitter)
+SERVICE_CLIENT_BACKOFF_BASE = float(os.getenv("SERVICE_CLIENT_BACKOFF_BASE", "0.1"))
+SERVICE_CLIENT_BACKOFF_MAX = float(os.getenv("SERVICE_CLIENT_BACKOFF_MAX", "1.0"))
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+RETRY_STATUS_CODES = frozenset((502, 503, 504))
+
+# 현재 요청의 데드라인(time.monotonic 기준)과 요청 ID
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """요청 데드라인이 지나 다음 서비스 호출을 보내지 않음"""
+
+
+def remaining_seconds() -> Optional[float]:
+    """현재 요청의 남은 시간 (데드라인이 없으면 None)"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class RequestDeadlineMiddleware:
+    """
+    들어온 요청의 데드라인/요청 ID를 contextvar에 저장하는 ASGI 미들웨어
+    (이 요청 처리 중 ServiceClient로 나가는 호출에 이어서 전달)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        deadline = None
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-request-timeout-ms":
+                try:
+                    deadline = time.monotonic() + max(float(value), 0.0) / 1000
+                except ValueError:
+                    pass
+            elif key == b"x-request-id":
+                request_id = value.decode("latin-1")
+        deadline_token = _deadline.set(deadline)
+        request_id_token = _request_id.set(request_id)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _deadline.reset(deadline_token)
+            _request_id.reset(request_id_token)
+
+
+class ServiceClientStats:
+    """대상 서비스 하나의 호출 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.deadline_exceeded = 0
+        self.status: Dict[str, int] = {}
+        self.latency = LatencyHistogram()
+
+    def record(self, elapsed_ms: float, status_code: Optional[int], retries: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.retries += retries
+            self.latency.observe(elapsed_ms)
+            if status_code is None or status_code >= 500:
+                self.errors += 1
+            key = str(status_code) if status_code is not None else "error"
+            self.status[key] = self.status.get(key, 0) + 1
+
+    def record_deadline(self) -> None:
+        with self._lock:
+            self.deadline_exceeded += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "retries": self.retries,
+                "deadlineExceeded": self.deadline_exceeded,
+                "status": dict(self.status),
+                "latency": self.latency.snapshot(),
+            }
+
+
+class ServiceClient:
+    """대상 서비스 하나에 대한 풀링/재시도/데드라인 적용 클라이언트"""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        timeout: float = SERVICE_CLIENT_TIMEOUT,
+        retries: int = SERVICE_CLIENT_RETRIES,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.name = name
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retries = retries
+        self.stats = ServiceClientStats()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 이벤트 루프 안에서 처음 사용할 때 생성 (import 시점에는 루프가 없을 수 있음)
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=min(SERVICE_CLIENT_CONNECT_TIMEOUT, self.timeout)),
+                limits=httpx.Limits(
+                    max_connections=SERVICE_CLIENT_MAX_CONNECTIONS,
+                    max_keepalive_connections=SERVICE_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=SERVICE_CLIENT_KEEPALIVE_EXPIRY,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """
+        요청 전송 (재시도/데드라인 적용)
+
+        Args:
+            idempotent: 재시도 가능 여부 (None이면 메서드로 판단, Idempotency-Key를 보내는 POST는 True로 지정)
+            timeout: 이 호출의 시도별 타임아웃 (기본값: 클라이언트 timeout)
+
+        Raises:
+            DeadlineExceeded: 요청 데드라인이 이미 지남
+            httpx.HTTPError: 재시도 후에도 전송 실패
+        """
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        attempt_timeout = timeout or self.timeout
+        headers = dict(headers or {})
+        request_id = _request_id.get()
+        if request_id and REQUEST_ID_HEADER not in headers:
+            headers[REQUEST_ID_HEADER] = request_id
+
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            remaining = remaining_seconds()
+            if remaining is not None and remaining <= 0:
+                self.stats.record_deadline()
+                raise DeadlineExceeded(f"{self.name}: 요청 데드라인 초과")
+            this_timeout = attempt_timeout if remaining is None else min(attempt_timeout, remaining)
+            headers[DEADLINE_HEADER] = str(int(this_timeout * 1000))
+
+            retry_reason = None
+            try:
+                response = await self.client.request(
+                    method,
+                    path,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                    timeout=httpx.Timeout(this_timeout, connect=min(SERVICE_CLIENT_CONNECT_TIMEOUT, this_timeout)),
+                )
+                if not (idempotent and response.status_code in RETRY_STATUS_CODES):
+                    self.stats.record((time.perf_counter() - started) * 1000, response.status_code, attempt)
+                    return response
+                retry_reason = response
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # 요청이 나가기 전 실패 - 비멱등 요청도 재시도 가능
+                retry_reason = e
+            except httpx.TransportError as e:
+                if not idempotent:
+                    self.stats.record((time.perf_counter() - started) * 1000, None, attempt)
+                    raise
+                retry_reason = e
+
+            backoff = random.uniform(0, min(SERVICE_CLIENT_BACKOFF_MAX, SERVICE_CLIENT_BACKOFF_BASE * (2 ** attempt)))
+            remaining = remaining_seconds()
+            if attempt >= self.retries or (remaining is not None and remaining <= backoff):
+                self.stats.record(
+                    (time.perf_counter() - started) * 1000,
+                    retry_reason.status_code if isinstance(retry_reason, httpx.Response) else None,
+                    attempt,
+                )
+                if isinstance(retry_reason, httpx.Response):
+                    return retry_reason
+                raise retry_reason
+            if isinstance(retry_reason, httpx.Response):
+                await retry_reason.aclose()
+            attempt += 1
+            await asyncio.sleep(backoff)
+
+    async def get(self, path: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", path, **kwargs)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_clients: Dict[str, ServiceClient] = {}
+
+
+def service_client(name: str, base_url: str, **kwargs) -> ServiceClient:
+    """대상 서비스 클라이언트 조회 (없으면 생성, 프로세스 공용)"""
+    client = _clients.get(name)
+    if client is None:
+        client = _clients[name] = ServiceClient(name, base_url, **kwargs)
+    return client
+
+
+def service_clients_snapshot() -> Dict[str, Any]:
+    """대상 서비스별 호출 통계"""
+    return {name: client.stats.snapshot() for name, client in _clients.items()}
+
+
+async def close_service_clients() -> None:
+    """앱 종료 시 모든 클라이언트의 커넥션 정리"""
+    for client in list(_clients.values()):
+        await client.aclose()
@@ -5,5 +5,8 @@ SQLAlchemy 설정 및 세션 관리
 
 from .base import Base
 from .session import get_db, engine
+from .async_session import get_async_db, get_async_read_db, async_engine
+from .replica import get_read_db
+from .offload import run_sync, offloaded, offload_pool
 
-__all__ = ["Base", "get_db", "engine"]
+__all__ = ["Base", "get_db", "engine", "get_async_db", "get_async_read_db", "get_read_db", "async_engine", "run_sync", "offloaded", "offload_pool"]
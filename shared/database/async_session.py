@@ -0,0 +1,115 @@
+"""
+비동기 데이터베이스 세션 관리
+asyncpg 드라이버 기반 AsyncSession - 쿼리 대기 중에도 이벤트 루프가 다른 요청을 처리
+"""
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from typing import AsyncGenerator
+import os
+from .metrics import db_metrics, InstrumentedAsyncAdaptedQueuePool
+from .session import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE
+from .replica import (
+    DATABASE_REPLICA_URLS,
+    WRITE_METHODS,
+    ReplicaRoutingSession,
+    ReplicaSet,
+    recent_writers,
+    split_urls,
+    writer_key,
+)
+
+
+def to_async_url(url: str) -> str:
+    """
+    동기 드라이버 URL을 비동기 드라이버 URL로 변환
+    (postgresql://, postgres://, postgresql+psycopg2:// → postgresql+asyncpg://)
+    (로컬 개발용 sqlite:// → sqlite+aiosqlite://)
+    """
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+# 비동기 데이터베이스 URL (ASYNC_DATABASE_URL이 없으면 DATABASE_URL에서 변환)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+# 비동기 레플리카 URL (ASYNC_DATABASE_REPLICA_URLS가 없으면 DATABASE_REPLICA_URLS에서 변환)
+ASYNC_DATABASE_REPLICA_URLS = split_urls(os.getenv("ASYNC_DATABASE_REPLICA_URLS", "")) or [
+    to_async_url(url) for url in DATABASE_REPLICA_URLS
+]
+
+
+def _create_async_engine(url: str, name: str) -> AsyncEngine:
+    # 풀 설정은 동기 엔진과 동일한 환경변수 사용
+    created = create_async_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,  # 체크아웃 대기 시간 측정
+    )
+    db_metrics.instrument(created.sync_engine, name, capacity=DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    return created
+
+
+# 비동기 엔진 생성
+async_engine = _create_async_engine(ASYNC_DATABASE_URL, "async")
+
+# 비동기 레플리카 엔진 (라우팅 세션은 동기 엔진 단위로 바인딩)
+async_replica_engines = [
+    _create_async_engine(url, f"async-replica-{i}") for i, url in enumerate(ASYNC_DATABASE_REPLICA_URLS)
+]
+async_replicas = ReplicaSet([replica.sync_engine for replica in async_replica_engines])
+
+# 비동기 세션 팩토리
+# commit 후 속성을 만료시키면 접근 시 지연 로딩(동기 I/O)이 발생하므로 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# 비동기 읽기 세션 팩토리 (조회는 레플리카, 쓰기 이후는 프라이머리)
+AsyncReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=ReplicaRoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    primary=async_engine.sync_engine,
+    replicas=async_replicas,
+)
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    비동기 데이터베이스 세션 의존성
+    FastAPI에서 사용
+    
+    쓰기 요청이 끝나면 해당 사용자의 읽기 세션을 잠시 프라이머리로 고정
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+    if async_replicas and request.method in WRITE_METHODS:
+        recent_writers.pin(writer_key(request))
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 전용 비동기 데이터베이스 세션 의존성
+    목록/통계 조회처럼 약간의 복제 지연을 허용하는 엔드포인트에서 사용
+    (레플리카가 없으면 get_async_db와 동일)
+    """
+    if not async_replicas:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+    pinned = recent_writers.is_pinned(writer_key(request))
+    async with AsyncReadSessionLocal(pinned=pinned) as db:
+        yield db
@@ -0,0 +1,29 @@
+-- 트랜잭션 아웃박스 (shared/database/outbox.py)
+-- Job/Schedule Service가 다른 서비스로 보낼 요청을 로컬 트랜잭션과 함께 기록
+-- psql "$DATABASE_URL" -f shared/database/create_outbox_events.sql
+
+CREATE TABLE IF NOT EXISTS "OutboxEvent" (
+    "id"            TEXT PRIMARY KEY,
+    "service"       TEXT NOT NULL,
+    "destination"   TEXT NOT NULL,
+    "method"        TEXT NOT NULL DEFAULT 'POST',
+    "path"          TEXT NOT NULL,
+    "params"        TEXT,
+    "body"          TEXT,
+    "claims"        TEXT,
+    "status"        TEXT NOT NULL DEFAULT 'pending',
+    "attempts"      INTEGER NOT NULL DEFAULT 0,
+    "nextAttemptAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "lastError"     TEXT,
+    "createdAt"     TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "deliveredAt"   TIMESTAMP(3)
+);
+
+-- 디스패처가 전달할 이벤트 조회 (대기 중인 것만)
+CREATE INDEX IF NOT EXISTS idx_outbox_event_pending
+    ON "OutboxEvent" ("service", "nextAttemptAt")
+    WHERE "status" = 'pending';
+
+-- 오래된 전달 완료 이벤트 삭제
+CREATE INDEX IF NOT EXISTS idx_outbox_event_delivered_at
+    ON "OutboxEvent" ("deliveredAt");
@@ -0,0 +1,250 @@
+"""
+데이터베이스 커넥션 풀 / 쿼리 계측
+- 커넥션 체크아웃 대기 시간, 풀 포화도(사용 중 커넥션 / 최대 커넥션), 타임아웃 횟수
+- 정규화된 SQL별 실행 시간 히스토그램
+- 임계값(DB_SLOW_QUERY_MS)을 넘는 느린 쿼리 로그
+
+각 서비스의 /metrics 엔드포인트에서 db_metrics.snapshot()을 그대로 반환
+"""
+
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 느린 쿼리 로그 임계값 (ms, 0이면 로그 끔)
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+
+# SQL별 통계를 보관할 최대 개수 (넘으면 "<other>"로 합산)
+DB_METRICS_MAX_STATEMENTS = int(os.getenv("DB_METRICS_MAX_STATEMENTS", "500"))
+
+# 히스토그램 버킷 상한 (ms), 마지막 버킷은 그 이상 전부
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*(?:\?|%\(\w+\)s|%s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|%s|\$\d+|:\w+))*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    """
+    통계 키용 SQL 정규화
+    리터럴은 ?로, IN 목록은 IN (...)로, 공백은 한 칸으로 정리
+    """
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (버킷별 개수, 누적 아님)"""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {f"le_{bound}ms": self.counts[i] for i, bound in enumerate(LATENCY_BUCKETS_MS)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "total_ms": round(self.total_ms, 2),
+            "buckets": buckets,
+        }
+
+
+class EngineMetrics:
+    """엔진 하나의 풀 / 쿼리 통계"""
+
+    def __init__(self, name: str, engine: Engine, capacity: Optional[int]):
+        self.name = name
+        self.engine = engine
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self.checkout_wait = LatencyHistogram()
+        self.checkout_timeouts = 0
+        self.peak_checked_out = 0
+        self.queries = LatencyHistogram()
+        self.query_errors = 0
+        self.slow_queries = 0
+        self.statements: Dict[str, LatencyHistogram] = {}
+
+    def record_checkout(self, wait_ms: float, checked_out: int) -> None:
+        with self._lock:
+            self.checkout_wait.observe(wait_ms)
+            if checked_out > self.peak_checked_out:
+                self.peak_checked_out = checked_out
+
+    def record_checkout_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def record_query(self, statement: str, ms: float, failed: bool = False) -> None:
+        sql = normalize_sql(statement)
+        with self._lock:
+            self.queries.observe(ms)
+            if failed:
+                self.query_errors += 1
+            histogram = self.statements.get(sql)
+            if histogram is None:
+                if len(self.statements) >= DB_METRICS_MAX_STATEMENTS:
+                    sql = "<other>"
+                    histogram = self.statements.get(sql)
+                if histogram is None:
+                    histogram = self.statements[sql] = LatencyHistogram()
+            histogram.observe(ms)
+            slow = DB_SLOW_QUERY_MS > 0 and ms >= DB_SLOW_QUERY_MS
+            if slow:
+                self.slow_queries += 1
+        if slow:
+            print(f"[SLOW SQL] {self.name} {ms:.1f}ms {sql[:500]}")
+
+    def pool_snapshot(self) -> Dict[str, Any]:
+        pool = self.engine.pool
+        snapshot: Dict[str, Any] = {"class": type(pool).__name__}
+        for key in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, key, None)
+            if callable(method):
+                snapshot[key] = method()
+        checked_out = snapshot.get("checkedout")
+        if self.capacity and checked_out is not None:
+            snapshot["capacity"] = self.capacity
+            snapshot["saturation"] = round(checked_out / self.capacity, 3)
+        return snapshot
+
+    def snapshot(self, top: int) -> Dict[str, Any]:
+        with self._lock:
+            statements: List[Tuple[str, LatencyHistogram]] = sorted(
+                self.statements.items(), key=lambda item: item[1].total_ms, reverse=True
+            )[:top]
+            return {
+                "pool": self.pool_snapshot(),
+                "checkout": {
+                    **self.checkout_wait.snapshot(),
+                    "timeouts": self.checkout_timeouts,
+                    "peak_checked_out": self.peak_checked_out,
+                },
+                "queries": {
+                    **self.queries.snapshot(),
+                    "errors": self.query_errors,
+                    "slow": self.slow_queries,
+                    "slow_threshold_ms": DB_SLOW_QUERY_MS,
+                },
+                "statements": [{"sql": sql, **histogram.snapshot()} for sql, histogram in statements],
+            }
+
+
+class _TimedCheckoutMixin:
+    """
+    커넥션 체크아웃 대기 시간 측정
+    SQLAlchemy에는 체크아웃 시작 이벤트가 없으므로 Pool.connect()를 감쌈
+    """
+
+    metrics: Optional[EngineMetrics] = None
+
+    def connect(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super().connect()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            metrics.record_checkout_timeout()
+            raise
+        metrics.record_checkout((time.perf_counter() - started) * 1000, self.checkedout())
+        return connection
+
+    def recreate(self):
+        # engine.dispose() 후 새 풀에도 계측 유지
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """체크아웃 대기 시간을 기록하는 QueuePool (동기 엔진용)"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 기록하는 AsyncAdaptedQueuePool (비동기 엔진용)"""
+
+
+class DatabaseMetrics:
+    """프로세스 내 모든 엔진의 계측 모음"""
+
+    def __init__(self):
+        self.engines: Dict[str, EngineMetrics] = {}
+
+    def instrument(self, engine: Engine, name: str, capacity: Optional[int] = None) -> EngineMetrics:
+        """
+        엔진에 계측 이벤트 등록
+
+        Args:
+            engine: 동기 엔진 (비동기 엔진은 async_engine.sync_engine 전달)
+            name: /metrics에 표시할 엔진 이름
+            capacity: 최대 동시 커넥션 수 (pool_size + max_overflow, 포화도 계산용)
+        """
+        metrics = EngineMetrics(name, engine, capacity)
+        self.engines[name] = metrics
+        if isinstance(engine.pool, _TimedCheckoutMixin):
+            engine.pool.metrics = metrics
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info["query_started"].pop()
+            metrics.record_query(statement, (time.perf_counter() - started) * 1000)
+
+        @event.listens_for(engine, "handle_error")
+        def _handle_error(exception_context):
+            conn = exception_context.connection
+            stack = conn.info.get("query_started") if conn is not None else None
+            if stack and exception_context.statement:
+                started = stack.pop()
+                metrics.record_query(exception_context.statement, (time.perf_counter() - started) * 1000, failed=True)
+
+        return metrics
+
+    def snapshot(self, top: int = 20) -> Dict[str, Any]:
+        """
+        /metrics 응답용 스냅샷
+
+        Args:
+            top: 엔진별로 누적 실행 시간이 큰 SQL 상위 N개만 포함
+        """
+        return {"engines": {name: metrics.snapshot(top) for name, metrics in self.engines.items()}}
+
+
+# 프로세스 공용 계측
+db_metrics = DatabaseMetrics()
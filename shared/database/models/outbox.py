@@ -0,0 +1,42 @@
+"""
+OutboxEvent 모델 (공통)
+서비스 간 부수 효과를 로컬 트랜잭션과 함께 기록해 두고 나중에 전달 (shared/database/outbox.py)
+"""
+
+import uuid
+from sqlalchemy import Column, String, DateTime, Integer, Text, Index
+from sqlalchemy.sql import func
+from ..base import Base
+
+
+class OutboxEvent(Base):
+    """
+    다른 서비스로 보낼 요청 하나
+    status: "pending" (전달 대기/재시도 중) | "delivered" | "failed" (재시도 불가 또는 횟수 초과)
+    """
+    __tablename__ = "OutboxEvent"
+
+    id = Column("id", String, primary_key=True, default=lambda: str(uuid.uuid4()))  # 전달 시 Idempotency-Key
+    service = Column("service", String, nullable=False)  # 기록한 서비스 (그 서비스의 디스패처가 전달)
+    destination = Column("destination", String, nullable=False)  # 대상 서비스 클라이언트 이름
+    method = Column("method", String, nullable=False, default="POST")
+    path = Column("path", String, nullable=False)
+    params = Column("params", Text, nullable=True)  # JSON
+    body = Column("body", Text, nullable=True)  # JSON
+    claims = Column("claims", Text, nullable=True)  # 요청한 사용자 클레임 JSON (전달 시 X-Internal-Claims로 서명)
+    status = Column("status", String, nullable=False, default="pending")
+    attempts = Column("attempts", Integer, nullable=False, default=0)
+    next_attempt_at = Column("nextAttemptAt", DateTime, server_default=func.now(), nullable=False)
+    last_error = Column("lastError", Text, nullable=True)
+    created_at = Column("createdAt", DateTime, server_default=func.now(), nullable=False)
+    delivered_at = Column("deliveredAt", DateTime, nullable=True)
+
+    __table_args__ = (
+        # 디스패처가 전달할 이벤트 조회 (대기 중인 것만 담는 부분 인덱스)
+        Index("idx_outbox_event_pending", "service", "nextAttemptAt", postgresql_where=(status == "pending")),
+        # 오래된 전달 완료 이벤트 삭제
+        Index("idx_outbox_event_delivered_at", "deliveredAt"),
+    )
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, destination={self.destination}, path={self.path}, status={self.status})>"
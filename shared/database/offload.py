@@ -0,0 +1,152 @@
+"""
+동기 DB 작업 스레드풀 오프로드
+async 라우트에서 동기 SQLAlchemy 서비스 함수를 호출할 때 이벤트 루프를 막지 않도록
+제한된 크기의 전용 스레드풀에서 실행
+
+풀 크기는 커넥션 풀(pool_size + max_overflow)과 맞춰
+스레드가 커넥션을 기다리며 쌓이지 않도록 함
+
+사용 예:
+    from shared.database.offload import run_sync
+
+    @router.get("/api/users/me")
+    async def get_me(db: Session = Depends(get_db)):
+        user = await run_sync(get_user_by_id, db, user_id)
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from .session import DB_POOL_SIZE, DB_MAX_OVERFLOW
+
+T = TypeVar("T")
+
+# 오프로드 스레드 수 (기본: 커넥션 풀 최대 크기)
+DB_THREADPOOL_SIZE = int(os.getenv("DB_THREADPOOL_SIZE", str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+
+
+class OffloadStats:
+    """대기 시간(큐) / 실행 시간(쿼리) 누적 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.queued = 0
+        self.running = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.run_total = 0.0
+        self.run_max = 0.0
+
+    def submitted(self) -> None:
+        with self._lock:
+            self.queued += 1
+
+    def started(self, queue_wait: float) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            self.queue_wait_total += queue_wait
+            self.queue_wait_max = max(self.queue_wait_max, queue_wait)
+
+    def finished(self, run_time: float, failed: bool) -> None:
+        with self._lock:
+            self.running -= 1
+            self.calls += 1
+            if failed:
+                self.errors += 1
+            self.run_total += run_time
+            self.run_max = max(self.run_max, run_time)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = self.calls
+            return {
+                "calls": calls,
+                "errors": self.errors,
+                "queued": self.queued,
+                "running": self.running,
+                "queue_wait_avg_ms": round(self.queue_wait_total / calls * 1000, 2) if calls else 0.0,
+                "queue_wait_max_ms": round(self.queue_wait_max * 1000, 2),
+                "run_avg_ms": round(self.run_total / calls * 1000, 2) if calls else 0.0,
+                "run_max_ms": round(self.run_max * 1000, 2),
+            }
+
+
+class OffloadPool:
+    """동기 함수 전용 제한 스레드풀"""
+
+    def __init__(self, max_workers: int = DB_THREADPOOL_SIZE, name: str = "db-offload"):
+        self.max_workers = max_workers
+        self.name = name
+        self._stats = OffloadStats()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # 첫 사용 시 생성 (import만 하는 프로세스에서는 스레드를 만들지 않음)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        동기 함수를 스레드풀에서 실행하고 결과 반환
+
+        contextvars는 호출한 코루틴의 값을 그대로 복사해 전달
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        stats = self._stats
+        submitted_at = time.perf_counter()
+
+        def _timed():
+            started_at = time.perf_counter()
+            stats.started(started_at - submitted_at)
+            failed = True
+            try:
+                result = call()
+                failed = False
+                return result
+            finally:
+                stats.finished(time.perf_counter() - started_at, failed)
+
+        stats.submitted()
+        return await loop.run_in_executor(self.executor, _timed)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"max_workers": self.max_workers, **self._stats.snapshot()}
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# 프로세스 공용 풀
+offload_pool = OffloadPool()
+
+
+async def run_sync(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """공용 풀에서 동기 함수 실행"""
+    return await offload_pool.run(func, *args, **kwargs)
+
+
+def offloaded(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    동기 함수를 공용 풀에서 실행하는 async 함수로 감싸는 데코레이터
+
+    원래 동기 함수는 __wrapped__로 접근 가능
+    """
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await offload_pool.run(func, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,321 @@
+"""
+트랜잭션 아웃박스 (서비스 간 부수 효과를 비동기로 전달)
+
+요청을 처리하는 트랜잭션 안에서 다른 서비스로 보낼 요청을 OutboxEvent 행으로 함께 기록하고
+커밋 후 바로 응답, 백그라운드 디스패처가 이벤트를 묶음으로 꺼내 전달
+
+- 로컬 변경이 커밋되면 이벤트도 반드시 남고, 롤백되면 이벤트도 없음 (호출 누락/유령 호출 없음)
+- 전달은 ServiceClient로 idempotent=True + Idempotency-Key(이벤트 ID)
+  → 같은 이벤트를 여러 번 보낼 수 있으므로 대상 엔드포인트가 중복을 막아야 함
+  (에너지 반환: Idempotency-Key, 스케줄 생성: 공고/스페어 유니크 인덱스)
+- 사용자 권한이 필요한 호출은 기록 시점의 사용자 클레임(sub, role)을 저장했다가
+  보낼 때마다 짧은 만료의 X-Internal-Claims로 서명 (사용자 JWT가 만료된 뒤의 재시도도 가능)
+- 실패(연결 실패/타임아웃/5xx/408·409·425·429)는 지수 백오프로 OUTBOX_MAX_ATTEMPTS번까지 재시도,
+  그 밖의 4xx나 횟수 초과는 failed로 남김 (lastError 확인 후 status를 pending으로 되돌리면 다시 전달)
+- 여러 워커가 함께 돌아도 이벤트를 꺼낼 때 OUTBOX_LEASE_SECONDS 동안 선점하므로 한 번에 한 워커만 전달
+  (PostgreSQL은 FOR UPDATE SKIP LOCKED로 서로 기다리지 않음)
+
+사용 예:
+    outbox = OutboxDispatcher("job", {"schedule": schedule_client})
+
+    outbox.enqueue(db, "schedule", "/api/schedules", body={...}, claims=actor_claims(current_user))
+    await db.commit()
+    outbox.notify()  # 폴링 주기를 기다리지 않고 바로 전달
+
+    # 앱 lifespan
+    task = asyncio.create_task(outbox.run(AsyncSessionLocal))
+"""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import delete, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..auth.internal import INTERNAL_CLAIMS_HEADER, sign_internal_claims
+from ..clients.service_client import IDEMPOTENCY_HEADER, ServiceClient
+from .metrics import LatencyHistogram
+from .models.outbox import OutboxEvent
+
+# 한 번에 꺼내 동시에 전달할 이벤트 수
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+# 새 이벤트 확인 주기(초) - 같은 워커에서 기록한 이벤트는 notify()로 바로 전달
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", "1.0"))
+# 꺼낸 이벤트 선점 시간(초) - 이 안에 결과를 기록하지 못하면(프로세스 중단 등) 다시 전달
+OUTBOX_LEASE_SECONDS = int(os.getenv("OUTBOX_LEASE_SECONDS", "60"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "10"))
+# 재시도 대기: min(MAX, BASE * 2^(시도 횟수 - 1)) x 0.5~1 (지터)
+OUTBOX_BACKOFF_BASE = float(os.getenv("OUTBOX_BACKOFF_BASE", "1.0"))
+OUTBOX_BACKOFF_MAX = float(os.getenv("OUTBOX_BACKOFF_MAX", "300.0"))
+# 전달 완료 이벤트 보관 시간(초)과 삭제 주기(초)
+OUTBOX_RETENTION_SECONDS = int(os.getenv("OUTBOX_RETENTION_SECONDS", "604800"))
+OUTBOX_PURGE_SECONDS = float(os.getenv("OUTBOX_PURGE_SECONDS", "3600"))
+
+# 일시적인 거절로 보고 재시도할 4xx (요청 시간 초과, 같은 키 처리 중, 너무 이름, 요청 과다)
+RETRY_STATUS_CODES = frozenset((408, 409, 425, 429))
+# lastError에 남길 응답 본문 길이
+_ERROR_BODY_LENGTH = 500
+
+
+def actor_claims(current_user: Dict[str, Any]) -> Dict[str, Any]:
+    """요청한 사용자 클레임 중 전달 시 필요한 것만 (get_current_user_dependency 결과에서)"""
+    return {
+        "sub": current_user.get("user_id") or current_user.get("sub"),
+        "role": current_user.get("role"),
+    }
+
+
+def _dumps(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _loads(value: Optional[str]) -> Any:
+    return None if value is None else json.loads(value)
+
+
+class OutboxStats:
+    """디스패처 전달 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.enqueued = 0
+        self.delivered = 0
+        self.retried = 0
+        self.failed = 0
+        self.last_error: Optional[str] = None
+        # 기록 → 전달 완료까지 걸린 시간
+        self.lag = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enqueued": self.enqueued,
+                "delivered": self.delivered,
+                "retried": self.retried,
+                "failed": self.failed,
+                "lastError": self.last_error,
+                "lag": self.lag.snapshot(),
+            }
+
+
+class OutboxDispatcher:
+    """서비스 하나의 아웃박스 이벤트 기록/전달"""
+
+    def __init__(
+        self,
+        service: str,
+        clients: Dict[str, ServiceClient],
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_seconds: float = OUTBOX_POLL_SECONDS,
+        lease_seconds: int = OUTBOX_LEASE_SECONDS,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+    ):
+        self.service = service
+        self.clients = clients
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.stats = OutboxStats()
+        self._wakeup = asyncio.Event()
+
+    def enqueue(
+        self,
+        db: AsyncSession,
+        destination: str,
+        path: str,
+        *,
+        body: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        claims: Optional[Dict[str, Any]] = None,
+        method: str = "POST",
+    ) -> OutboxEvent:
+        """
+        이벤트를 세션에 추가 (커밋은 호출한 쪽의 트랜잭션과 함께)
+
+        Args:
+            destination: 대상 서비스 (clients의 키)
+            claims: 대상 서비스가 인증할 사용자 클레임 (actor_claims), 없으면 인증 없이 호출
+        """
+        if destination not in self.clients:
+            raise ValueError(f"알 수 없는 대상 서비스: {destination}")
+        now = datetime.now()
+        event = OutboxEvent(
+            id=str(uuid.uuid4()),
+            service=self.service,
+            destination=destination,
+            method=method.upper(),
+            path=path,
+            params=_dumps(params),
+            body=_dumps(body),
+            claims=_dumps(claims),
+            status="pending",
+            attempts=0,
+            next_attempt_at=now,
+            created_at=now,
+        )
+        db.add(event)
+        with self.stats._lock:
+            self.stats.enqueued += 1
+        return event
+
+    def notify(self) -> None:
+        """새 이벤트가 커밋됨 (디스패처를 바로 깨움)"""
+        self._wakeup.set()
+
+    async def _claim(self, db: AsyncSession) -> list:
+        """전달할 이벤트를 batch_size개까지 선점 (다음 시도 시각을 lease 뒤로 미루고 시도 횟수 증가)"""
+        now = datetime.now()
+        candidates = select(OutboxEvent.id).where(
+            OutboxEvent.service == self.service,
+            # 부분 인덱스(idx_outbox_event_pending) 조건과 맞도록 값을 SQL에 직접 넣음
+            OutboxEvent.status == literal("pending", literal_execute=True),
+            OutboxEvent.next_attempt_at <= now,
+        ).order_by(OutboxEvent.next_attempt_at).limit(self.batch_size)
+        if db.get_bind().dialect.name == "postgresql":
+            candidates = candidates.with_for_update(skip_locked=True)
+        result = await db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(candidates))
+            .values(
+                next_attempt_at=now + timedelta(seconds=self.lease_seconds),
+                attempts=OutboxEvent.attempts + 1,
+            )
+            .returning(
+                OutboxEvent.id,
+                OutboxEvent.destination,
+                OutboxEvent.method,
+                OutboxEvent.path,
+                OutboxEvent.params,
+                OutboxEvent.body,
+                OutboxEvent.claims,
+                OutboxEvent.attempts,
+                OutboxEvent.created_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        events = list(result.all())
+        await db.commit()
+        return events
+
+    async def _deliver(self, event) -> Tuple[str, Optional[str]]:
+        """이벤트 하나 전달 → ("delivered" | "retry" | "failed", 오류)"""
+        client = self.clients.get(event.destination)
+        if client is None:
+            return "failed", f"알 수 없는 대상 서비스: {event.destination}"
+        headers = {IDEMPOTENCY_HEADER: event.id}
+        claims = _loads(event.claims)
+        if claims:
+            headers[INTERNAL_CLAIMS_HEADER] = sign_internal_claims(
+                {**claims, "exp": int(time.time()) + self.lease_seconds}
+            )
+        try:
+            response = await client.request(
+                event.method,
+                event.path,
+                params=_loads(event.params),
+                json=_loads(event.body),
+                headers=headers,
+                idempotent=True,
+            )
+        except Exception as e:
+            return "retry", f"{type(e).__name__}: {e}"
+        if response.status_code < 300:
+            return "delivered", None
+        error = f"{response.status_code} {response.text[:_ERROR_BODY_LENGTH]}"
+        if response.status_code >= 500 or response.status_code in RETRY_STATUS_CODES:
+            return "retry", error
+        return "failed", error
+
+    def _backoff(self, attempts: int) -> float:
+        return min(OUTBOX_BACKOFF_MAX, OUTBOX_BACKOFF_BASE * (2 ** max(attempts - 1, 0))) * random.uniform(0.5, 1.0)
+
+    async def dispatch_once(self, session_factory) -> int:
+        """이벤트 한 묶음을 동시에 전달하고 결과 기록 (꺼낸 이벤트 수 반환)"""
+        async with session_factory() as db:
+            events = await self._claim(db)
+            if not events:
+                return 0
+            outcomes = await asyncio.gather(*(self._deliver(event) for event in events))
+
+            now = datetime.now()
+            delivered = [event for event, (outcome, _) in zip(events, outcomes) if outcome == "delivered"]
+            if delivered:
+                await db.execute(
+                    update(OutboxEvent)
+                    .where(OutboxEvent.id.in_([event.id for event in delivered]))
+                    .values(status="delivered", delivered_at=now, last_error=None)
+                    .execution_options(synchronize_session=False)
+                )
+            retried = failed = 0
+            for event, (outcome, error) in zip(events, outcomes):
+                if outcome == "delivered":
+                    continue
+                if outcome == "retry" and event.attempts < self.max_attempts:
+                    values = {"next_attempt_at": now + timedelta(seconds=self._backoff(event.attempts)), "last_error": error}
+                    retried += 1
+                else:
+                    values = {"status": "failed", "last_error": error}
+                    failed += 1
+                    print(f"[Outbox] 전달 실패 ({event.attempts}회) {event.method} {event.destination}{event.path}: {error}")
+                await db.execute(
+                    update(OutboxEvent)
+                    .where(OutboxEvent.id == event.id)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+
+        with self.stats._lock:
+            self.stats.delivered += len(delivered)
+            self.stats.retried += retried
+            self.stats.failed += failed
+            for event in delivered:
+                self.stats.lag.observe((now - event.created_at).total_seconds() * 1000)
+            errors = [error for outcome, error in outcomes if outcome != "delivered"]
+            if errors:
+                self.stats.last_error = errors[-1]
+        return len(events)
+
+    async def purge_delivered(self, session_factory, retention_seconds: int = OUTBOX_RETENTION_SECONDS) -> int:
+        """보관 시간이 지난 전달 완료 이벤트 삭제"""
+        async with session_factory() as db:
+            result = await db.execute(
+                delete(OutboxEvent).where(
+                    OutboxEvent.service == self.service,
+                    OutboxEvent.status == "delivered",
+                    OutboxEvent.delivered_at <= datetime.now() - timedelta(seconds=retention_seconds),
+                )
+            )
+            await db.commit()
+            return result.rowcount or 0
+
+    async def run(self, session_factory) -> None:
+        """이벤트 전달 루프 (앱 lifespan 동안 백그라운드 태스크로 실행)"""
+        next_purge = time.monotonic() + OUTBOX_PURGE_SECONDS
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await self.dispatch_once(session_factory)
+                if time.monotonic() >= next_purge:
+                    next_purge = time.monotonic() + OUTBOX_PURGE_SECONDS
+                    purged = await self.purge_delivered(session_factory)
+                    if purged:
+                        print(f"[Outbox] 전달 완료 이벤트 {purged}건 삭제")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                claimed = 0
+                print(f"[Outbox] 이벤트 전달 오류: {e}")
+            if claimed >= self.batch_size:
+                # 밀린 이벤트가 더 있음
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
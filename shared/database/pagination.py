@@ -0,0 +1,46 @@
+"""
+커서(keyset) 페이지네이션
+(createdAt, id) 내림차순으로 정렬하고 마지막으로 본 항목 다음부터 조회
+OFFSET과 달리 깊은 페이지에서도 인덱스 범위 스캔 한 번으로 끝나고,
+스크롤 중 새 항목이 추가되어도 항목이 밀리거나 중복되지 않음
+
+사용 예:
+    page = PaginationParams(limit=limit, cursor=cursor)
+    query = keyset_query(select(Job), Job.created_at, Job.id, page.after(), page.limit)
+    rows = (await db.execute(query)).scalars().all()
+    items, next_cursor = split_page(rows, page.limit)
+"""
+
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import Select, tuple_
+from ..schemas.base import encode_cursor
+
+
+def keyset_query(
+    query: Select,
+    created_column,
+    id_column,
+    after: Optional[Tuple[datetime, str]],
+    limit: int,
+) -> Select:
+    """
+    커서 조건/정렬 적용
+    다음 페이지 존재 여부 확인을 위해 limit + 1개 조회
+    ((createdAt, id) 복합 인덱스가 있어야 범위 스캔으로 처리됨)
+    """
+    if after is not None:
+        query = query.where(tuple_(created_column, id_column) < tuple_(*after))
+    return query.order_by(created_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def split_page(rows: Sequence, limit: int, created_attr: str = "created_at") -> Tuple[List, Optional[str]]:
+    """
+    limit + 1개 조회 결과를 (이번 페이지 항목, 다음 페이지 커서)로 분리
+    (created_at, id 속성을 가진 모델 기준, 시각 속성 이름이 다르면 created_attr로 지정)
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(getattr(last, created_attr), last.id)
@@ -0,0 +1,171 @@
+"""
+읽기 레플리카 라우팅
+DATABASE_REPLICA_URLS(쉼표 구분)가 설정되면 읽기 전용 세션의 조회를 레플리카로 라운드로빈 분산
+
+- 세션 안에서 쓰기(flush, INSERT/UPDATE/DELETE)가 한 번이라도 일어나면
+  그 세션의 이후 쿼리는 모두 프라이머리로 고정
+- 쓰기 요청(POST/PUT/PATCH/DELETE)을 보낸 사용자는 REPLICA_PIN_SECONDS 동안
+  읽기 세션도 프라이머리를 사용 (복제 지연 중 자신이 쓴 데이터가 안 보이는 문제 방지)
+  ※ 프로세스 단위 기록이므로 워커가 여러 개면 같은 워커로 온 요청에만 적용
+
+레플리카가 없으면 읽기 세션도 기존 세션과 동일하게 프라이머리만 사용
+"""
+
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Generator, List, Optional
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from .metrics import db_metrics, InstrumentedQueuePool
+from .session import (
+    SessionLocal,
+    engine,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+)
+
+
+def split_urls(value: str) -> List[str]:
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+# 레플리카 URL 목록 (비어 있으면 레플리카 라우팅 비활성)
+DATABASE_REPLICA_URLS = split_urls(os.getenv("DATABASE_REPLICA_URLS", ""))
+
+# 쓰기 요청 후 해당 사용자의 읽기를 프라이머리로 고정할 시간 (초)
+REPLICA_PIN_SECONDS = float(os.getenv("REPLICA_PIN_SECONDS", "5"))
+
+# 쓰기 요청 사용자 기록 최대 개수
+REPLICA_PIN_MAX_ENTRIES = int(os.getenv("REPLICA_PIN_MAX_ENTRIES", "10000"))
+
+# 쓰기로 간주하는 HTTP 메서드
+WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+
+class ReplicaSet:
+    """레플리카 엔진 라운드로빈 선택"""
+
+    def __init__(self, engines: List[Engine]):
+        self.engines = engines
+        self._cycle = itertools.cycle(engines) if engines else None
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def next(self) -> Optional[Engine]:
+        if self._cycle is None:
+            return None
+        with self._lock:
+            return next(self._cycle)
+
+
+class ReplicaRoutingSession(Session):
+    """
+    조회는 레플리카, 쓰기와 쓰기 이후의 모든 쿼리는 프라이머리로 보내는 세션
+    (AsyncSession의 sync_session_class로도 사용)
+
+    한 세션은 처음 고른 레플리카를 끝까지 사용 (요청 안에서 같은 시점의 데이터)
+    """
+
+    def __init__(self, *args, primary: Engine, replicas: ReplicaSet, pinned: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.primary = primary
+        self.replicas = replicas
+        self.pinned = pinned
+        self._replica: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.pinned or self._flushing or (clause is not None and clause.is_dml):
+            self.pinned = True
+            return self.primary
+        if self._replica is None:
+            self._replica = self.replicas.next() or self.primary
+        return self._replica
+
+
+class RecentWriters:
+    """최근 쓰기 요청을 보낸 사용자 기록 (read-your-writes 고정용)"""
+
+    def __init__(self, pin_seconds: float = REPLICA_PIN_SECONDS, max_entries: int = REPLICA_PIN_MAX_ENTRIES):
+        self.pin_seconds = pin_seconds
+        self.max_entries = max_entries
+        self._until: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def pin(self, key: Optional[str]) -> None:
+        if not key or self.pin_seconds <= 0:
+            return
+        with self._lock:
+            self._until[key] = time.monotonic() + self.pin_seconds
+            self._until.move_to_end(key)
+            if len(self._until) > self.max_entries:
+                self._until.popitem(last=False)
+
+    def is_pinned(self, key: Optional[str]) -> bool:
+        if not key:
+            return False
+        with self._lock:
+            until = self._until.get(key)
+            if until is None:
+                return False
+            if time.monotonic() < until:
+                return True
+            del self._until[key]
+            return False
+
+
+def writer_key(request) -> Optional[str]:
+    """요청 사용자 식별 키 (게이트웨이가 그대로 전달하는 Authorization 헤더)"""
+    return request.headers.get("Authorization")
+
+
+# 프로세스 공용 기록
+recent_writers = RecentWriters()
+
+
+def _create_replica_engine(url: str, index: int) -> Engine:
+    replica = create_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        poolclass=InstrumentedQueuePool,
+    )
+    db_metrics.instrument(replica, f"sync-replica-{index}", capacity=DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    return replica
+
+
+# 동기 레플리카 엔진 / 읽기 세션 팩토리
+replicas = ReplicaSet([_create_replica_engine(url, i) for i, url in enumerate(DATABASE_REPLICA_URLS)])
+
+if replicas:
+    ReadSessionLocal = sessionmaker(
+        class_=ReplicaRoutingSession,
+        autocommit=False,
+        autoflush=False,
+        primary=engine,
+        replicas=replicas,
+    )
+else:
+    ReadSessionLocal = SessionLocal
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    읽기 전용 데이터베이스 세션 의존성 (동기)
+    목록/통계 조회처럼 약간의 복제 지연을 허용하는 엔드포인트에서 사용
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
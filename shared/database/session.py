@@ -6,6 +6,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 import os
+from .metrics import db_metrics, InstrumentedQueuePool
 
 # 데이터베이스 URL (환경변수에서 가져오거나 기본값 사용)
 # 환경 변수가 없으면 현재 사용자명으로 시도 (macOS의 경우)
@@ -16,13 +17,23 @@ DATABASE_URL = os.getenv(
     f"postgresql://{default_user}@localhost:5432/hairspare"
 )
 
+# 커넥션 풀 설정 (동기/비동기 엔진 공통)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
 # SQLAlchemy 엔진 생성
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,  # 연결 유효성 검사
-    pool_size=10,
-    max_overflow=20,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    poolclass=InstrumentedQueuePool,  # 체크아웃 대기 시간 측정
 )
+db_metrics.instrument(engine, "sync", capacity=DB_POOL_SIZE + DB_MAX_OVERFLOW)
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -3,8 +3,34 @@
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
+import base64
+import json
+from ..exceptions.app_exceptions import ValidationException
+
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """
+    (createdAt, id) 위치를 불투명 커서 문자열로 인코딩
+    """
+    raw = json.dumps([created_at.isoformat(), id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    커서 문자열을 (createdAt, id)로 디코딩
+    
+    Raises:
+        ValidationException: 형식이 올바르지 않은 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(id)
+    except (ValueError, TypeError):
+        raise ValidationException("커서 형식이 올바르지 않습니다", "INVALID_CURSOR")
 
 
 class BaseSchema(BaseModel):
@@ -39,13 +65,25 @@ class ErrorResponse(BaseSchema):
 class PaginationParams(BaseSchema):
     """
     페이지네이션 파라미터
+    
+    cursor가 주어지면 (createdAt, id) 기준 커서 페이지네이션 모드
+    (빈 문자열이면 첫 페이지, 이후에는 응답의 next_cursor 전달)
     """
     page: int = Field(default=1, ge=1, description="페이지 번호")
     limit: int = Field(default=20, ge=1, le=100, description="페이지당 항목 수")
+    cursor: Optional[str] = Field(default=None, description="커서 (빈 문자열이면 첫 페이지)")
     
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.limit
+    
+    @property
+    def is_cursor(self) -> bool:
+        return self.cursor is not None
+    
+    def after(self) -> Optional[Tuple[datetime, str]]:
+        """커서가 가리키는 마지막 항목 위치 (첫 페이지면 None)"""
+        return decode_cursor(self.cursor) if self.cursor else None
 
 
 class PaginatedResponse(BaseSchema):
@@ -53,10 +91,11 @@ class PaginatedResponse(BaseSchema):
     페이지네이션 응답 스키마
     """
     items: list = Field(..., description="항목 목록")
-    total: int = Field(..., description="전체 항목 수")
-    page: int = Field(..., description="현재 페이지")
+    total: Optional[int] = Field(default=None, description="전체 항목 수 (커서 모드에서는 없음)")
+    page: Optional[int] = Field(default=None, description="현재 페이지 (커서 모드에서는 없음)")
     limit: int = Field(..., description="페이지당 항목 수")
-    pages: int = Field(..., description="전체 페이지 수")
+    pages: Optional[int] = Field(default=None, description="전체 페이지 수 (커서 모드에서는 없음)")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (마지막 페이지면 None)")
     
     @classmethod
     def create(cls, items: list, total: int, page: int, limit: int):
@@ -68,3 +107,7 @@ class PaginatedResponse(BaseSchema):
             limit=limit,
             pages=pages
         )
+    
+    @classmethod
+    def create_cursor(cls, items: list, limit: int, next_cursor: Optional[str]):
+        return cls(items=items, limit=limit, next_cursor=next_cursor)